@@ -132,11 +132,11 @@ def main():
     print("4. STATE SNAPSHOTS (Last 5)")
     print("="*120)
     snapshots = cursor.execute(
-        "SELECT id, created_at FROM state_snapshots ORDER BY id DESC LIMIT 5"
+        "SELECT seq AS id, created_at FROM state_snapshots_ring ORDER BY seq DESC LIMIT 5"
     ).fetchall()
     
     if snapshots:
-        print(f"Total snapshots: {cursor.execute('SELECT COUNT(*) FROM state_snapshots').fetchone()[0]}")
+        print(f"Total snapshots: {cursor.execute('SELECT COUNT(*) FROM state_snapshots_ring').fetchone()[0]}")
         for snap in snapshots:
             print(f"  Snapshot #{snap['id']}: {snap['created_at']}")
     else:
@@ -20,12 +20,18 @@ ARCHITECTURE:
 6. Trade History: Track all trades with entry/exit details
 """
 
+import hashlib
+import json
 import pandas as pd
 import logging
+import operator
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple, Callable
-from dataclasses import dataclass, asdict, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Iterable, List, Tuple, Callable
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
 # Import unified decision engine
@@ -51,9 +57,9 @@ class TradeDirection(Enum):
     SHORT = "SHORT"
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
-    """Complete record of a single trade in backtest."""
+    """Complete record of a single trade in backtest (slotted: no per-instance dict)."""
     trade_id: int
     direction: TradeDirection
     entry_time: datetime
@@ -76,7 +82,9 @@ class BacktestTrade:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for export."""
-        data = asdict(self)
+        # Shallow copy per field; asdict() would deep-copy every value
+        data = {name: getattr(self, name) for name in _BACKTEST_TRADE_FIELDS}
+        data['tp_prices'] = list(self.tp_prices)
         data['direction'] = self.direction.value
         data['exit_reason'] = self.exit_reason.value if self.exit_reason else None
         data['entry_time'] = self.entry_time.isoformat() if self.entry_time else None
@@ -84,6 +92,28 @@ class BacktestTrade:
         return data
 
 
+_BACKTEST_TRADE_FIELDS = tuple(f.name for f in fields(BacktestTrade))
+# Extracts all fields of a BacktestTrade as a tuple in one C-level call
+_backtest_trade_row = operator.attrgetter(*_BACKTEST_TRADE_FIELDS)
+
+# Result cache key inputs: parameter value types, and the engine sources
+# whose contents are fingerprinted so edited simulation code misses the cache
+_PARAM_SCALARS = (bool, int, float, str)
+_ENGINES_DIR = Path(__file__).resolve().parent
+_PACKAGE_ROOT = __name__.partition('.')[0]
+
+
+def _is_package_object(value) -> bool:
+    """True for instances of classes defined in this package (sub-engines)."""
+    return type(value).__module__.partition('.')[0] == _PACKAGE_ROOT
+
+
+@lru_cache(maxsize=None)
+def _source_digest(path: str) -> str:
+    """sha256 of a source file, read once per process (code is not reloaded)."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
 class BacktestEngine:
     """
     Bar-by-bar backtest simulator matching live trading logic.
@@ -128,6 +158,7 @@ class BacktestEngine:
         self.commission_percent = commission_percent
         self.spread_points = spread_points
         self.slippage_points = slippage_points
+        self.config = config if config else {}
         
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"BacktestEngine initialized: {symbol} {timeframe}")
@@ -162,6 +193,8 @@ class BacktestEngine:
         self.equity_curve: List[Tuple[datetime, float]] = []
         self.bar_tooltips: Dict[int, str] = {}  # Debugging info per bar
         self.bar_decisions: List[Dict] = []  # Per-bar decision reasons
+        # (trades list, trade count, DataFrame) from the last get_trades_dataframe()
+        self._trades_df_cache: Optional[Tuple[List[BacktestTrade], int, pd.DataFrame]] = None
         
         # Metrics accumulators
         self.metrics: Dict = {}
@@ -831,11 +864,138 @@ class BacktestEngine:
         return max_dd * 100  # Return as percentage
     
     def get_trades_dataframe(self) -> pd.DataFrame:
-        """Get trades as DataFrame for export/display."""
+        """
+        Get trades as DataFrame for export/display.
+
+        Closed trades are never modified, so the frame is cached until a
+        trade is added or the list is replaced; treat it as read-only.
+        """
         if not self.trades:
             return pd.DataFrame()
         
-        return pd.DataFrame([t.to_dict() for t in self.trades])
+        cached = self._trades_df_cache
+        if cached is not None and cached[0] is self.trades and cached[1] == len(self.trades):
+            return cached[2]
+        
+        # Same columns as BacktestTrade.to_dict(), built from one field tuple
+        # per trade instead of a dict per trade
+        rows = [_backtest_trade_row(t) for t in self.trades]
+        raw = dict(zip(_BACKTEST_TRADE_FIELDS, zip(*rows)))
+        # Converted columns are built from the raw attribute values:
+        # from_records has already turned a None datetime into NaT
+        # (exported as 'NaT') and a None enum into NaN
+        converted = {
+            'direction': [d.value for d in raw['direction']],
+            'exit_reason': [r.value if r else None for r in raw['exit_reason']],
+            'entry_time': [t.isoformat() if t else None for t in raw['entry_time']],
+            'exit_time': [t.isoformat() if t else None for t in raw['exit_time']],
+            'tp_prices': [list(tps) for tps in raw['tp_prices']],
+        }
+        df = pd.DataFrame.from_records(
+            rows, columns=_BACKTEST_TRADE_FIELDS, exclude=list(converted)
+        )
+        for column, values in converted.items():
+            df[column] = values
+        df = df[list(_BACKTEST_TRADE_FIELDS)]
+        self._trades_df_cache = (self.trades, len(self.trades), df)
+        return df
+    
+    # Engine attributes that make up a finished run, for the result cache
+    _RESULT_STATE_ATTRS = (
+        'trades', 'trade_counter', 'current_equity', 'equity_curve', 'bar_tooltips',
+        'bar_decisions', 'metrics', 'df_with_indicators_full',
+    )
+    
+    # Bump when the result state layout changes, so results cached by
+    # older code are not reused; simulation code is covered by the source
+    # fingerprint in result_cache_key()
+    _RESULT_CACHE_VERSION = 3
+    
+    @classmethod
+    def _engine_params(cls, engine, _seen: Optional[set] = None) -> Dict:
+        """
+        Public parameters of an engine, recursing into its sub-engines.
+
+        Scalars, None and lists/tuples of scalars are kept as-is; public
+        attributes holding objects defined in this package (e.g. a strategy's
+        multi_level_tp or bar_close_guard) are included recursively.
+        """
+        seen = _seen if _seen is not None else set()
+        seen.add(id(engine))
+        params = {}
+        for name, value in getattr(engine, '__dict__', {}).items():
+            if name.startswith('_'):
+                continue
+            if value is None or isinstance(value, _PARAM_SCALARS):
+                params[name] = value
+            elif isinstance(value, (list, tuple)) and all(isinstance(v, _PARAM_SCALARS) for v in value):
+                params[name] = list(value)
+            elif _is_package_object(value) and id(value) not in seen:
+                params[name] = {
+                    'type': type(value).__name__,
+                    'params': cls._engine_params(value, seen),
+                }
+        return params
+    
+    @staticmethod
+    def _source_fingerprint(engines: Iterable) -> Dict[str, str]:
+        """sha256 of this package's engine sources and of each engine's module."""
+        paths = set(_ENGINES_DIR.glob('*.py'))
+        for engine in engines:
+            module = sys.modules.get(type(engine).__module__)
+            path = getattr(module, '__file__', None)
+            if path:
+                paths.add(Path(path).resolve())
+        return {f"{path.parent.name}/{path.name}": _source_digest(str(path)) for path in sorted(paths)}
+    
+    def result_cache_key(self, engines: Iterable = ()) -> Optional[str]:
+        """
+        Key identifying a run by its settings, engine parameters, code and loaded bars.
+
+        Args:
+            engines: Strategy/risk/indicator/pattern engines the run uses;
+                their public parameters (including nested sub-engines) and
+                source files are part of the key
+
+        Returns:
+            sha256 hex digest, or None if no data is loaded
+        """
+        if self.df is None:
+            return None
+        engines = [engine for engine in engines if engine is not None]
+        config = self.config
+        if hasattr(config, 'to_dict'):
+            config = config.to_dict()
+        settings = {
+            'version': self._RESULT_CACHE_VERSION,
+            'symbol': self.symbol,
+            'timeframe': self.timeframe,
+            'rolling_days': self.rolling_days,
+            'warmup_bars': self.warmup_bars,
+            'commission_percent': self.commission_percent,
+            'spread_points': self.spread_points,
+            'slippage_points': self.slippage_points,
+            'starting_equity': self.starting_equity,
+            'config': config,
+            'engines': {
+                type(engine).__name__: self._engine_params(engine)
+                for engine in engines
+            },
+            'code': self._source_fingerprint(engines),
+        }
+        digest = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode())
+        digest.update(pd.util.hash_pandas_object(self.df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+    
+    def get_result_state(self) -> Dict:
+        """Get the results of the last run as a picklable dict."""
+        return {name: getattr(self, name, None) for name in self._RESULT_STATE_ATTRS}
+    
+    def restore_result_state(self, state: Dict) -> None:
+        """Restore results saved by get_result_state() instead of re-running."""
+        for name in self._RESULT_STATE_ATTRS:
+            setattr(self, name, state.get(name))
+        self.open_positions = []
     
     def get_summary(self) -> Dict:
         """Get backtest summary dict."""
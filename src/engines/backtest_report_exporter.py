@@ -15,6 +15,9 @@ from typing import Dict, Optional
 import logging
 import webbrowser
 
+# Rows per chunk when streaming trades to disk
+EXPORT_CHUNK_ROWS = 10_000
+
 
 class BacktestReportExporter:
     """
@@ -75,7 +78,7 @@ class BacktestReportExporter:
             filename = self.generate_filename()
             filepath = self.reports_dir / f"{filename}.json"
             
-            # Prepare data for JSON
+            # Prepare data for JSON (trades are streamed separately)
             data = {
                 'backtest_info': {
                     'symbol': self.symbol,
@@ -86,11 +89,21 @@ class BacktestReportExporter:
                 'metrics': metrics,
                 'summary': summary,
                 'settings': settings,
-                'trades': trades_df.to_dict('records') if not trades_df.empty else []
             }
+            header = json.dumps(data, indent=2, default=str)
             
             with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+                # Reopen the object to append "trades", then write one record
+                # per line, converting EXPORT_CHUNK_ROWS rows at a time
+                f.write(header[:-2])
+                f.write(',\n  "trades": [')
+                first = True
+                for start in range(0, len(trades_df), EXPORT_CHUNK_ROWS):
+                    for record in trades_df.iloc[start:start + EXPORT_CHUNK_ROWS].to_dict('records'):
+                        f.write('\n    ' if first else ',\n    ')
+                        f.write(json.dumps(record, default=str))
+                        first = False
+                f.write(']\n}' if first else '\n  ]\n}')
             
             self.logger.info(f"JSON export: {filepath}")
             return filepath
@@ -115,7 +128,7 @@ class BacktestReportExporter:
             filepath = self.reports_dir / f"{filename}_trades.csv"
             
             if not trades_df.empty:
-                trades_df.to_csv(filepath, index=False)
+                trades_df.to_csv(filepath, index=False, chunksize=EXPORT_CHUNK_ROWS)
                 self.logger.info(f"CSV export: {filepath}")
             else:
                 self.logger.warning("No trades to export")
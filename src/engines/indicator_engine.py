@@ -28,8 +28,16 @@ class IndicatorEngine:
     All calculations use completed bars only (bar-close logic).
     """
     
-    def __init__(self):
+    def __init__(self, atr_multiplier_stop: Optional[float] = None):
+        """
+        Initialize the Indicator Engine.
+
+        Args:
+            atr_multiplier_stop: If set, calculate_all_indicators also adds a
+                precomputed ATR-based long stop column (stop_default_long)
+        """
         self.logger = logging.getLogger(__name__)
+        self.atr_multiplier_stop = atr_multiplier_stop
     
     def calculate_ema(self, series: pd.Series, period: int) -> pd.Series:
         """
@@ -127,7 +135,7 @@ class IndicatorEngine:
             self.logger.error(f"Unexpected error calculating ATR({period}): {e}", exc_info=True)
             raise IndicatorCalculationError(f"Unexpected ATR calculation error: {e}")
     
-    def calculate_all_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate_all_indicators(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Calculate all required indicators and add them to the DataFrame.
         
@@ -136,15 +144,20 @@ class IndicatorEngine:
         - ema50: EMA with period 50
         - ema200: EMA with period 200
         - atr14: ATR with period 14
+        - stop_default_long: close - atr14 * atr_multiplier_stop (only when
+          the engine was created with atr_multiplier_stop)
         
         Args:
             df: DataFrame with OHLC data (columns: open, high, low, close)
+            copy: Work on a copy (default). Pass False when the caller owns a
+                freshly fetched frame and the columns may be added in place.
             
         Returns:
             DataFrame with indicator columns added
         """
         try:
-            df = df.copy()
+            if copy:
+                df = df.copy()
             
             # Calculate EMAs on close price
             df['ema20'] = self.calculate_ema(df['close'], period=20)
@@ -154,6 +167,10 @@ class IndicatorEngine:
             # Calculate ATR
             df['atr14'] = self.calculate_atr(df, period=14)
             
+            # Default ATR stop for long entries without a planned stop
+            if self.atr_multiplier_stop is not None:
+                df['stop_default_long'] = df['close'] - df['atr14'] * self.atr_multiplier_stop
+            
             self.logger.debug(f"Calculated indicators for {len(df)} bars")
             return df
             
@@ -191,12 +191,14 @@ class MarketDataService:
             self.is_connected = False
             self.logger.info("Disconnected from MT5")
     
-    def get_bars(self, count: int = 500) -> Optional[pd.DataFrame]:
+    def get_bars(self, count: int = 500, as_indexed: bool = False) -> Optional[pd.DataFrame]:
         """
         Fetch historical OHLC bars from MT5.
         
         Args:
             count: Number of bars to fetch
+            as_indexed: Return the frame indexed by ``time`` instead of
+                carrying it as a column
             
         Returns:
             DataFrame with columns: time, open, high, low, close, tick_volume
@@ -217,6 +219,8 @@ class MarketDataService:
                     # Convert to DataFrame
                     df = pd.DataFrame(rates)
                     df['time'] = pd.to_datetime(df['time'], unit='s')
+                    if as_indexed:
+                        df.set_index('time', inplace=True)
                     
                     self.logger.debug(f"Fetched {len(df)} bars for {self.symbol}")
                     return df
@@ -331,6 +335,51 @@ class MarketDataService:
         # Return the second-to-last bar (completed bar, not current forming bar)
         return df.iloc[-2]
     
+    def probe_bars(self, count: int = 500) -> Tuple[int, Optional[pd.Timestamp]]:
+        """
+        Check bar availability without building a DataFrame.
+
+        Args:
+            count: Number of bars to request
+
+        Returns:
+            Tuple of (number of bars returned, time of the latest bar);
+            (0, None) if unavailable
+        """
+        if not self.is_connected:
+            return 0, None
+
+        try:
+            rates = mt5.copy_rates_from_pos(self.symbol, self.timeframe, 0, count)
+            if rates is None or len(rates) == 0:
+                return 0, None
+            return len(rates), pd.Timestamp(int(rates[-1]['time']), unit='s')
+        except Exception as e:
+            self.logger.error(f"Error probing bars: {e}")
+            return 0, None
+
+    def get_latest_bar_time(self) -> Optional[pd.Timestamp]:
+        """
+        Get the open time of the most recent (forming) bar.
+
+        Cheap probe for bar-close detection: fetches a single raw bar and
+        skips DataFrame construction entirely.
+
+        Returns:
+            Timestamp of the latest bar, or None if unavailable
+        """
+        if not self.is_connected:
+            return None
+
+        try:
+            rates = mt5.copy_rates_from_pos(self.symbol, self.timeframe, 0, 1)
+            if rates is None or len(rates) == 0:
+                return None
+            return pd.Timestamp(int(rates[-1]['time']), unit='s')
+        except Exception as e:
+            self.logger.error(f"Error probing latest bar time: {e}")
+            return None
+
     def get_current_tick(self) -> Optional[float]:
         """
         Get the current live tick price.
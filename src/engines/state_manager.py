@@ -13,7 +13,8 @@ import json
 import logging
 import threading
 from datetime import datetime
-from typing import Optional, Dict, List
+from types import MappingProxyType
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 from utils.atomic_state_writer import AtomicStateWriter, SafeJSONEncoder
 from storage.state_database import StateDatabase
@@ -95,6 +96,11 @@ class StateManager:
         # Persisted market regime state
         self.last_regime_state: Optional[Dict] = None
         
+        # Cached read-only positions view (rebuilt when positions are opened/closed)
+        self._positions_version: int = 0
+        self._positions_view: Tuple[MappingProxyType, ...] = ()
+        self._positions_view_version: int = -1
+        
         # Load existing state if available
         self.load_state()
     
@@ -153,6 +159,7 @@ class StateManager:
             }
             
             self.open_positions.append(new_position)
+            self._positions_version += 1
             
             # Update last_trade_time on entry (cooldown is from last ENTRY, not exit)
             entry_time = new_position['entry_time']
@@ -296,6 +303,7 @@ class StateManager:
                 
                 # Remove closed position
                 self.open_positions.remove(position_to_close)
+                self._positions_version += 1
                 
                 # Note: last_trade_time is NOT updated on exit
                 # Cooldown tracks time since last ENTRY only
@@ -342,6 +350,23 @@ class StateManager:
         """Get all open positions."""
         return self.open_positions.copy()
     
+    def get_all_positions_view(self) -> Tuple[MappingProxyType, ...]:
+        """
+        Get a cached, read-only view of all open positions (for UI updates).
+        
+        The tuple is only rebuilt when positions are opened or closed. Each
+        entry is a read-only proxy over the live position dict, so field
+        updates (price, profit, TP state) are visible without a rebuild.
+        Callers must treat the result as immutable.
+        """
+        with self._state_lock:
+            if self._positions_view_version != self._positions_version:
+                self._positions_view = tuple(
+                    MappingProxyType(position) for position in self.open_positions
+                )
+                self._positions_view_version = self._positions_version
+            return self._positions_view
+    
     def update_position_tp_state(self, ticket: int, new_tp_state: str, 
                                  new_stop_loss: Optional[float] = None,
                                  transition_time: Optional[datetime] = None,
@@ -579,7 +604,8 @@ class StateManager:
         
         state_data = {
             'open_positions': [],
-            'trade_history': self.trade_history,
+            # Copy: the DB writer thread serializes it after this returns
+            'trade_history': list(self.trade_history),
             'last_trade_time': self.last_trade_time.isoformat() if self.last_trade_time else None,
             'total_trades': int(self.total_trades),
             'winning_trades': int(self.winning_trades),
@@ -736,6 +762,7 @@ class StateManager:
             self.open_positions = state_data.get('open_positions', [])
         elif 'current_position' in state_data and state_data['current_position']:
             self.open_positions = [state_data['current_position']]
+        self._positions_version += 1
 
         self.trade_history = state_data.get('trade_history', [])
         self.total_trades = state_data.get('total_trades', 0)
@@ -810,6 +837,7 @@ class StateManager:
     def reset_state(self):
         """Reset all state (use with caution!)."""
         self.open_positions = []
+        self._positions_version += 1
         self.trade_history = []
         self.last_trade_time = None
         self.total_trades = 0
@@ -827,6 +855,8 @@ class StateManager:
             if self.atomic_writer:
                 flushed = self.atomic_writer.flush()
                 self.logger.info("State flush executed (success=%s)", flushed)
+            if self.db_store:
+                self.db_store.flush()
         except Exception as e:
             self.logger.error(f"Error flushing state: {e}")
     
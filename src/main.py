@@ -436,13 +436,19 @@ This module coordinates all components of the trading system:
 
 import argparse
 import os
+import re
 import signal
+import math
 import sys
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+import pandas as pd
 
 from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from PySide6.QtWidgets import QApplication
@@ -476,6 +482,22 @@ from ui.main_window import MainWindow
 from ui.backtest_window import BacktestWorker
 
 
+# Exit reason tokens checked by _execute_exit (TP3 listed first so it wins over TP)
+_EXIT_REASON_RE = re.compile(r"TP3|STOP LOSS|TP", re.IGNORECASE)
+
+
+def _classify_exit_reason(reason: str) -> Tuple[bool, bool, bool]:
+    """
+    Classify an exit reason in a single pass.
+
+    Returns:
+        Tuple of (has_tp3, has_tp, has_sl). has_tp is also True for TP3.
+    """
+    tokens = {token.upper() for token in _EXIT_REASON_RE.findall(reason)}
+    has_tp3 = "TP3" in tokens
+    return has_tp3, has_tp3 or "TP" in tokens, "STOP LOSS" in tokens
+
+
 class TradingController(QObject):
     """
     Main controller for the trading application.
@@ -486,6 +508,17 @@ class TradingController(QObject):
     # Signals for UI updates
     update_ui = Signal(dict)
     
+    # UI setting key -> (config path, engine attribute, engine field)
+    _SETTING_BINDERS = {
+        'risk_percent': ('risk.risk_percent', 'risk_engine', 'risk_percent'),
+        'atr_multiplier': ('strategy.atr_multiplier_stop', 'strategy_engine', 'atr_multiplier_stop'),
+        'risk_reward_ratio_long': ('strategy.risk_reward_ratio_long', 'strategy_engine', 'risk_reward_ratio_long'),
+        'risk_reward_ratio_short': ('strategy.risk_reward_ratio_short', 'strategy_engine', 'risk_reward_ratio_short'),
+        'cooldown_hours': ('strategy.cooldown_hours', 'strategy_engine', 'cooldown_hours'),
+        'pyramiding': ('strategy.pyramiding', None, None),
+        'enable_momentum_filter': ('strategy.enable_momentum_filter', 'strategy_engine', 'enable_momentum_filter'),
+    }
+    
     def __init__(self):
         super().__init__()
         
@@ -1411,7 +1444,7 @@ class TradingController(QObject):
                 added_tickets.append(ticket)
 
             if (added_tickets or updated_tickets) and self.window:
-                positions = self.state_manager.get_all_positions()
+                positions = self.state_manager.get_all_positions_view()
                 self.ui_queue.post_event(
                     UIEventType.UPDATE_POSITION_DISPLAY,
                     {'positions': positions}
@@ -1723,7 +1756,7 @@ class TradingController(QObject):
             if self.window:
                 self.ui_queue.post_event(UIEventType.LOG_MESSAGE, {'message': f"TRADE OPENED: Ticket {ticket} @ {actual_entry_price:.5f}"})
                 # Update position display with all open positions
-                all_positions = self.state_manager.get_all_positions()
+                all_positions = self.state_manager.get_all_positions_view()
                 if all_positions:
                     self.ui_queue.post_event(UIEventType.UPDATE_POSITION_DISPLAY, {'positions': all_positions})
             
@@ -1735,7 +1768,12 @@ class TradingController(QObject):
     def _monitor_positions(self, current_bar):
         """Monitor all open positions and check for exit conditions (supports pyramiding)."""
         try:
-            all_positions = self.state_manager.get_all_positions()
+            # Bind hot-path references once; they are used per position inside the loop
+            state_manager = self.state_manager
+            strategy_engine = self.strategy_engine
+            log = self.logger
+            
+            all_positions = state_manager.get_all_positions()
             if not all_positions:
                 return
             
@@ -1763,15 +1801,15 @@ class TradingController(QObject):
                     
                     # Grace period: 5 seconds for position to appear in MT5
                     if time_since_entry and time_since_entry < 5:
-                        self.logger.debug(
+                        log.debug(
                             f"Position {ticket} just opened ({time_since_entry:.1f}s ago), "
                             f"not yet visible in MT5 - skipping closure check"
                         )
                         continue  # ← Skip false positive, check again next iteration
                     
                     # Position truly closed externally (after grace period)
-                    self.logger.warning(f"Position {ticket} closed externally")
-                    self.state_manager.close_position(
+                    log.warning(f"Position {ticket} closed externally")
+                    state_manager.close_position(
                         exit_price=current_bar['close'],
                         exit_reason="Closed externally",
                         exit_time=current_bar.get('time'),
@@ -1798,7 +1836,7 @@ class TradingController(QObject):
                 
                 # Use multi-level TP if levels are defined
                 if all(tp_levels.values()):
-                    should_exit, reason, new_tp_state, new_stop_loss = self.strategy_engine.evaluate_exit(
+                    should_exit, reason, new_tp_state, new_stop_loss = strategy_engine.evaluate_exit(
                         current_price=current_bar['close'],
                         entry_price=position_data['entry_price'],
                         stop_loss=position_data.get('current_stop_loss', position_data['stop_loss']),
@@ -1828,7 +1866,7 @@ class TradingController(QObject):
                         tp1_exit_reason = f'Price at {current_bar["close"]:.2f}, TP1 at {tp_levels.get("tp1", 0):.2f}'
                         post_tp2_decision = 'NOT_REACHED'
                         tp2_exit_reason = 'Awaiting TP1 first'
-                        self.logger.debug(f"Ticket {ticket}: IN_TRADE - TP1 not reached yet")
+                        log.debug(f"Ticket {ticket}: IN_TRADE - TP1 not reached yet")
                     
                     # If TP1_REACHED, evaluate and capture TP1 decision metadata
                     elif tp_state == 'TP1_REACHED' and not should_exit:
@@ -1837,7 +1875,7 @@ class TradingController(QObject):
                         if position_data.get('tp_state_changed_at') and isinstance(current_bar, dict) and 'time' in current_bar:
                             bars_since_tp = 0 if current_bar['time'] == position_data.get('tp_state_changed_at') else 1
                         
-                        tp1_result = self.strategy_engine.evaluate_post_tp1_decision(
+                        tp1_result = strategy_engine.evaluate_post_tp1_decision(
                             current_price=current_bar['close'],
                             entry_price=position_data['entry_price'],
                             stop_loss=position_data.get('current_stop_loss', position_data['stop_loss']),
@@ -1850,7 +1888,7 @@ class TradingController(QObject):
                         )
                         post_tp1_decision = tp1_result.get('decision')
                         tp1_exit_reason = tp1_result.get('reason')
-                        self.logger.info(f"Ticket {ticket} TP1 Decision: {post_tp1_decision} - {tp1_exit_reason}")
+                        log.info(f"Ticket {ticket} TP1 Decision: {post_tp1_decision} - {tp1_exit_reason}")
                     
                     # If TP2_REACHED, evaluate and capture TP2 decision metadata
                     elif tp_state == 'TP2_REACHED' and not should_exit:
@@ -1858,7 +1896,7 @@ class TradingController(QObject):
                         if position_data.get('tp_state_changed_at') and isinstance(current_bar, dict) and 'time' in current_bar:
                             bars_since_tp = 0 if current_bar['time'] == position_data.get('tp_state_changed_at') else 1
                         
-                        tp2_result = self.strategy_engine.evaluate_post_tp2_decision(
+                        tp2_result = strategy_engine.evaluate_post_tp2_decision(
                             current_price=current_bar['close'],
                             entry_price=position_data['entry_price'],
                             stop_loss=position_data.get('current_stop_loss', position_data['stop_loss']),
@@ -1876,12 +1914,12 @@ class TradingController(QObject):
                         tp2_exit_reason = tp2_result.get('reason')
                         trailing_sl_level = tp2_result.get('trailing_sl')
                         trailing_sl_enabled = trailing_sl_level is not None
-                        self.logger.info(f"Ticket {ticket} TP2 Decision: {post_tp2_decision} - {tp2_exit_reason}")
+                        log.info(f"Ticket {ticket} TP2 Decision: {post_tp2_decision} - {tp2_exit_reason}")
                         if trailing_sl_level:
-                            self.logger.info(f"Ticket {ticket} Trailing SL: {trailing_sl_level:.2f} ({'ACTIVE' if trailing_sl_enabled else 'INACTIVE'})")
+                            log.info(f"Ticket {ticket} Trailing SL: {trailing_sl_level:.2f} ({'ACTIVE' if trailing_sl_enabled else 'INACTIVE'})")
                     
                     # Update TP exit metadata in state (always update, not just when changed)
-                    self.state_manager.update_tp_exit_metadata(
+                    state_manager.update_tp_exit_metadata(
                         ticket=ticket,
                         post_tp1_decision=post_tp1_decision,
                         tp1_exit_reason=tp1_exit_reason,
@@ -1908,7 +1946,7 @@ class TradingController(QObject):
                         if new_tp_state == 'TP2_REACHED':
                             bars_tp2_update = position_data.get('bars_held_after_tp2', 0) + 1
                         
-                        self.state_manager.update_position_tp_state(
+                        state_manager.update_position_tp_state(
                             ticket=ticket,
                             new_tp_state=new_tp_state,
                             new_stop_loss=new_stop_loss,
@@ -1916,7 +1954,7 @@ class TradingController(QObject):
                             bars_after_tp1=bars_tp1_update,
                             bars_after_tp2=bars_tp2_update
                         )
-                        self.logger.info(f"Position {ticket} TP state: {tp_state} -> {new_tp_state}")
+                        log.info(f"Position {ticket} TP state: {tp_state} -> {new_tp_state}")
                     
                     # MEDIUM: BARS_AFTER_TP_NOT_INCREMENTING - Increment bar counters on bar-close (NEW)
                     if new_tp_state == 'TP1_REACHED':
@@ -1927,7 +1965,7 @@ class TradingController(QObject):
                         position_data['bars_held_after_tp2'] = current_bars_tp2 + 1
                 else:
                     # Fallback to simple exit (backward compatibility)
-                    should_exit, reason, _, _ = self.strategy_engine.evaluate_exit(
+                    should_exit, reason, _, _ = strategy_engine.evaluate_exit(
                         current_price=current_bar['close'],
                         entry_price=position_data['entry_price'],
                         stop_loss=position_data['stop_loss'],
@@ -1940,7 +1978,7 @@ class TradingController(QObject):
             
             # Update UI with all open positions (for multi-position display) - thread-safe
             if self.window:
-                all_open_positions = self.state_manager.get_all_positions()
+                all_open_positions = self.state_manager.get_all_positions_view()
                 if all_open_positions:
                     self.ui_queue.post_event(UIEventType.UPDATE_POSITION_DISPLAY, {'positions': all_open_positions})
                 else:
@@ -1973,20 +2011,21 @@ class TradingController(QObject):
             direction = position.get('direction', 1)
             
             # Check if reason matches the exit price
+            has_tp3 = tp3_price is not None
             if direction == 1:  # LONG
                 is_sl_hit = exit_price <= stop_loss
                 is_tp_hit = exit_price >= take_profit
-                is_tp3_hit = exit_price >= tp3_price if tp3_price is not None else is_tp_hit
+                is_tp3_hit = (exit_price >= tp3_price) if has_tp3 else is_tp_hit
             else:  # SHORT
                 is_sl_hit = exit_price >= stop_loss
                 is_tp_hit = exit_price <= take_profit
-                is_tp3_hit = exit_price <= tp3_price if tp3_price is not None else is_tp_hit
+                is_tp3_hit = (exit_price <= tp3_price) if has_tp3 else is_tp_hit
             
             # Validate exit reason matches actual exit condition
-            reason_upper = reason.upper()
+            has_tp3_reason, has_tp_reason, has_sl_reason = _classify_exit_reason(reason)
 
             # TP3 integrity: only allow TP3 reason if price actually hit TP3
-            if "TP3" in reason_upper and not is_tp3_hit:
+            if has_tp3_reason and not is_tp3_hit:
                 self.logger.warning(
                     f"TP3 reason mismatch: exit_price {exit_price:.2f} vs TP3 {tp3_price:.2f if tp3_price else float('nan')}"
                 )
@@ -1996,7 +2035,7 @@ class TradingController(QObject):
                     reason = "Protective Exit - TP3 Not Reached"
                 self.logger.warning(f"CORRECTED: Exit reason -> {reason}")
 
-            elif "TP" in reason_upper and not is_tp_hit:
+            elif has_tp_reason and not is_tp_hit:
                 # Exit reason says TP but exit_price didn't reach TP
                 self.logger.warning(
                     f"MISMATCH: Exit reason '{reason}' but exit_price {exit_price:.2f} "
@@ -2004,11 +2043,11 @@ class TradingController(QObject):
                 )
                 if is_sl_hit:
                     reason = "Stop Loss"
-                elif reason_upper not in ["RECOVERY MODE", "CLOSED EXTERNALLY", "UNKNOWN"]:
+                elif reason.upper() not in ["RECOVERY MODE", "CLOSED EXTERNALLY", "UNKNOWN"]:
                     reason = "Unknown Closure"
                 self.logger.warning(f"CORRECTED: Exit reason -> {reason}")
 
-            elif "STOP LOSS" in reason_upper and is_tp_hit:
+            elif has_sl_reason and is_tp_hit:
                 # Exit reason says SL but exit_price reached TP
                 self.logger.warning(
                     f"MISMATCH: Exit reason '{reason}' but exit_price {exit_price:.2f} "
@@ -2055,7 +2094,7 @@ class TradingController(QObject):
                 if self.window:
                     self.ui_queue.post_event(UIEventType.LOG_MESSAGE, {'message': f"POSITION CLOSED: {reason}, P/L: ${position['profit']:.2f}"})
                     # Update position display with remaining positions
-                    remaining_positions = self.state_manager.get_all_positions()
+                    remaining_positions = self.state_manager.get_all_positions_view()
                     if remaining_positions:
                         self.ui_queue.post_event(UIEventType.UPDATE_POSITION_DISPLAY, {'positions': remaining_positions})
                     else:
@@ -2077,6 +2116,9 @@ class TradingController(QObject):
             return
         
         try:
+            # Single clock read per UI update (uptime + heartbeat)
+            now = datetime.now()
+            
             # Get live price
             live_price = self.market_data.get_current_tick()
             display_price = live_price if live_price is not None else current_bar['close']
@@ -2124,7 +2166,7 @@ class TradingController(QObject):
             ui_queue_stats = self.ui_queue.get_statistics() if self.ui_queue else {}
             perf_top = self.performance_monitor.get_slowest_operations(top_n=3)
             perf_all = self.performance_monitor.get_all_metrics()
-            uptime_seconds = (datetime.now() - self.app_start_time).total_seconds()
+            uptime_seconds = (now - self.app_start_time).total_seconds()
 
             self.ui_queue.post_event(UIEventType.UPDATE_STATISTICS, {
                 'trade_stats': stats,
@@ -2154,7 +2196,7 @@ class TradingController(QObject):
                 'auto_trading_enabled': auto_trading_active,
                 'account_type': self.runtime_manager.account_type.value if self.runtime_manager.account_type else 'UNKNOWN',
                 'mt5_connection_status': 'CONNECTED' if self.is_connected else 'DISCONNECTED',
-                'last_heartbeat': datetime.now().strftime('%H:%M:%S')
+                'last_heartbeat': now.strftime('%H:%M:%S')
             }
             self.ui_queue.post_event(UIEventType.UPDATE_RUNTIME_CONTEXT, {'context': runtime_context})
             
@@ -2468,10 +2510,14 @@ class TradingController(QObject):
                 bt_ui.set_status(f"✓ Exported HTML: {filepath.name}")
                 self.logger.info(f"HTML export completed: {filepath}")
                 
-                # Optional: Open in browser
+                # Optional: Open in browser (off the UI thread; may spawn a process)
                 try:
                     import webbrowser
-                    webbrowser.open(str(filepath))
+                    threading.Thread(
+                        target=webbrowser.open,
+                        args=(str(filepath),),
+                        daemon=True,
+                    ).start()
                 except Exception as e:
                     self.logger.debug(f"Could not open browser: {e}")
             else:
@@ -2486,33 +2532,15 @@ class TradingController(QObject):
     def _on_settings_changed(self, settings: dict):
         """Handle settings changes from UI."""
         try:
-            # Update configuration
-            if 'risk_percent' in settings:
-                self.config.set('risk.risk_percent', settings['risk_percent'])
-                self.risk_engine.risk_percent = settings['risk_percent']
-            
-            if 'atr_multiplier' in settings:
-                self.config.set('strategy.atr_multiplier_stop', settings['atr_multiplier'])
-                self.strategy_engine.atr_multiplier_stop = settings['atr_multiplier']
-            
-            if 'risk_reward_ratio_long' in settings:
-                self.config.set('strategy.risk_reward_ratio_long', settings['risk_reward_ratio_long'])
-                self.strategy_engine.risk_reward_ratio_long = settings['risk_reward_ratio_long']
-            
-            if 'risk_reward_ratio_short' in settings:
-                self.config.set('strategy.risk_reward_ratio_short', settings['risk_reward_ratio_short'])
-                self.strategy_engine.risk_reward_ratio_short = settings['risk_reward_ratio_short']
-            
-            if 'cooldown_hours' in settings:
-                self.config.set('strategy.cooldown_hours', settings['cooldown_hours'])
-                self.strategy_engine.cooldown_hours = settings['cooldown_hours']
-            
-            if 'pyramiding' in settings:
-                self.config.set('strategy.pyramiding', settings['pyramiding'])
-            
-            if 'enable_momentum_filter' in settings:
-                self.config.set('strategy.enable_momentum_filter', settings['enable_momentum_filter'])
-                self.strategy_engine.enable_momentum_filter = settings['enable_momentum_filter']
+            # Update configuration (only keys present in the change set)
+            for key, value in settings.items():
+                binder = self._SETTING_BINDERS.get(key)
+                if binder is None:
+                    continue
+                config_path, engine_name, field = binder
+                self.config.set(config_path, value)
+                if engine_name:
+                    setattr(getattr(self, engine_name), field, value)
             
             # Save config
             self.config.save_config()
@@ -2633,10 +2661,33 @@ class TradingController(QObject):
 
 
 
+# Pre-split config key paths used by the headless runner
+_KEY_RISK_PERCENT = ("risk", "risk_percent")
+_KEY_PYRAMIDING = ("strategy", "pyramiding")
+_KEY_TIMEFRAME = ("mt5", "timeframe")
+
+
 class HeadlessTradingRunner:
     """Headless trading entrypoint that executes a bar-close loop."""
 
     _VALID_TIMEFRAMES = {"M1", "M5", "M15", "M30", "H1", "H4", "D1", "W1", "MN1"}
+    _TIMEFRAME_SECONDS = {
+        "M1": 60,
+        "M5": 5 * 60,
+        "M15": 15 * 60,
+        "M30": 30 * 60,
+        "H1": 60 * 60,
+        "H4": 4 * 60 * 60,
+        "D1": 24 * 60 * 60,
+        "W1": 7 * 24 * 60 * 60,
+        "MN1": 30 * 24 * 60 * 60,
+    }
+    # Broker servers run on whole-hour UTC offsets, so H4 and above are
+    # checked on every hour boundary; the bar-time dedup skips no-op wakes.
+    _MAX_SCHEDULE_STEP_SECONDS = 60 * 60
+    _BAR_CLOSE_GRACE_SECONDS = 1.0
+    _BAR_CLOSE_RETRY_WINDOW_SECONDS = 60.0
+    _HEARTBEAT_INTERVAL_SECONDS = 30.0
 
     def __init__(self, config_path: str, poll_interval_seconds: float = 5.0):
         self.logger = logging.getLogger(__name__)
@@ -2650,6 +2701,9 @@ class HeadlessTradingRunner:
         self.logger = self.trading_logger.get_main_logger()
         self.metrics_tracker = MetricsTracker()
         self.poll_interval_seconds = max(1.0, poll_interval_seconds)
+        self._bars_to_fetch = int(self.config.get("data.bars_to_fetch", 500))
+        self._state_file = self.config.get("data.state_file", "data/state.json")
+        self._backup_dir = self.config.get("data.backup_dir", "data/backups")
 
         mt5_config = self.app_config.mt5
         strategy_config = self.app_config.strategy
@@ -2666,7 +2720,9 @@ class HeadlessTradingRunner:
         )
         self.connection_manager.on_status_change = self._on_connection_status_change
         self.connection_manager.on_reconnect_status = self._on_reconnect_status
-        self.indicator_engine = IndicatorEngine()
+        self.indicator_engine = IndicatorEngine(
+            atr_multiplier_stop=strategy_config.atr_multiplier_stop,
+        )
         self.pattern_engine = PatternEngine(
             lookback_left=strategy_config.pivot_lookback_left,
             lookback_right=strategy_config.pivot_lookback_right,
@@ -2688,8 +2744,8 @@ class HeadlessTradingRunner:
             magic_number=mt5_config.magic_number,
         )
         self.state_manager = StateManager(
-            state_file=self.config.get("data.state_file", "data/state.json"),
-            backup_dir=self.config.get("data.backup_dir", "data/backups"),
+            state_file=self._state_file,
+            backup_dir=self._backup_dir,
             use_atomic_writes=True,
             storage_backend=self.config.get("data.storage_backend", "file"),
             db_url=self.config.get("data.db_url", "sqlite:///data/state.db"),
@@ -2701,7 +2757,12 @@ class HeadlessTradingRunner:
         self.bar_counter: int = 0
         self.is_running = False
         self.trading_paused = False
-        self.last_heartbeat_check: float = 0.0
+        self._stop_evt = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._indicator_cache: Dict[tuple, pd.DataFrame] = {}
+        self._indicator_cache_key: Optional[tuple] = None
+        self._decision_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="decision")
+        self._decision_future: Optional[Future] = None
 
     def _load_runtime_config(self, config_path: str) -> Config:
         config = load_legacy_config(config_path)
@@ -2709,29 +2770,29 @@ class HeadlessTradingRunner:
         return config
 
     def _validate_runtime_config(self, config: Config) -> None:
-        risk_percent = config.get("risk.risk_percent", 1.0)
+        risk_percent = config.get_tuple(_KEY_RISK_PERCENT, 1.0)
         if not isinstance(risk_percent, (int, float)) or not (0 < risk_percent <= 100):
             self.logger.warning(
                 "Invalid risk.risk_percent=%s; using default 1.0.",
                 risk_percent,
             )
-            config.set("risk.risk_percent", 1.0)
+            config.set_tuple(_KEY_RISK_PERCENT, 1.0)
 
-        pyramiding = config.get("strategy.pyramiding", 1)
+        pyramiding = config.get_tuple(_KEY_PYRAMIDING, 1)
         if not isinstance(pyramiding, int) or pyramiding < 1:
             self.logger.warning(
                 "Invalid strategy.pyramiding=%s; using default 1.",
                 pyramiding,
             )
-            config.set("strategy.pyramiding", 1)
+            config.set_tuple(_KEY_PYRAMIDING, 1)
 
-        timeframe = config.get("mt5.timeframe", "H1")
+        timeframe = config.get_tuple(_KEY_TIMEFRAME, "H1")
         if timeframe not in self._VALID_TIMEFRAMES:
             self.logger.warning(
                 "Invalid mt5.timeframe=%s; using default H1.",
                 timeframe,
             )
-            config.set("mt5.timeframe", "H1")
+            config.set_tuple(_KEY_TIMEFRAME, "H1")
 
     def connect_mt5(self) -> bool:
         mt5_config = self.app_config.mt5
@@ -2750,12 +2811,30 @@ class HeadlessTradingRunner:
 
     def request_shutdown(self) -> None:
         self.is_running = False
+        self._stop_evt.set()
+
+    @classmethod
+    def _next_bar_close_epoch(cls, timeframe: str, now: float) -> float:
+        """Return the next bar-close boundary (epoch seconds) after ``now``."""
+        step = min(
+            cls._TIMEFRAME_SECONDS.get(timeframe, cls._TIMEFRAME_SECONDS["H1"]),
+            cls._MAX_SCHEDULE_STEP_SECONDS,
+        )
+        next_close = math.ceil(now / step) * step
+        if next_close <= now:
+            next_close += step
+        return float(next_close)
+
+    def _heartbeat_loop(self) -> None:
+        """Run the connection heartbeat until shutdown is requested."""
+        while not self._stop_evt.is_set():
+            try:
+                self._perform_heartbeat()
+            except Exception as exc:
+                self.logger.error("Heartbeat error: %s", exc, exc_info=True)
+            self._stop_evt.wait(self._HEARTBEAT_INTERVAL_SECONDS)
 
     def _perform_heartbeat(self) -> None:
-        now = time.time()
-        if now - self.last_heartbeat_check < 30:
-            return
-        self.last_heartbeat_check = now
         healthy = self.connection_manager.check_connection()
         if not healthy:
             if not self.trading_paused:
@@ -2791,40 +2870,93 @@ class HeadlessTradingRunner:
     def _resync_market_data(self) -> None:
         """Refetch bar history after reconnection."""
         try:
-            bars_to_fetch = self.config.get("data.bars_to_fetch", 500)
-            df = self.market_data.get_bars(count=bars_to_fetch)
-            if df is None or df.empty:
+            bars_to_fetch = self._bars_to_fetch
+            bar_count, last_bar_time = self.market_data.probe_bars(bars_to_fetch)
+            if not bar_count:
                 self.logger.warning("Market data resync failed (headless, no bars returned).")
                 return
-            self.logger.info("Market data resynced (headless): %s bars.", len(df))
+            self.logger.info(
+                "Market data resynced (headless): %s bars, last=%s.",
+                bar_count,
+                last_bar_time,
+            )
         except Exception as exc:
             self.logger.error("Market data resync error (headless): %s", exc, exc_info=True)
 
     def _process_bar_close(self) -> None:
-        bars_to_fetch = self.config.get("data.bars_to_fetch", 500)
-        df = self.market_data.get_bars(count=bars_to_fetch)
-        if df is None or df.empty:
-            self.logger.warning("No bars fetched; skipping bar-close processing.")
+        """Prepare the latest closed bar and hand it to the decision worker."""
+        if self._decision_future is not None and not self._decision_future.done():
+            self.logger.warning("Previous bar evaluation still running; skipping this pass.")
+            return
+
+        prepared = self._fetch_and_prepare()
+        if prepared is None:
+            return
+
+        self._decision_future = self._decision_pool.submit(self._evaluate_and_execute, *prepared)
+        self._decision_future.add_done_callback(self._on_decision_done)
+
+    def _on_decision_done(self, future: Future) -> None:
+        """Log failures from the decision worker."""
+        if future.cancelled():
             return
+        exc = future.exception()
+        if exc is not None:
+            self.logger.error(
+                "Bar evaluation failed: %s",
+                exc,
+                exc_info=(type(exc), exc, exc.__traceback__),
+            )
 
-        df = df.copy()
-        if "time" in df.columns:
-            df = df.set_index("time")
+    def _fetch_and_prepare(self) -> Optional[Tuple[pd.DataFrame, pd.Series, datetime, int]]:
+        """Fetch bars and indicators; return the closed frame if a new bar closed."""
+        bars_to_fetch = self._bars_to_fetch
+        latest_bar_time = self.market_data.get_latest_bar_time()
+        cache_key = (bars_to_fetch, latest_bar_time)
+        if (
+            latest_bar_time is not None
+            and cache_key == self._indicator_cache_key
+            and self.last_closed_bar_time is not None
+        ):
+            # Same forming bar as the last pass: the closed bar was already handled.
+            return None
+
+        df = self._indicator_cache.get(cache_key) if latest_bar_time is not None else None
+        if df is None:
+            df = self.market_data.get_bars(count=bars_to_fetch, as_indexed=True)
+            if df is None or df.empty:
+                self.logger.warning("No bars fetched; skipping bar-close processing.")
+                return None
+
+            # The frame is freshly built and owned here, so indicators go in place.
+            df = self.indicator_engine.calculate_all_indicators(df, copy=False)
+            if latest_bar_time is not None:
+                self._indicator_cache = {cache_key: df}
+                self._indicator_cache_key = cache_key
 
-        df = self.indicator_engine.calculate_all_indicators(df)
         if len(df) < 3:
             self.logger.warning("Not enough data for indicators; waiting for more bars.")
-            return
+            return None
 
         closed_df = df.iloc[:-1]
         current_bar = closed_df.iloc[-1]
         bar_time = closed_df.index[-1]
 
         if self.last_closed_bar_time == bar_time:
-            return
+            return None
 
         self.last_closed_bar_time = bar_time
         self.bar_counter += 1
+        return closed_df, current_bar, bar_time, self.bar_counter
+
+    def _evaluate_and_execute(
+        self,
+        closed_df: pd.DataFrame,
+        current_bar: pd.Series,
+        bar_time: datetime,
+        bar_number: int,
+    ) -> None:
+        """Run pattern/decision/risk evaluation and execution for one closed bar."""
         set_correlation_id(str(bar_time))
         self.logger.info(
             "Event: bar processed time=%s close=%.5f",
@@ -2869,13 +3001,20 @@ class HeadlessTradingRunner:
             self.logger.info("Decision outcome: %s", decision.decision.value)
 
             symbol_info = symbol_info or {}
-            entry_price = decision.planned_entry or float(current_bar["close"])
+            entry_price = (
+                decision.planned_entry
+                if decision.planned_entry is not None
+                else float(current_bar["close"])
+            )
             stop_loss = decision.planned_sl
             take_profit = decision.planned_tp3
 
             if stop_loss is None:
-                atr = float(current_bar.get("atr14", 0.0))
-                stop_loss = entry_price - (atr * self.decision_engine.atr_multiplier_stop)
+                if decision.planned_entry is None:
+                    stop_loss = float(current_bar["stop_default_long"])
+                else:
+                    atr = float(current_bar["atr14"])
+                    stop_loss = entry_price - (atr * self.indicator_engine.atr_multiplier_stop)
 
             volume = self.risk_engine.calculate_position_size(
                 equity=equity,
@@ -2895,7 +3034,7 @@ class HeadlessTradingRunner:
                 comment="DecisionEngine Bar-Close",
             )
             if order:
-                self.last_trade_bar_index = self.bar_counter
+                self.last_trade_bar_index = bar_number
                 self.state_manager.open_position(
                     {
                         "ticket": order["order"],
@@ -2928,18 +3067,50 @@ class HeadlessTradingRunner:
             return
 
         self.is_running = True
+        self._stop_evt.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop,
+            name="HeadlessHeartbeat",
+            daemon=True,
+        )
+        self._heartbeat_thread.start()
         self.logger.info("Headless trading loop started.")
+        timeframe = self.config.get_tuple(_KEY_TIMEFRAME, "H1")
+        bar_close = time.time()
+        next_due = bar_close
         try:
             while self.is_running:
-                self._perform_heartbeat()
-                if not self.trading_paused:
-                    self._process_bar_close()
-                time.sleep(self.poll_interval_seconds)
+                now = time.time()
+                if now >= next_due:
+                    previous_bar_time = self.last_closed_bar_time
+                    if not self.trading_paused:
+                        self._process_bar_close()
+                    now = time.time()
+                    if (
+                        self.last_closed_bar_time != previous_bar_time
+                        or now - bar_close > self._BAR_CLOSE_RETRY_WINDOW_SECONDS
+                    ):
+                        bar_close = self._next_bar_close_epoch(timeframe, now)
+                        next_due = bar_close + self._BAR_CLOSE_GRACE_SECONDS
+                    else:
+                        # New bar not visible yet (or trading paused); retry shortly.
+                        next_due = now + self.poll_interval_seconds
+                self._stop_evt.wait(max(0.0, next_due - time.time()))
         finally:
             self.shutdown()
 
     def shutdown(self) -> None:
         self.logger.info("Headless trading shutdown initiated.")
+        self._stop_evt.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=5.0)
+            self._heartbeat_thread = None
+
+        try:
+            self._decision_pool.shutdown(wait=True, cancel_futures=True)
+        except Exception as exc:
+            self.logger.warning("Decision worker shutdown failed: %s", exc)
+
         try:
             if self.connection_manager.reconnect_in_progress:
                 self.connection_manager.cancel_reconnect()
@@ -3007,22 +3178,8 @@ def main():
     window = MainWindow(config=controller.config)
     controller.set_window(window)
     
-    # Store controller reference for cleanup
-    window._controller = controller
-    
-    # Override closeEvent to ensure graceful shutdown
-    original_close_event = window.closeEvent
-    def close_event_with_shutdown(event):
-        try:
-            # Perform graceful shutdown
-            controller.shutdown()
-        except Exception as e:
-            print(f"Error during shutdown: {e}")
-        finally:
-            # Continue with normal close
-            original_close_event(event)
-    
-    window.closeEvent = close_event_with_shutdown
+    # Graceful shutdown when the event loop tears down (last window closed)
+    app.aboutToQuit.connect(controller.shutdown)
     window.show()
     
     # Connect to MT5
@@ -2,21 +2,363 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
+import queue
 import sqlite3
+import threading
+import time
+import zlib
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 from src.utils.atomic_state_writer import SafeJSONEncoder
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+_SAFE_JSON_ENCODER = SafeJSONEncoder()
+_ORJSON_OPTS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if HAS_ORJSON else 0
+
+# Snapshot rows from format version 2 on hold metadata only, not full state
+_SNAPSHOT_FORMAT_VERSION = 2
+
+# zlib level for snapshot BLOBs; small payloads gain little above this
+_SNAPSHOT_COMPRESS_LEVEL = 6
+
+# Per-connection prepared statement cache; hot SQL below is kept as
+# module constants so every call reuses the same cached statement
+_CACHED_STATEMENTS = 256
+
+# Queue sentinel that tells the background writer to exit
+_WRITER_STOP = object()
+
+# Kinds of work items handled by the background writer
+_OP_SAVE = "save"
+_OP_UPDATE = "update"
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to JSON text, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_SAFE_JSON_ENCODER.default, option=_ORJSON_OPTS).decode("utf-8")
+    return json.dumps(obj, cls=SafeJSONEncoder)
+
+
+def _finite_json(obj):
+    """Replace NaN/inf floats with None, recursing into dicts and lists."""
+    if isinstance(obj, dict):
+        return {key: _finite_json(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_json(value) for value in obj]
+    if isinstance(obj, (float, np.floating)):
+        value = float(obj)
+        return value if math.isfinite(value) else None
+    return obj
+
+
+def _json_dumps_strict(obj) -> str:
+    """Serialize to strict JSON text, writing NaN/inf as null.
+
+    Used for columns read by SQLite's JSON functions, which reject the
+    bare NaN/Infinity tokens json.dumps emits by default; orjson already
+    writes non-finite floats as null.
+    """
+    if HAS_ORJSON:
+        return _json_dumps(obj)
+    return json.dumps(_finite_json(obj), cls=SafeJSONEncoder, allow_nan=False)
+
+
+def _json_loads(data):
+    """Parse JSON text, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Rows written by json.dumps may contain NaN/Infinity tokens
+            pass
+    return json.loads(data)
+
+_SQL_UPSERT_POSITION = """
+INSERT INTO positions (
+    ticket, entry_price, stop_loss, take_profit, volume, entry_time,
+    direction, atr, tp_state, tp1_price, tp2_price, tp3_price,
+    current_stop_loss, tp1_reached, tp2_reached, post_tp1_decision,
+    post_tp2_decision, tp1_reached_timestamp, tp2_reached_timestamp,
+    bars_held_after_tp1, bars_held_after_tp2, max_extension_after_tp1,
+    max_extension_after_tp2, tp1_exit_reason, tp2_exit_reason,
+    trailing_sl_level, trailing_sl_enabled, price_current, profit,
+    swap, pattern_info, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(ticket) DO UPDATE SET
+    entry_price = excluded.entry_price,
+    stop_loss = excluded.stop_loss,
+    take_profit = excluded.take_profit,
+    volume = excluded.volume,
+    entry_time = excluded.entry_time,
+    direction = excluded.direction,
+    atr = excluded.atr,
+    tp_state = excluded.tp_state,
+    tp1_price = excluded.tp1_price,
+    tp2_price = excluded.tp2_price,
+    tp3_price = excluded.tp3_price,
+    current_stop_loss = excluded.current_stop_loss,
+    tp1_reached = excluded.tp1_reached,
+    tp2_reached = excluded.tp2_reached,
+    post_tp1_decision = excluded.post_tp1_decision,
+    post_tp2_decision = excluded.post_tp2_decision,
+    tp1_reached_timestamp = excluded.tp1_reached_timestamp,
+    tp2_reached_timestamp = excluded.tp2_reached_timestamp,
+    bars_held_after_tp1 = excluded.bars_held_after_tp1,
+    bars_held_after_tp2 = excluded.bars_held_after_tp2,
+    max_extension_after_tp1 = excluded.max_extension_after_tp1,
+    max_extension_after_tp2 = excluded.max_extension_after_tp2,
+    tp1_exit_reason = excluded.tp1_exit_reason,
+    tp2_exit_reason = excluded.tp2_exit_reason,
+    trailing_sl_level = excluded.trailing_sl_level,
+    trailing_sl_enabled = excluded.trailing_sl_enabled,
+    price_current = excluded.price_current,
+    profit = excluded.profit,
+    swap = excluded.swap,
+    pattern_info = excluded.pattern_info,
+    updated_at = excluded.updated_at
+"""
+
+_SQL_INSERT_TRADE = """
+INSERT INTO trades (
+    ticket, entry_time, exit_time, entry_price, exit_price,
+    stop_loss, take_profit, volume, profit, gross_pl, commission,
+    swap, net_pl, exit_reason, is_winner, pattern_info, created_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_TRADING_STATE = """
+INSERT OR REPLACE INTO trading_state (
+    id, last_trade_time, total_trades, winning_trades,
+    losing_trades, total_profit, last_regime_state, saved_at
+) VALUES (1, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_POSITION_PRICES = (
+    "UPDATE positions SET price_current = ?, profit = ?, updated_at = ? WHERE ticket = ?"
+)
+
+_SQL_SELECT_TRADING_STATE = "SELECT * FROM trading_state WHERE id = 1"
+_SQL_SELECT_POSITION_TICKETS = "SELECT ticket FROM positions"
+_SQL_DELETE_ALL_POSITIONS = "DELETE FROM positions"
+_SQL_DELETE_ALL_TRADES = "DELETE FROM trades"
+_SQL_SELECT_LATEST_SNAPSHOT = "SELECT data FROM state_snapshots_ring ORDER BY seq DESC LIMIT 1"
+
+_SQL_INSERT_SNAPSHOT = (
+    "INSERT OR REPLACE INTO state_snapshots_ring (slot, seq, created_at, data) VALUES (?, ?, ?, ?)"
+)
+
+_SQL_HAS_DATA = """
+SELECT (EXISTS(SELECT 1 FROM state_snapshots_ring)
+     OR EXISTS(SELECT 1 FROM positions)
+     OR EXISTS(SELECT 1 FROM trades))
+"""
+
+# Keeps the newest max_snapshots rows (by seq) after max_snapshots shrinks
+_SQL_PRUNE_SNAPSHOTS = (
+    "DELETE FROM state_snapshots_ring"
+    " WHERE seq <= (SELECT MAX(seq) FROM state_snapshots_ring) - ?"
+)
+
+# Re-slots the survivors as seq % max_snapshots; the first pass moves every
+# row to a unique negative slot so the second cannot hit a taken key
+_SQL_RESLOT_SNAPSHOTS = (
+    "UPDATE state_snapshots_ring SET slot = -1 - seq",
+    "UPDATE state_snapshots_ring SET slot = seq % ?",
+)
+
+# Column order of the dicts rebuilt from the positions / trades tables
+_POSITION_COLS = (
+    'ticket', 'entry_price', 'stop_loss', 'take_profit', 'volume', 'entry_time',
+    'direction', 'atr', 'tp_state', 'tp1_price', 'tp2_price', 'tp3_price',
+    'current_stop_loss', 'tp1_reached', 'tp2_reached', 'post_tp1_decision',
+    'post_tp2_decision', 'tp1_reached_timestamp', 'tp2_reached_timestamp',
+    'bars_held_after_tp1', 'bars_held_after_tp2', 'max_extension_after_tp1',
+    'max_extension_after_tp2', 'tp1_exit_reason', 'tp2_exit_reason',
+    'trailing_sl_level', 'trailing_sl_enabled', 'price_current', 'profit',
+    'swap', 'pattern_info',
+)
+_POSITION_BOOL_COLS = ('tp1_reached', 'tp2_reached', 'trailing_sl_enabled')
+
+_TRADE_COLS = (
+    'ticket', 'entry_time', 'exit_time', 'entry_price', 'exit_price',
+    'stop_loss', 'take_profit', 'volume', 'profit', 'gross_pl', 'commission',
+    'swap', 'net_pl', 'exit_reason', 'is_winner', 'pattern_info',
+)
+
+_SQL_SELECT_POSITIONS = f"SELECT {', '.join(_POSITION_COLS)} FROM positions"
+_SQL_SELECT_POSITION = _SQL_SELECT_POSITIONS + " WHERE ticket = ?"
+_SQL_SELECT_TRADES = f"SELECT {', '.join(_TRADE_COLS)} FROM trades ORDER BY id"
+
+# Rows pulled per fetchmany() call when streaming trade history
+_FETCH_CHUNK_ROWS = 1000
+
+
+def _decode_snapshot(data) -> Dict:
+    """Parse a snapshot row stored as JSON text or zlib-compressed BLOB."""
+    if isinstance(data, bytes):
+        data = zlib.decompress(data)
+    return _json_loads(data)
+
+
+@lru_cache(maxsize=64)
+def _sql_delete_closed_positions(open_count: int) -> str:
+    """DELETE for tickets not among ``open_count`` bound open tickets."""
+    placeholders = ", ".join("?" * open_count)
+    return f"DELETE FROM positions WHERE ticket NOT IN ({placeholders})"
+
+
+def _merge_dirty(first: Optional[set], second: Optional[set]) -> Optional[set]:
+    """Union two dirty-ticket sets, where None means "all tickets"."""
+    if first is None or second is None:
+        return None
+    return first | second
+
+
+def _position_from_row(row) -> Dict:
+    """Build a position dict from a _SQL_SELECT_POSITIONS row."""
+    pos = dict(zip(_POSITION_COLS, row))
+    for key in _POSITION_BOOL_COLS:
+        pos[key] = bool(pos[key])
+    pattern_info = pos['pattern_info']
+    pos['pattern_info'] = _json_loads(pattern_info) if pattern_info else None
+    return pos
+
+
+def _trade_from_row(row) -> Dict:
+    """Build a trade dict from a _SQL_SELECT_TRADES row."""
+    trade = dict(zip(_TRADE_COLS, row))
+    trade['is_winner'] = bool(trade['is_winner'])
+    pattern_info = trade['pattern_info']
+    trade['pattern_info'] = _json_loads(pattern_info) if pattern_info else None
+    return trade
+
+
+def _iso(value):
+    """Return ISO text for a datetime; pass other values through."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _sql_flag(value) -> int:
+    """Store booleans as 0/1."""
+    return 1 if value else 0
+
+
+def _sql_json(value):
+    """Store non-string values as JSON text."""
+    if value is not None and not isinstance(value, str):
+        return _json_dumps_strict(value)
+    return value
+
+
+# Per-column value conversion for update_position; default is _iso, so
+# datetimes are bound as ISO text without a process-wide sqlite3 adapter
+_UPDATE_COERCERS = {
+    'tp1_reached': _sql_flag,
+    'tp2_reached': _sql_flag,
+    'trailing_sl_enabled': _sql_flag,
+    'pattern_info': _sql_json,
+}
+
+
+def _position_rows(positions: Iterable[Dict], now: str) -> Iterator[Tuple]:
+    """Yield positions table parameter tuples, in _SQL_UPSERT_POSITION order."""
+    for pos in positions:
+        pattern_info = pos.get('pattern_info')
+        if pattern_info is not None and not isinstance(pattern_info, str):
+            pattern_info = _json_dumps_strict(pattern_info)
+
+        yield (
+            pos.get('ticket'),
+            pos.get('entry_price'),
+            pos.get('stop_loss'),
+            pos.get('take_profit'),
+            pos.get('volume'),
+            _iso(pos.get('entry_time')),
+            pos.get('direction', 1),
+            pos.get('atr'),
+            pos.get('tp_state', 'IN_TRADE'),
+            pos.get('tp1_price'),
+            pos.get('tp2_price'),
+            pos.get('tp3_price'),
+            pos.get('current_stop_loss'),
+            1 if pos.get('tp1_reached') else 0,
+            1 if pos.get('tp2_reached') else 0,
+            pos.get('post_tp1_decision', 'NOT_REACHED'),
+            pos.get('post_tp2_decision', 'NOT_REACHED'),
+            _iso(pos.get('tp1_reached_timestamp')),
+            _iso(pos.get('tp2_reached_timestamp')),
+            pos.get('bars_held_after_tp1', 0),
+            pos.get('bars_held_after_tp2', 0),
+            pos.get('max_extension_after_tp1', 0.0),
+            pos.get('max_extension_after_tp2', 0.0),
+            pos.get('tp1_exit_reason'),
+            pos.get('tp2_exit_reason'),
+            pos.get('trailing_sl_level'),
+            1 if pos.get('trailing_sl_enabled') else 0,
+            pos.get('price_current'),
+            pos.get('profit'),
+            pos.get('swap', 0.0),
+            pattern_info,
+            now,
+        )
+
+
+def _trade_rows(trades: Iterable[Dict], now: str) -> Iterator[Tuple]:
+    """Yield trades table parameter tuples, in _SQL_INSERT_TRADE order."""
+    for trade in trades:
+        pattern_info = trade.get('pattern_info')
+        if pattern_info is not None and not isinstance(pattern_info, str):
+            pattern_info = _json_dumps_strict(pattern_info)
+
+        yield (
+            trade.get('ticket'),
+            trade.get('entry_time'),
+            trade.get('exit_time'),
+            trade.get('entry_price'),
+            trade.get('exit_price'),
+            trade.get('stop_loss'),
+            trade.get('take_profit'),
+            trade.get('volume'),
+            trade.get('profit'),
+            trade.get('gross_pl'),
+            trade.get('commission', 0.0),
+            trade.get('swap', 0.0),
+            trade.get('net_pl'),
+            trade.get('exit_reason'),
+            1 if trade.get('is_winner') else 0,
+            pattern_info,
+            now,
+        )
+
 
 @dataclass(frozen=True)
 class Migration:
     version: int
     statements: Tuple[str, ...]
 
+    @property
+    def script(self) -> str:
+        """All statements joined into a single SQL script."""
+        return ";\n".join(statement.strip() for statement in self.statements) + ";"
+
 
 class StateDatabase:
     """SQLite-backed state storage with migrations and snapshotting."""
@@ -136,22 +478,189 @@ class StateDatabase:
                 """,
             ),
         ),
+        Migration(
+            version=3,
+            statements=(
+                """
+                CREATE INDEX IF NOT EXISTS idx_trades_created_at ON trades(created_at)
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS idx_positions_updated_at ON positions(updated_at)
+                """,
+            ),
+        ),
+        Migration(
+            version=4,
+            statements=(
+                """
+                CREATE INDEX IF NOT EXISTS idx_trades_ticket_id ON trades(ticket, id)
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS idx_trades_entry_time ON trades(entry_time)
+                """,
+            ),
+        ),
+        Migration(
+            version=5,
+            statements=(
+                # Expose the pattern neckline without decoding pattern_info
+                # in Python; VIRTUAL because ALTER TABLE cannot add STORED.
+                # json_valid guards legacy rows holding NaN tokens, which
+                # json_extract would otherwise reject on write and read
+                """
+                ALTER TABLE positions ADD COLUMN pattern_neckline REAL
+                    GENERATED ALWAYS AS (
+                        CASE WHEN json_valid(pattern_info)
+                        THEN json_extract(pattern_info, '$.neckline.price') END
+                    ) VIRTUAL
+                """,
+                """
+                ALTER TABLE trades ADD COLUMN pattern_neckline REAL
+                    GENERATED ALWAYS AS (
+                        CASE WHEN json_valid(pattern_info)
+                        THEN json_extract(pattern_info, '$.neckline.price') END
+                    ) VIRTUAL
+                """,
+            ),
+        ),
+        Migration(
+            version=6,
+            statements=(
+                # Fixed-size ring replacing the insert-and-prune snapshot table
+                """
+                CREATE TABLE IF NOT EXISTS state_snapshots_ring (
+                    slot INTEGER PRIMARY KEY,
+                    seq INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    data BLOB NOT NULL
+                )
+                """,
+                """
+                INSERT OR REPLACE INTO state_snapshots_ring (slot, seq, created_at, data)
+                SELECT 0, id, created_at, data FROM state_snapshots ORDER BY id DESC LIMIT 1
+                """,
+                """
+                DROP TABLE IF EXISTS state_snapshots
+                """,
+            ),
+        ),
     ]
+    _migrations.sort(key=lambda m: m.version)
+
+    def __init__(
+        self,
+        db_url: str,
+        logger: logging.Logger,
+        snapshot_interval_seconds: float = 60.0,
+        snapshot_every_n_saves: int = 1,
+        max_snapshots: int = 50,
+        compress_snapshots: bool = True,
+        vacuum_threshold_rows: int = 1000,
+        write_queue_size: int = 256,
+        cache_size_kb: int = 16000,
+        mmap_size: int = 268435456,
+        wal_autocheckpoint: int = 1000,
+        busy_timeout_ms: int = 5000,
+        auto_flush_interval_ms: float = 0.0,
+    ):
+        """
+        Open (or create) the database and start the background writer.
 
-    def __init__(self, db_url: str, logger: logging.Logger):
+        Args:
+            db_url: ``sqlite:///path`` URL of the database file
+            logger: Logger for persistence messages
+            snapshot_interval_seconds: Minimum gap between JSON snapshots
+            snapshot_every_n_saves: Minimum number of written saves between
+                JSON snapshots
+            max_snapshots: Number of snapshot rows to keep
+            compress_snapshots: Store snapshot JSON as a zlib-compressed BLOB
+            vacuum_threshold_rows: Pruned rows that trigger VACUUM on close
+            write_queue_size: Maximum number of queued saves
+            cache_size_kb: SQLite page cache size in KiB
+            mmap_size: Bytes of the file to memory-map; no benefit beyond
+                the expected database size
+            wal_autocheckpoint: WAL pages between automatic checkpoints
+            busy_timeout_ms: How long to wait on a locked database
+            auto_flush_interval_ms: How long the writer waits after the first
+                queued item so a burst of updates shares one transaction
+        """
         self.logger = logger
+        self.snapshot_interval_seconds = snapshot_interval_seconds
+        self.snapshot_every_n_saves = max(1, int(snapshot_every_n_saves))
+        self._saves_since_snapshot = 0
+        self.max_snapshots = max(1, int(max_snapshots))
+        self.compress_snapshots = compress_snapshots
+        self.vacuum_threshold_rows = vacuum_threshold_rows
+        self.auto_flush_interval_ms = auto_flush_interval_ms
+        self._pruned_rows = 0
+        self._last_snapshot_at = float("-inf")
+        self._pending_snapshot: Optional[Dict] = None
         self.db_path = self._parse_sqlite_url(db_url)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = sqlite3.connect(self.db_path.as_posix())
+        # Autocommit mode: write paths open explicit BEGIN IMMEDIATE transactions
+        self.connection = sqlite3.connect(
+            self.db_path.as_posix(),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS,
+        )
         self.connection.row_factory = sqlite3.Row
         
         # Enable WAL mode for better crash safety and concurrency
         self.connection.execute("PRAGMA journal_mode=WAL")
         self.connection.execute("PRAGMA synchronous=NORMAL")  # Balance between safety and speed
-        self.connection.commit()
+        self.connection.execute("PRAGMA temp_store=MEMORY")
+        self.connection.execute(f"PRAGMA cache_size=-{int(cache_size_kb)}")
+        self.connection.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self.connection.execute(f"PRAGMA wal_autocheckpoint={int(wal_autocheckpoint)}")
+        self.connection.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
         
+        # Number of trade_history rows known to be in the trades table, in
+        # order. None until this instance has loaded or rewritten them.
+        self._persisted_trade_count: Optional[int] = None
+
+        # update_position SQL and value coercers, keyed by updated field set
+        self._update_stmt_cache: Dict[frozenset, Tuple[str, Tuple[str, ...], Tuple]] = {}
+
+        # Serializes connection use between the writer thread and callers
+        self._conn_lock = threading.RLock()
+
         self._apply_migrations()
 
+        # Snapshots live in a fixed ring of max_snapshots slots
+        self._snapshot_seq = self.connection.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM state_snapshots_ring"
+        ).fetchone()[0]
+        self._prune_snapshots()
+
+        # Remember an empty database so cold-start loads skip the queries
+        self._has_any_data = bool(self.connection.execute(_SQL_HAS_DATA).fetchone()[0])
+
+        # Read-only connection for load paths. Under WAL it reads the last
+        # committed state without blocking, or being blocked by, the
+        # writer; all writes still go through self.connection.
+        self.ro_connection = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        self.ro_connection.row_factory = sqlite3.Row
+        self.ro_connection.execute(f"PRAGMA cache_size=-{int(cache_size_kb)}")
+        self.ro_connection.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self.ro_connection.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._read_lock = threading.RLock()
+
+        self._write_queue: queue.Queue = queue.Queue(maxsize=write_queue_size)
+        self._write_error: Optional[Exception] = None  # Last failed background write
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name="StateDatabaseWriter",
+            daemon=True,
+        )
+        self._writer.start()
+
     @staticmethod
     def _parse_sqlite_url(db_url: str) -> Path:
         if not db_url:
@@ -162,132 +671,109 @@ class StateDatabase:
             return Path(db_url.replace("sqlite://", "", 1))
         raise ValueError(f"Unsupported database URL: {db_url}")
 
+    def _execute_tuples(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        """Execute a read on a ro_connection cursor that returns plain tuples."""
+        cursor = self.ro_connection.cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
+
     def _apply_migrations(self) -> None:
-        with self.connection:
-            for migration in self._migrations:
-                if self._is_migration_applied(migration.version):
-                    continue
-                for statement in migration.statements:
-                    self.connection.execute(statement)
+        try:
+            row = self.connection.execute(
+                "SELECT COALESCE(MAX(version), 0) FROM schema_migrations"
+            ).fetchone()
+            current_version = row[0]
+        except sqlite3.OperationalError:
+            # schema_migrations table doesn't exist yet
+            current_version = 0
+
+        pending = [m for m in self._migrations if m.version > current_version]
+        for migration in pending:
+            try:
+                # One call per migration; the script opens the transaction and
+                # the bookkeeping row is committed together with the DDL.
+                self.connection.executescript("BEGIN IMMEDIATE;\n" + migration.script)
                 self.connection.execute(
                     "INSERT INTO schema_migrations (version, applied_at) VALUES (?, ?)",
                     (migration.version, datetime.utcnow().isoformat()),
                 )
-                self.logger.info("Applied DB migration v%s", migration.version)
-
-    def _is_migration_applied(self, version: int) -> bool:
-        try:
-            cursor = self.connection.execute(
-                "SELECT 1 FROM schema_migrations WHERE version = ?",
-                (version,),
-            )
-            return cursor.fetchone() is not None
-        except sqlite3.OperationalError:
-            # schema_migrations table doesn't exist yet
-            return False
+                self.connection.commit()
+            except sqlite3.Error:
+                if self.connection.in_transaction:
+                    self.connection.rollback()
+                raise
+            self.logger.info("Applied DB migration v%s", migration.version)
 
     def has_data(self) -> bool:
-        cursor = self.connection.execute("SELECT 1 FROM state_snapshots LIMIT 1")
-        if cursor.fetchone() is not None:
-            return True
-        cursor = self.connection.execute("SELECT 1 FROM positions LIMIT 1")
-        if cursor.fetchone() is not None:
-            return True
-        cursor = self.connection.execute("SELECT 1 FROM trades LIMIT 1")
-        return cursor.fetchone() is not None
+        self._wait_for_writes()
+        with self._read_lock:
+            row = self._execute_tuples(_SQL_HAS_DATA).fetchone()
+        self._has_any_data = bool(row[0])
+        return self._has_any_data
 
     def load_latest_snapshot(self) -> Optional[Dict]:
         """Load latest state from database with proper column mapping."""
-        # Try to load from structured tables first
-        state_data = self._load_from_tables()
-        if state_data:
-            return state_data
-        
-        # Fallback to snapshot if no structured data
-        cursor = self.connection.execute(
-            "SELECT data FROM state_snapshots ORDER BY id DESC LIMIT 1"
-        )
-        row = cursor.fetchone()
-        if not row:
+        if not self._has_any_data:
             return None
-        return json.loads(row["data"])
+        self._wait_for_writes()
+        with self._read_lock:
+            # One read transaction so tables and snapshot are consistent
+            self.ro_connection.execute("BEGIN")
+            try:
+                # Try to load from structured tables first
+                state_data = self._load_from_tables()
+                if state_data:
+                    return state_data
+
+                # Fallback to snapshot if no structured data
+                cursor = self.ro_connection.execute(
+                    _SQL_SELECT_LATEST_SNAPSHOT
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                snapshot = _decode_snapshot(row["data"])
+                if snapshot.get("version", 1) < _SNAPSHOT_FORMAT_VERSION:
+                    # Legacy snapshot holding the complete state
+                    return snapshot
+                return self._expand_snapshot(snapshot)
+            finally:
+                self.ro_connection.execute("COMMIT")
+
+    def _expand_snapshot(self, snapshot: Dict) -> Dict:
+        """Rebuild full state from a compact snapshot plus the tables."""
+        state_data = {
+            key: snapshot.get(key)
+            for key in (
+                'last_trade_time',
+                'total_trades',
+                'winning_trades',
+                'losing_trades',
+                'total_profit',
+                'last_regime_state',
+                'saved_at',
+            )
+        }
+        state_data['open_positions'] = self._load_positions()
+        state_data['trade_history'] = self._load_trades()
+        return state_data
 
     def _load_from_tables(self) -> Optional[Dict]:
         """Load state from structured tables."""
         # Check if trading_state exists
-        cursor = self.connection.execute("SELECT * FROM trading_state WHERE id = 1")
+        cursor = self.ro_connection.execute(_SQL_SELECT_TRADING_STATE)
         state_row = cursor.fetchone()
         
         if not state_row:
             return None
         
-        # Load positions
-        positions = []
-        cursor = self.connection.execute("SELECT * FROM positions")
-        for row in cursor.fetchall():
-            pos = {
-                'ticket': row['ticket'],
-                'entry_price': row['entry_price'],
-                'stop_loss': row['stop_loss'],
-                'take_profit': row['take_profit'],
-                'volume': row['volume'],
-                'entry_time': row['entry_time'],
-                'direction': row['direction'],
-                'atr': row['atr'],
-                'tp_state': row['tp_state'],
-                'tp1_price': row['tp1_price'],
-                'tp2_price': row['tp2_price'],
-                'tp3_price': row['tp3_price'],
-                'current_stop_loss': row['current_stop_loss'],
-                'tp1_reached': bool(row['tp1_reached']),
-                'tp2_reached': bool(row['tp2_reached']),
-                'post_tp1_decision': row['post_tp1_decision'],
-                'post_tp2_decision': row['post_tp2_decision'],
-                'tp1_reached_timestamp': row['tp1_reached_timestamp'],
-                'tp2_reached_timestamp': row['tp2_reached_timestamp'],
-                'bars_held_after_tp1': row['bars_held_after_tp1'],
-                'bars_held_after_tp2': row['bars_held_after_tp2'],
-                'max_extension_after_tp1': row['max_extension_after_tp1'],
-                'max_extension_after_tp2': row['max_extension_after_tp2'],
-                'tp1_exit_reason': row['tp1_exit_reason'],
-                'tp2_exit_reason': row['tp2_exit_reason'],
-                'trailing_sl_level': row['trailing_sl_level'],
-                'trailing_sl_enabled': bool(row['trailing_sl_enabled']),
-                'price_current': row['price_current'],
-                'profit': row['profit'],
-                'swap': row['swap'],
-                'pattern_info': json.loads(row['pattern_info']) if row['pattern_info'] else None,
-            }
-            positions.append(pos)
-        
-        # Load trades
-        trades = []
-        cursor = self.connection.execute("SELECT * FROM trades ORDER BY id")
-        for row in cursor.fetchall():
-            trade = {
-                'ticket': row['ticket'],
-                'entry_time': row['entry_time'],
-                'exit_time': row['exit_time'],
-                'entry_price': row['entry_price'],
-                'exit_price': row['exit_price'],
-                'stop_loss': row['stop_loss'],
-                'take_profit': row['take_profit'],
-                'volume': row['volume'],
-                'profit': row['profit'],
-                'gross_pl': row['gross_pl'],
-                'commission': row['commission'],
-                'swap': row['swap'],
-                'net_pl': row['net_pl'],
-                'exit_reason': row['exit_reason'],
-                'is_winner': bool(row['is_winner']),
-                'pattern_info': json.loads(row['pattern_info']) if row['pattern_info'] else None,
-            }
-            trades.append(trade)
+        positions = self._load_positions()
+        trades = self._load_trades()
         
         # Build state data
         last_regime = state_row['last_regime_state']
         if last_regime:
-            last_regime = json.loads(last_regime)
+            last_regime = _json_loads(last_regime)
         
         return {
             'open_positions': positions,
@@ -301,58 +787,299 @@ class StateDatabase:
             'saved_at': state_row['saved_at'],
         }
 
-    def save_state(self, state_data: Dict) -> None:
-        """Save complete state to database with proper column mapping."""
+    def _load_positions(self) -> List[Dict]:
+        """Load open positions from the positions table."""
+        cursor = self._execute_tuples(_SQL_SELECT_POSITIONS)
+        return [_position_from_row(row) for row in cursor.fetchall()]
+
+    def _load_trades(self) -> List[Dict]:
+        """Load trade history from the trades table, oldest first."""
+        cursor = self._execute_tuples(_SQL_SELECT_TRADES)
+        trades = []
+        while True:
+            chunk = cursor.fetchmany(_FETCH_CHUNK_ROWS)
+            if not chunk:
+                break
+            trades.extend(_trade_from_row(row) for row in chunk)
+        with self._conn_lock:
+            # A watermark set by the writer is newer than this read
+            if self._persisted_trade_count is None:
+                self._persisted_trade_count = len(trades)
+        return trades
+
+    def iter_trades(self) -> Iterator[Dict]:
+        """
+        Yield persisted trades oldest first without building the full list.
+
+        Rows are fetched in chunks, so memory stays bounded for long
+        histories. Use this when a caller only aggregates over trades.
+        """
+        self._wait_for_writes()
+        with self._read_lock:
+            cursor = self._execute_tuples(_SQL_SELECT_TRADES)
+        while True:
+            with self._read_lock:
+                chunk = cursor.fetchmany(_FETCH_CHUNK_ROWS)
+            if not chunk:
+                return
+            for row in chunk:
+                yield _trade_from_row(row)
+
+    def save_state(self, state_data: Dict, dirty_tickets: Optional[set] = None) -> None:
+        """
+        Queue complete state for the background writer.
+
+        Saves queued faster than they are written are coalesced into the
+        most recent one. Use ``flush()`` to wait until queued saves are on disk.
+
+        Raises:
+            Exception: The error of an earlier background write that failed;
+                this state is still queued, so the next write retries it
+        """
+        dirty = set(dirty_tickets) if dirty_tickets is not None else None
+        self._has_any_data = True
+        # Blocks only while the writer is behind by a full queue
+        self._write_queue.put((_OP_SAVE, state_data, dirty))
+        self._raise_write_error()
+
+    def flush(self) -> None:
+        """
+        Block until every queued save and update has been written.
+
+        Raises:
+            Exception: The error of a background write that failed since
+                the last save_state() or flush()
+        """
+        self._wait_for_writes()
+        self._raise_write_error()
+
+    def _wait_for_writes(self) -> None:
+        """Block until the write queue is drained, without reporting errors."""
+        if self._writer.is_alive():
+            self._write_queue.join()
+
+    def _raise_write_error(self) -> None:
+        """Re-raise (once) the last error recorded by the writer thread."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _writer_loop(self) -> None:
+        """
+        Drain queued work and write each batch in one transaction.
+
+        Only the latest save of a batch is written. Position updates keep
+        their order relative to it: those queued before it are applied
+        first (a dirty-ticket save may not rewrite them), later ones after.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            if self.auto_flush_interval_ms > 0 and batch[0] is not _WRITER_STOP:
+                time.sleep(self.auto_flush_interval_ms / 1000.0)
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            latest = None
+            dirty: Optional[set] = set()
+            pre_updates: List[Tuple] = []
+            post_updates: List[Tuple] = []
+            for item in batch:
+                if item is _WRITER_STOP:
+                    stop = True
+                    continue
+                kind, payload, extra = item
+                if kind == _OP_SAVE:
+                    latest = payload
+                    dirty = _merge_dirty(dirty, extra)
+                    pre_updates.extend(post_updates)
+                    post_updates = []
+                else:
+                    post_updates.append((payload, extra))
+
+            if latest is not None or post_updates:
+                try:
+                    self._write_state(latest, dirty, pre_updates, post_updates)
+                except Exception as exc:
+                    # Already logged by _write_state; reported to the caller
+                    # by the next save_state() or flush()
+                    self._write_error = exc
+
+            for _ in batch:
+                self._write_queue.task_done()
+            if stop:
+                return
+
+    def _write_state(
+        self,
+        state_data: Optional[Dict],
+        dirty_tickets: Optional[set] = None,
+        pre_updates: Iterable[Tuple] = (),
+        post_updates: Iterable[Tuple] = (),
+    ) -> None:
+        """
+        Save complete state to database with proper column mapping.
+
+        ``pre_updates`` / ``post_updates`` are queued ``update_position``
+        statements applied in the same transaction before and after the
+        state rows; ``state_data`` may be None for an update-only batch.
+
+        Positions are upserted (only ``dirty_tickets`` when provided) and rows
+        for closed tickets are deleted; trades are append-only, so only rows
+        past the persisted watermark are inserted. The JSON snapshot is
+        debounced to one row per ``snapshot_interval_seconds`` and
+        ``snapshot_every_n_saves``.
+        """
         now = datetime.utcnow().isoformat()
         
         # Use explicit transaction for atomicity
-        try:
-            self.connection.execute("BEGIN IMMEDIATE")
-            
-            # Save positions with full column mapping
-            self.connection.execute("DELETE FROM positions")
-            self._insert_positions_v2(state_data.get("open_positions", []), now)
-            
-            # Save trades with full column mapping
-            self.connection.execute("DELETE FROM trades")
-            self._insert_trades_v2(state_data.get("trade_history", []), now)
-            
-            # Save trading state metadata
-            self.connection.execute("DELETE FROM trading_state")
-            self._insert_trading_state(state_data, now)
-            
-            # Keep snapshot for backup
-            self.connection.execute(
-                "INSERT INTO state_snapshots (created_at, data) VALUES (?, ?)",
-                (now, json.dumps(state_data, cls=SafeJSONEncoder)),
-            )
+        with self._conn_lock:
+            try:
+                self.connection.execute("BEGIN IMMEDIATE")
+                self._apply_position_updates(pre_updates)
+                snapshot_due = False
+                if state_data is not None:
+                    snapshot_due = self._write_state_rows(state_data, dirty_tickets, now)
+                self._apply_position_updates(post_updates)
             
-            # Commit transaction
-            self.connection.commit()
+                # Commit transaction
+                self.connection.commit()
+                if state_data is not None:
+                    self._persisted_trade_count = len(state_data.get("trade_history", []))
+                    if snapshot_due:
+                        self._last_snapshot_at = time.monotonic()
+                        self._saves_since_snapshot = 0
+                        self._pending_snapshot = None
+                    else:
+                        self._pending_snapshot = state_data
             
-        except Exception as e:
-            # Rollback on error
-            self.connection.rollback()
-            self.logger.error(f"Failed to save state to database: {e}")
-            raise
+            except Exception as e:
+                # Rollback on error
+                self.connection.rollback()
+                self.logger.error(f"Failed to save state to database: {e}")
+                raise
+
+    def _write_state_rows(self, state_data: Dict, dirty_tickets: Optional[set], now: str) -> bool:
+        """
+        Write positions, trades, metadata and a due snapshot.
+
+        Must run inside an open transaction.
+
+        Returns:
+            True if a snapshot row was written
+        """
+        positions = state_data.get("open_positions", [])
+        trades = state_data.get("trade_history", [])
+        trade_count = len(trades)
+
+        # Upsert changed positions and drop the ones that were closed
+        current_tickets = tuple({pos.get('ticket') for pos in positions})
+        if dirty_tickets is not None:
+            existing_tickets = {
+                row[0] for row in self.connection.execute(_SQL_SELECT_POSITION_TICKETS)
+            }
+        if not current_tickets:
+            self.connection.execute(_SQL_DELETE_ALL_POSITIONS)
+        else:
+            self.connection.execute(_sql_delete_closed_positions(len(current_tickets)), current_tickets)
+        if dirty_tickets is not None:
+            positions = [
+                pos for pos in positions
+                if pos.get('ticket') in dirty_tickets or pos.get('ticket') not in existing_tickets
+            ]
+        self._insert_positions_v2(positions, now)
+
+        # Trade history is append-only; rewrite only if unknown or shrunk (reset)
+        persisted_trades = self._persisted_trade_count
+        if persisted_trades is None or trade_count < persisted_trades:
+            self.connection.execute(_SQL_DELETE_ALL_TRADES)
+            persisted_trades = 0
+        self._insert_trades_v2(trades[persisted_trades:trade_count], now)
+
+        # Save trading state metadata
+        self._insert_trading_state(state_data, now)
+
+        # Keep a debounced snapshot for backup
+        self._saves_since_snapshot += 1
+        snapshot_due = (
+            self._saves_since_snapshot >= self.snapshot_every_n_saves
+            and time.monotonic() - self._last_snapshot_at >= self.snapshot_interval_seconds
+        )
+        if snapshot_due:
+            self._insert_snapshot(state_data, now)
+        return snapshot_due
+
+    def _apply_position_updates(self, updates: Iterable[Tuple]) -> None:
+        """Run queued position UPDATE statements inside the open transaction."""
+        for ticket, (query, values) in updates:
+            try:
+                self.connection.execute(query, values)
+            except sqlite3.Error as e:
+                # A bad update must not roll back the rest of the batch
+                self.logger.error(f"Failed to update position {ticket}: {e}")
+
+    def _insert_snapshot(self, state_data: Dict, now: str) -> None:
+        """
+        Insert a compact snapshot of the state and prune old ones.
+
+        Positions and trades already live in their own tables, so the
+        snapshot only keeps counters and metadata (constant size regardless
+        of trade history); load_latest_snapshot rebuilds the rest.
+        """
+        snapshot = {
+            'version': _SNAPSHOT_FORMAT_VERSION,
+            'open_count': len(state_data.get('open_positions', [])),
+            'trade_count': len(state_data.get('trade_history', [])),
+            'last_trade_time': state_data.get('last_trade_time'),
+            'total_trades': state_data.get('total_trades', 0),
+            'winning_trades': state_data.get('winning_trades', 0),
+            'losing_trades': state_data.get('losing_trades', 0),
+            'total_profit': state_data.get('total_profit', 0.0),
+            'last_regime_state': state_data.get('last_regime_state'),
+            'saved_at': now,
+        }
+        # Overwrite the oldest ring slot; no DELETE or table growth
+        seq = self._snapshot_seq + 1
+        self.connection.execute(
+            _SQL_INSERT_SNAPSHOT,
+            (seq % self.max_snapshots, seq, now, self._encode_snapshot(snapshot)),
+        )
+        self._snapshot_seq = seq
+
+    def _encode_snapshot(self, snapshot: Dict):
+        """Serialize a snapshot, compressed to a BLOB when enabled."""
+        data = _json_dumps(snapshot)
+        if self.compress_snapshots:
+            return zlib.compress(data.encode("utf-8"), _SNAPSHOT_COMPRESS_LEVEL)
+        return data
+
+    def _prune_snapshots(self) -> None:
+        """Keep the newest ``max_snapshots`` snapshots, slotted as ``seq % max_snapshots``."""
+        self.connection.execute("BEGIN IMMEDIATE")
+        with self.connection:
+            cursor = self.connection.execute(_SQL_PRUNE_SNAPSHOTS, (self.max_snapshots,))
+            pruned = max(cursor.rowcount, 0)
+            if pruned:
+                reset_slots, assign_slots = _SQL_RESLOT_SNAPSHOTS
+                self.connection.execute(reset_slots)
+                self.connection.execute(assign_slots, (self.max_snapshots,))
+        self._pruned_rows += pruned
 
     def _insert_trading_state(self, state_data: Dict, now: str) -> None:
         """Insert trading state metadata."""
         last_regime = state_data.get("last_regime_state")
         self.connection.execute(
-            """
-            INSERT INTO trading_state (
-                id, last_trade_time, total_trades, winning_trades, 
-                losing_trades, total_profit, last_regime_state, saved_at
-            ) VALUES (1, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_UPSERT_TRADING_STATE,
             (
                 state_data.get("last_trade_time"),
                 state_data.get("total_trades", 0),
                 state_data.get("winning_trades", 0),
                 state_data.get("losing_trades", 0),
                 state_data.get("total_profit", 0.0),
-                json.dumps(last_regime) if last_regime else None,
+                _json_dumps(last_regime) if last_regime else None,
                 now,
             ),
         )
@@ -361,202 +1088,121 @@ class StateDatabase:
         """Insert positions with proper column mapping."""
         if not positions:
             return
-        
-        for pos in positions:
-            # Handle entry_time conversion
-            entry_time = pos.get('entry_time')
-            if isinstance(entry_time, datetime):
-                entry_time = entry_time.isoformat()
-            
-            # Handle timestamps
-            tp1_ts = pos.get('tp1_reached_timestamp')
-            if isinstance(tp1_ts, datetime):
-                tp1_ts = tp1_ts.isoformat()
-            tp2_ts = pos.get('tp2_reached_timestamp')
-            if isinstance(tp2_ts, datetime):
-                tp2_ts = tp2_ts.isoformat()
-            
-            pattern_info = pos.get('pattern_info')
-            if pattern_info is not None and not isinstance(pattern_info, str):
-                pattern_info = json.dumps(pattern_info, cls=SafeJSONEncoder)
-            
-            self.connection.execute(
-                """
-                INSERT INTO positions (
-                    ticket, entry_price, stop_loss, take_profit, volume, entry_time,
-                    direction, atr, tp_state, tp1_price, tp2_price, tp3_price,
-                    current_stop_loss, tp1_reached, tp2_reached, post_tp1_decision,
-                    post_tp2_decision, tp1_reached_timestamp, tp2_reached_timestamp,
-                    bars_held_after_tp1, bars_held_after_tp2, max_extension_after_tp1,
-                    max_extension_after_tp2, tp1_exit_reason, tp2_exit_reason,
-                    trailing_sl_level, trailing_sl_enabled, price_current, profit,
-                    swap, pattern_info, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    pos.get('ticket'),
-                    pos.get('entry_price'),
-                    pos.get('stop_loss'),
-                    pos.get('take_profit'),
-                    pos.get('volume'),
-                    entry_time,
-                    pos.get('direction', 1),
-                    pos.get('atr'),
-                    pos.get('tp_state', 'IN_TRADE'),
-                    pos.get('tp1_price'),
-                    pos.get('tp2_price'),
-                    pos.get('tp3_price'),
-                    pos.get('current_stop_loss'),
-                    1 if pos.get('tp1_reached') else 0,
-                    1 if pos.get('tp2_reached') else 0,
-                    pos.get('post_tp1_decision', 'NOT_REACHED'),
-                    pos.get('post_tp2_decision', 'NOT_REACHED'),
-                    tp1_ts,
-                    tp2_ts,
-                    pos.get('bars_held_after_tp1', 0),
-                    pos.get('bars_held_after_tp2', 0),
-                    pos.get('max_extension_after_tp1', 0.0),
-                    pos.get('max_extension_after_tp2', 0.0),
-                    pos.get('tp1_exit_reason'),
-                    pos.get('tp2_exit_reason'),
-                    pos.get('trailing_sl_level'),
-                    1 if pos.get('trailing_sl_enabled') else 0,
-                    pos.get('price_current'),
-                    pos.get('profit'),
-                    pos.get('swap', 0.0),
-                    pattern_info,
-                    now,
-                ),
-            )
+        self.connection.executemany(_SQL_UPSERT_POSITION, _position_rows(positions, now))
 
     def _insert_trades_v2(self, trades: Iterable[Dict], now: str) -> None:
         """Insert trades with proper column mapping."""
         if not trades:
             return
-        
-        for trade in trades:
-            pattern_info = trade.get('pattern_info')
-            if pattern_info is not None and not isinstance(pattern_info, str):
-                pattern_info = json.dumps(pattern_info, cls=SafeJSONEncoder)
-            
-            self.connection.execute(
-                """
-                INSERT INTO trades (
-                    ticket, entry_time, exit_time, entry_price, exit_price,
-                    stop_loss, take_profit, volume, profit, gross_pl, commission,
-                    swap, net_pl, exit_reason, is_winner, pattern_info, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    trade.get('ticket'),
-                    trade.get('entry_time'),
-                    trade.get('exit_time'),
-                    trade.get('entry_price'),
-                    trade.get('exit_price'),
-                    trade.get('stop_loss'),
-                    trade.get('take_profit'),
-                    trade.get('volume'),
-                    trade.get('profit'),
-                    trade.get('gross_pl'),
-                    trade.get('commission', 0.0),
-                    trade.get('swap', 0.0),
-                    trade.get('net_pl'),
-                    trade.get('exit_reason'),
-                    1 if trade.get('is_winner') else 0,
-                    pattern_info,
-                    now,
-                ),
-            )
+        self.connection.executemany(_SQL_INSERT_TRADE, _trade_rows(trades, now))
     
     def get_position_by_ticket(self, ticket: int) -> Optional[Dict]:
         """Get specific position by ticket."""
-        cursor = self.connection.execute(
-            "SELECT * FROM positions WHERE ticket = ?", (ticket,)
-        )
-        row = cursor.fetchone()
+        self._wait_for_writes()
+        with self._read_lock:
+            row = self._execute_tuples(_SQL_SELECT_POSITION, (ticket,)).fetchone()
         if not row:
             return None
-        
-        return {
-            'ticket': row['ticket'],
-            'entry_price': row['entry_price'],
-            'stop_loss': row['stop_loss'],
-            'take_profit': row['take_profit'],
-            'volume': row['volume'],
-            'entry_time': row['entry_time'],
-            'direction': row['direction'],
-            'atr': row['atr'],
-            'tp_state': row['tp_state'],
-            'tp1_price': row['tp1_price'],
-            'tp2_price': row['tp2_price'],
-            'tp3_price': row['tp3_price'],
-            'current_stop_loss': row['current_stop_loss'],
-            'tp1_reached': bool(row['tp1_reached']),
-            'tp2_reached': bool(row['tp2_reached']),
-            'post_tp1_decision': row['post_tp1_decision'],
-            'post_tp2_decision': row['post_tp2_decision'],
-            'tp1_reached_timestamp': row['tp1_reached_timestamp'],
-            'tp2_reached_timestamp': row['tp2_reached_timestamp'],
-            'bars_held_after_tp1': row['bars_held_after_tp1'],
-            'bars_held_after_tp2': row['bars_held_after_tp2'],
-            'max_extension_after_tp1': row['max_extension_after_tp1'],
-            'max_extension_after_tp2': row['max_extension_after_tp2'],
-            'tp1_exit_reason': row['tp1_exit_reason'],
-            'tp2_exit_reason': row['tp2_exit_reason'],
-            'trailing_sl_level': row['trailing_sl_level'],
-            'trailing_sl_enabled': bool(row['trailing_sl_enabled']),
-            'price_current': row['price_current'],
-            'profit': row['profit'],
-            'swap': row['swap'],
-            'pattern_info': json.loads(row['pattern_info']) if row['pattern_info'] else None,
-        }
+        return _position_from_row(row)
     
-    def update_position(self, ticket: int, updates: Dict) -> bool:
-        """Update specific fields of a position by ticket."""
+    def update_position(self, ticket: int, updates: Dict, flush: bool = False) -> bool:
+        """
+        Update specific fields of a position by ticket.
+
+        By default the update is queued for the background writer, which
+        applies a burst of updates in one transaction; call ``flush()`` to
+        wait for it.
+
+        Args:
+            ticket: Position ticket
+            updates: Column values to set
+            flush: Write synchronously and report whether the row exists
+
+        Returns:
+            True if queued (or, with ``flush``, if a row was updated)
+        """
         if not updates:
             return False
         
-        # Build dynamic UPDATE query
-        fields = []
-        values = []
-        for key, value in updates.items():
-            if key == 'ticket':  # Don't update primary key
-                continue
-            
-            # Handle boolean fields
-            if key in ('tp1_reached', 'tp2_reached', 'trailing_sl_enabled'):
-                value = 1 if value else 0
-            
-            # Handle datetime fields
-            if isinstance(value, datetime):
-                value = value.isoformat()
-            
-            # Handle pattern_info JSON
-            if key == 'pattern_info' and value is not None and not isinstance(value, str):
-                value = json.dumps(value, cls=SafeJSONEncoder)
-            
-            fields.append(f"{key} = ?")
-            values.append(value)
-        
-        if not fields:
+        key = frozenset(updates) - {'ticket'}  # Don't update primary key
+        if not key:
             return False
         
-        # Add updated_at
-        fields.append("updated_at = ?")
+        # One prepared statement per distinct field set
+        cached = self._update_stmt_cache.get(key)
+        if cached is None:
+            columns = tuple(sorted(key))
+            fields = ", ".join(f"{col} = ?" for col in columns)
+            cached = (
+                f"UPDATE positions SET {fields}, updated_at = ? WHERE ticket = ?",
+                columns,
+                tuple(_UPDATE_COERCERS.get(col, _iso) for col in columns),
+            )
+            self._update_stmt_cache[key] = cached
+        query, columns, coercers = cached
+        
+        values = [coerce(updates[col]) for col, coerce in zip(columns, coercers)]
         values.append(datetime.utcnow().isoformat())
         values.append(ticket)
         
-        query = f"UPDATE positions SET {', '.join(fields)} WHERE ticket = ?"
-        
-        try:
-            self.connection.execute("BEGIN IMMEDIATE")
-            cursor = self.connection.execute(query, values)
-            self.connection.commit()
-            return cursor.rowcount > 0
-        except Exception as e:
-            self.connection.rollback()
-            self.logger.error(f"Failed to update position {ticket}: {e}")
-            return False
+        if not flush:
+            # Applied by the writer, batched with other queued work
+            self._write_queue.put((_OP_UPDATE, ticket, (query, values)))
+            return True
+
+        # Queued full saves must land first so they cannot overwrite this update
+        self._wait_for_writes()
+        with self._conn_lock:
+            try:
+                self.connection.execute("BEGIN IMMEDIATE")
+                cursor = self.connection.execute(query, values)
+                self.connection.commit()
+                return cursor.rowcount > 0
+            except Exception as e:
+                self.connection.rollback()
+                self.logger.error(f"Failed to update position {ticket}: {e}")
+                return False
+
+    def update_position_prices(
+        self,
+        ticket: int,
+        price_current: float,
+        profit: float,
+        updated_at: Optional[str] = None,
+    ) -> None:
+        """
+        Queue a per-tick price/profit update for a position.
+
+        Fast path for the most frequent update: a fixed statement with no
+        per-field coercion. Use ``update_position`` for any other fields.
+
+        Args:
+            ticket: Position ticket
+            price_current: Latest market price
+            profit: Floating profit
+            updated_at: ISO timestamp; defaults to now (UTC)
+        """
+        values = (price_current, profit, updated_at or datetime.utcnow().isoformat(), ticket)
+        self._write_queue.put((_OP_UPDATE, ticket, (_SQL_UPDATE_POSITION_PRICES, values)))
+
+    # Async shims: run blocking calls in a worker thread so an event loop
+    # never waits on SQLite. Writes are still serialized by the writer thread.
+
+    async def load_latest_snapshot_async(self) -> Optional[Dict]:
+        """Async wrapper for load_latest_snapshot()."""
+        return await asyncio.to_thread(self.load_latest_snapshot)
+
+    async def save_state_async(self, state_data: Dict, dirty_tickets: Optional[set] = None) -> None:
+        """Async wrapper for save_state(); blocks only if the write queue is full."""
+        await asyncio.to_thread(self.save_state, state_data, dirty_tickets)
+
+    async def update_position_async(self, ticket: int, updates: Dict, flush: bool = False) -> bool:
+        """Async wrapper for update_position()."""
+        return await asyncio.to_thread(self.update_position, ticket, updates, flush)
+
+    async def flush_async(self) -> None:
+        """Async wrapper for flush()."""
+        await asyncio.to_thread(self.flush)
 
     def _insert_positions(self, positions: Iterable[Dict], now: str) -> None:
         """Legacy method - redirects to v2."""
@@ -568,13 +1214,42 @@ class StateDatabase:
 
     def close(self) -> None:
         """Close database connection gracefully."""
+        # Let the writer finish queued saves, then stop it
+        if self._writer.is_alive():
+            self._write_queue.put(_WRITER_STOP)
+            self._writer.join()
+
         try:
-            # Ensure any pending transaction is committed
-            try:
-                self.connection.commit()
-            except sqlite3.Error:
-                pass  # May already be committed
+            # Commit only a transaction someone left open (e.g. a script
+            # writing through db.connection); the normal paths commit themselves
+            if self.connection.in_transaction:
+                try:
+                    self.connection.commit()
+                except sqlite3.Error as exc:
+                    self.logger.error("Failed to commit open transaction on close: %s", exc)
+
+            # Persist the last debounced snapshot so the backup is current
+            if self._pending_snapshot is not None:
+                try:
+                    self.connection.execute("BEGIN IMMEDIATE")
+                    with self.connection:
+                        self._insert_snapshot(
+                            self._pending_snapshot, datetime.utcnow().isoformat()
+                        )
+                    self._pending_snapshot = None
+                except sqlite3.Error as exc:
+                    self.logger.warning("Failed to write final state snapshot: %s", exc)
+
+            # Reclaim pages freed by snapshot pruning
+            if self._pruned_rows >= self.vacuum_threshold_rows:
+                try:
+                    self.connection.execute("VACUUM")
+                    self.logger.info("Database vacuumed after pruning %s snapshots", self._pruned_rows)
+                    self._pruned_rows = 0
+                except sqlite3.Error as exc:
+                    self.logger.warning("Database VACUUM failed: %s", exc)
             
+            self.ro_connection.close()
             self.connection.close()
             self.logger.info("Database connection closed")
         except sqlite3.Error as exc:
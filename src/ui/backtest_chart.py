@@ -14,31 +14,162 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
     QSlider, QComboBox, QCheckBox, QGroupBox
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QRectF, QPointF
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont
-
-try:
-    from PySide6.QtCharts import (
-        QChart, QChartView, QLineSeries, QValueAxis, QDateTimeAxis, QScatterSeries
-    )
-    HAS_CHART = True
-except ImportError:
-    HAS_CHART = False
-    QChart = None
-    QChartView = None
-    QLineSeries = None
-    QValueAxis = None
-    QDateTimeAxis = None
-    QScatterSeries = None
+from PySide6.QtCore import Qt, QTimer, Signal, QRectF, QPointF, QDateTime
+from PySide6.QtGui import QPainter, QPainterPath, QColor, QPen, QBrush, QFont
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import logging
+import time
+
+
+# Trade marker kinds, used to index the lookup tables below
+MARKER_ENTRY = 0
+MARKER_EXIT = 1
+MARKER_SL = 2
+MARKER_TP = 3
+
+# ARGB colors and labels per marker kind
+MARKER_COLORS = np.array([0xFF00E676, 0xFFFF5252, 0xFFFF1744, 0xFFFFD600], dtype=np.uint32)
+MARKER_LABELS = ("Entry", "Exit", "SL", "TP")
+
+# Candlestick overlay colors
+CANDLE_BULL_COLOR = "#26A69A"
+CANDLE_BEAR_COLOR = "#EF5350"
+CANDLE_WICK_COLOR = "#9E9E9E"
+
+# Max points pushed into a line series; ~2x the horizontal pixels of a chart
+MAX_SERIES_POINTS = 2000
+
+# Playback: one bar per PLAYBACK_BASE_INTERVAL_MS at 1x, rendered at a fixed frame rate
+PLAYBACK_BASE_INTERVAL_MS = 500
+PLAYBACK_FRAME_MS = 16
+
+
+# PySide6.QtCharts, imported on first use (False once known to be missing)
+_CHART_MOD = None
+
+
+def _lazy_import_charts():
+    """Return the PySide6.QtCharts module, or None if it is not installed."""
+    global _CHART_MOD
+    if _CHART_MOD is None:
+        try:
+            from PySide6 import QtCharts
+            _CHART_MOD = QtCharts
+        except ImportError:
+            _CHART_MOD = False
+    return _CHART_MOD or None
+
+
+def __getattr__(name):
+    # HAS_CHART and BacktestChartView resolve lazily so importing this
+    # module doesn't pull in QtCharts
+    if name == "HAS_CHART":
+        return _lazy_import_charts() is not None
+    if name == "BacktestChartView":
+        return _backtest_chart_view_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _epoch_ms(values) -> np.ndarray:
+    """Convert datetime-like values to int64 epoch milliseconds (NaT -> min int64)."""
+    times = pd.to_datetime(pd.Series(values))
+    if times.dt.tz is not None:
+        times = times.dt.tz_convert("UTC").dt.tz_localize(None)
+    return times.to_numpy(dtype="datetime64[ms]").astype(np.int64)
+
+
+def _decimate_minmax(values: np.ndarray, target: int = MAX_SERIES_POINTS) -> np.ndarray:
+    """
+    Indices of a min/max decimation of ``values`` to about ``target`` points.
+
+    Values are split into equal buckets and the argmin and argmax of each
+    bucket are kept (in time order), so visible extrema survive. The first
+    and last index are always included.
+
+    Args:
+        values: 1-D float array (NaNs are ignored within a bucket)
+        target: Approximate number of indices to return
+
+    Returns:
+        Sorted int64 index array
+    """
+    n = len(values)
+    if n <= target or target < 4:
+        return np.arange(n, dtype=np.int64)
+    
+    bucket = -(-n // (target // 2))
+    n_full = n // bucket
+    full = values[:n_full * bucket].reshape(n_full, bucket)
+    filled = np.isnan(full)
+    offsets = np.arange(n_full, dtype=np.int64) * bucket
+    lo = np.argmin(np.where(filled, np.inf, full), axis=1) + offsets
+    hi = np.argmax(np.where(filled, -np.inf, full), axis=1) + offsets
+    
+    parts = [np.stack((np.minimum(lo, hi), np.maximum(lo, hi)), axis=1).ravel()]
+    tail = values[n_full * bucket:]
+    if len(tail):
+        start = n_full * bucket
+        parts.append(np.array([start + np.nanargmin(tail), start + np.nanargmax(tail)]
+                              if not np.isnan(tail).all() else [start], dtype=np.int64))
+    parts.append(np.array([0, n - 1], dtype=np.int64))
+    return np.unique(np.concatenate(parts))
+
+
+def _exit_reason_kind(reason: str) -> int:
+    """Marker kind for a single exit reason string."""
+    if 'SL' in reason or 'STOP' in reason:
+        return MARKER_SL
+    if 'TP' in reason or 'TAKE' in reason:
+        return MARKER_TP
+    return MARKER_EXIT
+
+
+def _classify_exit_reasons(reasons: pd.Series) -> np.ndarray:
+    """
+    Map exit reasons to MARKER_* kinds.
+
+    A run has only a handful of distinct reasons, so each distinct string
+    is classified once and the result is broadcast through integer codes.
+    """
+    codes, uniques = pd.factorize(reasons.fillna('').astype(str))
+    lookup = np.fromiter((_exit_reason_kind(u) for u in uniques), dtype=np.uint8, count=len(uniques))
+    return lookup[codes]
+
+
+@dataclass
+class TradeMarkersSoA:
+    """Trade markers stored column-wise, entry and exit interleaved per trade."""
+    times_ms: np.ndarray  # int64 epoch milliseconds
+    prices: np.ndarray  # float64
+    kinds: np.ndarray  # uint8, one of MARKER_*
+
+    @classmethod
+    def empty(cls) -> "TradeMarkersSoA":
+        return cls(
+            times_ms=np.empty(0, dtype=np.int64),
+            prices=np.empty(0, dtype=np.float64),
+            kinds=np.empty(0, dtype=np.uint8),
+        )
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def colors(self) -> np.ndarray:
+        """ARGB color per marker."""
+        return MARKER_COLORS[self.kinds]
 
 
 class CandlestickItem:
     """Single candlestick for custom drawing."""
+    __slots__ = ("time", "open", "high", "low", "close", "is_bullish")
+
     def __init__(self, time, open_price, high, low, close):
         self.time = time
         self.open = open_price
@@ -48,16 +179,6 @@ class CandlestickItem:
         self.is_bullish = close >= open_price
 
 
-class TradeMarker:
-    """Trade entry/exit marker."""
-    def __init__(self, time, price, marker_type, color, label):
-        self.time = time
-        self.price = price
-        self.marker_type = marker_type  # 'entry', 'exit', 'sl', 'tp'
-        self.color = color
-        self.label = label
-
-
 class BacktestChartWidget(QWidget):
     """
     Interactive bar-by-bar backtest chart with playback controls.
@@ -81,10 +202,16 @@ class BacktestChartWidget(QWidget):
         
         # Data
         self.price_bars = None  # DataFrame with OHLC data
+        # Per-column arrays of price_bars for per-step access
+        self._time = np.empty(0, dtype=object)
+        self._open = self._high = self._low = self._close = np.empty(0, dtype=np.float64)
+        self._time_ms = np.empty(0, dtype=np.int64)  # Bar times as epoch milliseconds
         self.equity_curve = []  # List of (bar_idx, equity_value)
-        self.trade_markers = []  # List of TradeMarker objects
+        self._equity_by_bar = np.empty(0, dtype=np.float64)  # Dense, NaN where no value
+        self.trade_markers = TradeMarkersSoA.empty()
         self.trade_boxes = []  # List of (entry_bar, exit_bar, entry_price, exit_price, is_win)
         self.bar_tooltips = {}  # Dict[bar_idx] -> tooltip_text
+        self._bar_info_cache: Dict[int, str] = {}  # bar_idx -> formatted info text
         
         # Playback state
         self.current_bar_idx = 0
@@ -93,16 +220,23 @@ class BacktestChartWidget(QWidget):
         self.playback_speed = 1.0  # 1x, 2x, 5x, 10x
         self.data_loaded = False  # Track if backtest data is loaded
         self.run_backtest_callback = None  # Callback to run backtest
+        self._last_tick_ns = 0  # monotonic time of the previous playback tick
+        self._pending_bars = 0.0  # Fractional bars owed to playback
         
         # Timer for auto-play
         self.playback_timer = QTimer()
-        self.playback_timer.timeout.connect(self.step_forward)
+        self.playback_timer.timeout.connect(self._on_playback_tick)
         
         # Chart components (will be created if QtCharts available)
         self.chart_view = None
         self.chart = None
         self.price_series = None
         self.equity_series = None
+        self.entry_series = None
+        self.exit_series = None
+        self.axis_x = None
+        self.axis_y_price = None
+        self.axis_y_equity = None
         
         self.init_ui()
     
@@ -144,8 +278,9 @@ class BacktestChartWidget(QWidget):
         layout.addWidget(controls_group)
         
         # Chart view
-        if HAS_CHART:
-            self.chart_view = BacktestChartView()
+        chart_view_class = _backtest_chart_view_class()
+        if chart_view_class is not None:
+            self.chart_view = chart_view_class()
             self.chart_view.setMinimumHeight(400)
             layout.addWidget(self.chart_view)
         else:
@@ -174,7 +309,7 @@ class BacktestChartWidget(QWidget):
     def load_data(self, 
                   price_bars: pd.DataFrame,
                   equity_curve: List[Tuple[int, float]],
-                  trades: List[Dict],
+                  trades: Union[pd.DataFrame, List[Dict]],
                   bar_tooltips: Optional[Dict[int, str]] = None):
         """
         Load backtest data into chart.
@@ -182,29 +317,39 @@ class BacktestChartWidget(QWidget):
         Args:
             price_bars: DataFrame with columns [time, open, high, low, close]
             equity_curve: List of (bar_idx, equity_value) tuples
-            trades: List of trade dicts with entry/exit info
+            trades: Trades DataFrame (or list of trade dicts) with entry/exit info
             bar_tooltips: Optional dict of bar_idx -> tooltip text for debugging
         """
         try:
             self.logger.info(f"Loading chart data: {len(price_bars)} bars, {len(trades)} trades")
             
-            self.price_bars = price_bars.copy()
+            # Only read from here on, so keep a reference rather than a copy
+            self.price_bars = price_bars
+            self._time = price_bars['time'].to_numpy(dtype=object)
+            self._open = price_bars['open'].to_numpy(dtype=np.float64)
+            self._high = price_bars['high'].to_numpy(dtype=np.float64)
+            self._low = price_bars['low'].to_numpy(dtype=np.float64)
+            self._close = price_bars['close'].to_numpy(dtype=np.float64)
+            self._time_ms = _epoch_ms(price_bars['time'])
+            for column in (self._time, self._open, self._high, self._low, self._close, self._time_ms):
+                column.setflags(write=False)
             self.equity_curve = equity_curve
             self.bar_tooltips = bar_tooltips or {}
+            self._bar_info_cache = {}
             
             self.max_bar_idx = len(price_bars) - 1
             self.current_bar_idx = 0
+            self._index_equity_curve()
             
             # Convert trades to markers and boxes
             self._process_trades(trades)
             
             # Build chart if QtCharts available
-            if HAS_CHART and self.chart_view:
+            if self.chart_view is not None:
                 self._build_chart()
             
             # Update UI
-            self._update_bar_label()
-            self._update_bar_info()
+            self._refresh_ui()
             
             # Mark data as loaded and update button
             self.data_loaded = True
@@ -215,150 +360,204 @@ class BacktestChartWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Error loading chart data: {e}", exc_info=True)
     
-    def _process_trades(self, trades: List[Dict]):
+    def _process_trades(self, trades: Union[pd.DataFrame, List[Dict]]):
         """Convert trade records to visual markers and boxes."""
-        self.trade_markers = []
         self.trade_boxes = []
+        if len(trades) == 0:
+            self.trade_markers = TradeMarkersSoA.empty()
+            return
         
-        for trade in trades:
-            # Entry marker
-            entry_marker = TradeMarker(
-                time=trade.get('entry_time'),
-                price=trade.get('entry_price'),
-                marker_type='entry',
-                color=QColor("#00E676"),
-                label="Entry"
-            )
-            self.trade_markers.append(entry_marker)
-            
-            # Exit marker
-            exit_reason = trade.get('exit_reason', '')
-            if 'SL' in exit_reason or 'STOP' in exit_reason:
-                marker_type = 'sl'
-                color = QColor("#FF1744")
-                label = "SL"
-            elif 'TP' in exit_reason or 'TAKE' in exit_reason:
-                marker_type = 'tp'
-                color = QColor("#FFD600")
-                label = "TP"
-            else:
-                marker_type = 'exit'
-                color = QColor("#FF5252")
-                label = "Exit"
-            
-            exit_marker = TradeMarker(
-                time=trade.get('exit_time'),
-                price=trade.get('exit_price'),
-                marker_type=marker_type,
-                color=color,
-                label=label
-            )
-            self.trade_markers.append(exit_marker)
-            
-            # Trade box (for profit/loss visualization)
-            is_win = trade.get('pnl', 0) > 0
-            trade_box = {
-                'entry_bar': trade.get('entry_bar_idx', 0),
-                'exit_bar': trade.get('exit_bar_idx', 0),
-                'entry_price': trade.get('entry_price'),
-                'exit_price': trade.get('exit_price'),
-                'sl_price': trade.get('sl_price'),
-                'tp_price': trade.get('tp_price'),
-                'is_win': is_win
+        # Only read column-wise, so a DataFrame is used as-is
+        df = trades if isinstance(trades, pd.DataFrame) else pd.DataFrame(trades)
+        n = len(df)
+        
+        def column(name, default=None):
+            if name in df.columns:
+                return df[name]
+            return pd.Series([default] * n, index=df.index, dtype=object)
+        
+        # Exit marker kind from exit reason
+        exit_kinds = _classify_exit_reasons(column('exit_reason', ''))
+        
+        # Interleave entry/exit markers per trade
+        entry_ms = _epoch_ms(column('entry_time'))
+        exit_ms = _epoch_ms(column('exit_time'))
+        times_ms = np.empty(2 * n, dtype=np.int64)
+        times_ms[0::2] = entry_ms
+        times_ms[1::2] = exit_ms
+        prices = np.empty(2 * n, dtype=np.float64)
+        prices[0::2] = pd.to_numeric(column('entry_price'), errors='coerce').to_numpy(dtype=np.float64)
+        prices[1::2] = pd.to_numeric(column('exit_price'), errors='coerce').to_numpy(dtype=np.float64)
+        kinds = np.empty(2 * n, dtype=np.uint8)
+        kinds[0::2] = MARKER_ENTRY
+        kinds[1::2] = exit_kinds
+        
+        # Drop markers without a time or price
+        valid = (times_ms != np.iinfo(np.int64).min) & ~np.isnan(prices)
+        self.trade_markers = TradeMarkersSoA(times_ms[valid], prices[valid], kinds[valid])
+        
+        # Trade boxes (for profit/loss visualization)
+        is_win = pd.to_numeric(column('pnl', 0), errors='coerce').fillna(0).to_numpy() > 0
+        self.trade_boxes = [
+            {
+                'entry_bar': entry_bar,
+                'exit_bar': exit_bar,
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'sl_price': sl_price,
+                'tp_price': tp_price,
+                'is_win': bool(win),
             }
-            self.trade_boxes.append(trade_box)
+            for entry_bar, exit_bar, entry_price, exit_price, sl_price, tp_price, win in zip(
+                self._bar_indices(entry_ms, column('entry_bar_idx', 0)).tolist(),
+                self._bar_indices(exit_ms, column('exit_bar_idx', 0)).tolist(),
+                column('entry_price'),
+                column('exit_price'),
+                column('sl_price'),
+                column('tp_price'),
+                is_win,
+            )
+        ]
+    
+    def _bar_indices(self, times_ms: np.ndarray, fallback: pd.Series) -> np.ndarray:
+        """
+        Map epoch-ms times to the index of the bar containing them.
+
+        Args:
+            times_ms: Event times (min int64 where missing)
+            fallback: Caller-supplied bar indices, used where the time is missing
+
+        Returns:
+            int64 bar index per event, clipped to [0, max_bar_idx]
+        """
+        idx = np.searchsorted(self._time_ms, times_ms, side='right') - 1
+        missing = times_ms == np.iinfo(np.int64).min
+        if missing.any():
+            supplied = pd.to_numeric(fallback, errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+            idx[missing] = supplied[missing]
+        return np.clip(idx, 0, max(self.max_bar_idx, 0))
     
     def _build_chart(self):
-        """Build QtCharts chart with price and equity data."""
-        if not HAS_CHART:
+        """Build the chart on first load, then refresh its series with the loaded data."""
+        if _lazy_import_charts() is None:
             return
         
+        # Chart, series and axes are created once; reloads only swap points
+        if self.chart is None:
+            self._create_chart_skeleton()
+        self._update_series_data()
+        self.chart_view.set_candles(
+            self.price_series, self._time_ms, self._open, self._high, self._low, self._close
+        )
+    
+    def _create_chart_skeleton(self):
+        """Create the chart, its series and axes (without data)."""
+        charts = _lazy_import_charts()
+        
         # Create chart
-        self.chart = QChart()
+        self.chart = charts.QChart()
         self.chart.setTitle("Bar-by-Bar Backtest Replay")
-        self.chart.setAnimationOptions(QChart.NoAnimation)
+        self.chart.setAnimationOptions(charts.QChart.NoAnimation)
         
         # Price series (simplified as line for now, custom candlesticks later)
-        self.price_series = QLineSeries()
+        self.price_series = charts.QLineSeries()
         self.price_series.setName("Close Price")
-        
-        for idx, row in self.price_bars.iterrows():
-            timestamp = pd.to_datetime(row['time']).timestamp() * 1000  # milliseconds
-            self.price_series.append(timestamp, row['close'])
-        
         self.chart.addSeries(self.price_series)
         
         # Equity series (secondary axis)
-        self.equity_series = QLineSeries()
+        self.equity_series = charts.QLineSeries()
         self.equity_series.setName("Equity")
         self.equity_series.setColor(QColor("#00C853"))
+        self.chart.addSeries(self.equity_series)
         
-        for bar_idx, equity_value in self.equity_curve:
-            if bar_idx < len(self.price_bars):
-                timestamp = pd.to_datetime(self.price_bars.iloc[bar_idx]['time']).timestamp() * 1000
-                self.equity_series.append(timestamp, equity_value)
+        # Trade marker series
+        self.entry_series = charts.QScatterSeries()
+        self.entry_series.setName("Entries")
+        self.entry_series.setColor(QColor("#00E676"))
+        self.entry_series.setMarkerSize(12)
+        self.chart.addSeries(self.entry_series)
         
-        self.chart.addSeries(self.equity_series)
+        self.exit_series = charts.QScatterSeries()
+        self.exit_series.setName("Exits")
+        self.exit_series.setColor(QColor("#FF5252"))
+        self.exit_series.setMarkerSize(12)
+        self.chart.addSeries(self.exit_series)
         
         # Create axes
-        axis_x = QDateTimeAxis()
-        axis_x.setFormat("MMM dd HH:mm")
-        axis_x.setTitleText("Time")
-        self.chart.addAxis(axis_x, Qt.AlignBottom)
-        self.price_series.attachAxis(axis_x)
-        self.equity_series.attachAxis(axis_x)
-        
-        axis_y_price = QValueAxis()
-        axis_y_price.setTitleText("Price")
-        self.chart.addAxis(axis_y_price, Qt.AlignLeft)
-        self.price_series.attachAxis(axis_y_price)
-        
-        axis_y_equity = QValueAxis()
-        axis_y_equity.setTitleText("Equity ($)")
-        self.chart.addAxis(axis_y_equity, Qt.AlignRight)
-        self.equity_series.attachAxis(axis_y_equity)
-        
-        # Add trade markers as scatter series
-        self._add_trade_markers_to_chart()
+        self.axis_x = charts.QDateTimeAxis()
+        self.axis_x.setFormat("MMM dd HH:mm")
+        self.axis_x.setTitleText("Time")
+        self.chart.addAxis(self.axis_x, Qt.AlignBottom)
+        
+        self.axis_y_price = charts.QValueAxis()
+        self.axis_y_price.setTitleText("Price")
+        self.chart.addAxis(self.axis_y_price, Qt.AlignLeft)
+        
+        self.axis_y_equity = charts.QValueAxis()
+        self.axis_y_equity.setTitleText("Equity ($)")
+        self.chart.addAxis(self.axis_y_equity, Qt.AlignRight)
+        
+        for series in (self.price_series, self.entry_series, self.exit_series):
+            series.attachAxis(self.axis_x)
+            series.attachAxis(self.axis_y_price)
+        self.equity_series.attachAxis(self.axis_x)
+        self.equity_series.attachAxis(self.axis_y_equity)
         
         # Set chart to view
         self.chart_view.setChart(self.chart)
         self.chart_view.setRenderHint(QPainter.Antialiasing)
     
-    def _add_trade_markers_to_chart(self):
-        """Add trade entry/exit markers as scatter series."""
-        if not HAS_CHART:
-            return
+    def _update_series_data(self):
+        """Replace the points of every series and fit the axes to them."""
+        # One vectorized conversion and a single replace() instead of a
+        # Qt call (and signal) per bar. Long runs are min/max decimated,
+        # since the chart can't show more points than it has pixels.
+        bar_times_ms = self._time_ms.astype(np.float64)
+        price_idx = _decimate_minmax(self._close)
+        self.price_series.replace(
+            [
+                QPointF(t, c)
+                for t, c in zip(bar_times_ms[price_idx].tolist(), self._close[price_idx].tolist())
+            ]
+        )
+        
+        equity_values = np.empty(0, dtype=np.float64)
+        equity_points = []
+        if self.equity_curve:
+            equity = np.asarray(self.equity_curve, dtype=np.float64).reshape(-1, 2)
+            bar_idx = equity[:, 0].astype(np.int64)
+            in_range = (bar_idx >= 0) & (bar_idx < len(bar_times_ms))
+            equity_times = np.take(bar_times_ms, bar_idx[in_range])
+            equity_values = equity[in_range, 1]
+            equity_idx = _decimate_minmax(equity_values)
+            equity_points = [
+                QPointF(t, v)
+                for t, v in zip(equity_times[equity_idx].tolist(), equity_values[equity_idx].tolist())
+            ]
+        self.equity_series.replace(equity_points)
         
-        # Entry markers
-        entry_series = QScatterSeries()
-        entry_series.setName("Entries")
-        entry_series.setColor(QColor("#00E676"))
-        entry_series.setMarkerSize(12)
-        
-        # Exit markers
-        exit_series = QScatterSeries()
-        exit_series.setName("Exits")
-        exit_series.setColor(QColor("#FF5252"))
-        exit_series.setMarkerSize(12)
-        
-        for marker in self.trade_markers:
-            timestamp = pd.to_datetime(marker.time).timestamp() * 1000
-            
-            if marker.marker_type == 'entry':
-                entry_series.append(timestamp, marker.price)
-            else:
-                exit_series.append(timestamp, marker.price)
-        
-        if entry_series.count() > 0:
-            self.chart.addSeries(entry_series)
-            entry_series.attachAxis(self.chart.axes(Qt.Horizontal)[0])
-            entry_series.attachAxis(self.chart.axes(Qt.Vertical)[0])
+        self._add_trade_markers_to_chart()
         
-        if exit_series.count() > 0:
-            self.chart.addSeries(exit_series)
-            exit_series.attachAxis(self.chart.axes(Qt.Horizontal)[0])
-            exit_series.attachAxis(self.chart.axes(Qt.Vertical)[0])
+        # Axes don't follow replace(), so set their ranges explicitly
+        if len(bar_times_ms) and not np.isnan(self._close).all():
+            self.axis_x.setRange(
+                QDateTime.fromMSecsSinceEpoch(int(self._time_ms[0])),
+                QDateTime.fromMSecsSinceEpoch(int(self._time_ms[-1])),
+            )
+            self.axis_y_price.setRange(float(np.nanmin(self._low)), float(np.nanmax(self._high)))
+        if len(equity_values) and not np.isnan(equity_values).all():
+            self.axis_y_equity.setRange(float(np.nanmin(equity_values)), float(np.nanmax(equity_values)))
+    
+    def _add_trade_markers_to_chart(self):
+        """Fill the entry/exit scatter series from the trade markers."""
+        # Markers are fixed after load_data; fill each series with one replace()
+        markers = self.trade_markers
+        times_ms = markers.times_ms.astype(np.float64)
+        is_entry = markers.kinds == MARKER_ENTRY
+        for series, mask in ((self.entry_series, is_entry), (self.exit_series, ~is_entry)):
+            series.replace(
+                [QPointF(t, p) for t, p in zip(times_ms[mask].tolist(), markers.prices[mask].tolist())]
+            )
     
     def on_play_clicked(self):
         """Handle play button click - run backtest if not loaded, otherwise toggle playback."""
@@ -389,9 +588,10 @@ class BacktestChartWidget(QWidget):
         self.is_playing = True
         self.play_pause_btn.setText("Pause")
         
-        # Calculate interval based on speed (base 500ms at 1x)
-        interval_ms = int(500 / self.playback_speed)
-        self.playback_timer.start(interval_ms)
+        # Fixed frame rate; the bar rate follows playback_speed in _on_playback_tick
+        self._last_tick_ns = time.monotonic_ns()
+        self._pending_bars = 0.0
+        self.playback_timer.start(PLAYBACK_FRAME_MS)
         
         self.logger.info(f"Playback started at {self.playback_speed}x speed")
     
@@ -403,13 +603,41 @@ class BacktestChartWidget(QWidget):
         
         self.logger.info("Playback paused")
     
-    def step_forward(self):
-        """Advance to next bar."""
+    def _on_playback_tick(self):
+        """
+        Advance playback by however many bars are due since the last tick.
+
+        Bars accrue at playback_speed / PLAYBACK_BASE_INTERVAL_MS per ms of
+        wall time, so a slow paint makes the next tick jump several bars
+        instead of letting timer events back up.
+        """
+        now = time.monotonic_ns()
+        elapsed_ms = (now - self._last_tick_ns) / 1e6
+        self._last_tick_ns = now
+        
+        self._pending_bars += elapsed_ms * self.playback_speed / PLAYBACK_BASE_INTERVAL_MS
+        bars = int(self._pending_bars)
+        if bars < 1:
+            return
+        self._pending_bars -= bars
+        self.step_forward(bars)
+    
+    def step_forward(self, bars: int = 1):
+        """Advance by ``bars`` bars (default one), rendering once."""
         if self.current_bar_idx < self.max_bar_idx:
-            self.current_bar_idx += 1
-            self._update_bar_label()
-            self._update_bar_info()
-            self._highlight_current_bar()
+            previous = self.current_bar_idx
+            self.current_bar_idx = min(self.max_bar_idx, previous + max(1, int(bars)))
+            # At 5x+ the info panel can't be read every step; refresh it
+            # when passing every Nth bar and always on the last one
+            speed = int(self.playback_speed)
+            self._refresh_ui(
+                update_info=(
+                    not self.is_playing
+                    or speed < 5
+                    or self.current_bar_idx // speed != previous // speed
+                    or self.current_bar_idx == self.max_bar_idx
+                )
+            )
             
             self.bar_changed.emit(self.current_bar_idx)
         else:
@@ -422,9 +650,7 @@ class BacktestChartWidget(QWidget):
     def reset_playback(self):
         """Reset playback to beginning."""
         self.current_bar_idx = 0
-        self._update_bar_label()
-        self._update_bar_info()
-        self._highlight_current_bar()
+        self._refresh_ui()
         
         self.logger.info("Playback reset")
     
@@ -433,48 +659,66 @@ class BacktestChartWidget(QWidget):
         speed_map = {"1x": 1.0, "2x": 2.0, "5x": 5.0, "10x": 10.0}
         self.playback_speed = speed_map.get(speed_text, 1.0)
         
-        # Update timer if playing
-        if self.is_playing:
-            interval_ms = int(500 / self.playback_speed)
-            self.playback_timer.setInterval(interval_ms)
-        
         self.logger.info(f"Playback speed changed to {self.playback_speed}x")
     
-    def _update_bar_label(self):
-        """Update bar index label."""
-        self.bar_label.setText(f"Bar: {self.current_bar_idx} / {self.max_bar_idx}")
-    
-    def _update_bar_info(self):
-        """Update bar info panel with debugging information."""
-        if self.price_bars is None or self.current_bar_idx >= len(self.price_bars):
-            self.bar_info_label.setText("No data")
-            return
+    def _refresh_ui(self, update_info: bool = True):
+        """
+        Update the bar label, info panel and highlight for the current bar.
+
+        Args:
+            update_info: Also refresh the info panel (skipped when throttled)
+        """
+        i = self.current_bar_idx
+        self.bar_label.setText(f"Bar: {i} / {self.max_bar_idx}")
         
-        bar = self.price_bars.iloc[self.current_bar_idx]
+        if update_info:
+            if self.price_bars is None or i >= len(self._close):
+                text = "No data"
+            else:
+                # Everything shown is fixed per bar, so format each bar once
+                text = self._bar_info_cache.get(i)
+                if text is None:
+                    text = self._format_bar_info(i)
+                    self._bar_info_cache[i] = text
+            self.bar_info_label.setText(text)
         
+        self._highlight_current_bar()
+    
+    def _format_bar_info(self, i: int) -> str:
+        """Build the info panel text for bar ``i``."""
         # Build info text
         info_lines = [
-            f"Bar #{self.current_bar_idx}",
-            f"Time: {bar['time']}",
-            f"OHLC: {bar['open']:.2f} / {bar['high']:.2f} / {bar['low']:.2f} / {bar['close']:.2f}",
+            f"Bar #{i}",
+            f"Time: {self._time[i]}",
+            f"OHLC: {self._open[i]:.2f} / {self._high[i]:.2f} / {self._low[i]:.2f} / {self._close[i]:.2f}",
         ]
  
         # Add equity if available
-        equity_at_bar = self._get_equity_at_bar(self.current_bar_idx)
+        equity_at_bar = self._get_equity_at_bar(i)
         if equity_at_bar is not None:
             info_lines.append(f"Equity: ${equity_at_bar:,.2f}")
         # Add custom tooltip if available
-        if self.current_bar_idx in self.bar_tooltips:
+        if i in self.bar_tooltips:
             info_lines.append("---")
-            info_lines.append(self.bar_tooltips[self.current_bar_idx])
+            info_lines.append(self.bar_tooltips[i])
         
-        self.bar_info_label.setText("\n".join(info_lines))
+        return "\n".join(info_lines)
     
+    def _index_equity_curve(self):
+        """Build the dense bar_idx -> equity array used by _get_equity_at_bar."""
+        equity_by_bar = np.full(self.max_bar_idx + 1, np.nan, dtype=np.float64)
+        # Reversed so the first value listed for a bar wins
+        for idx, equity in reversed(self.equity_curve):
+            if 0 <= idx <= self.max_bar_idx:
+                equity_by_bar[idx] = equity
+        self._equity_by_bar = equity_by_bar
+
     def _get_equity_at_bar(self, bar_idx: int) -> Optional[float]:
         """Get equity value at specific bar index."""
-        for idx, equity in self.equity_curve:
-            if idx == bar_idx:
-                return equity
+        if 0 <= bar_idx < len(self._equity_by_bar):
+            equity = self._equity_by_bar[bar_idx]
+            if not np.isnan(equity):
+                return float(equity)
         return None
     
     def _highlight_current_bar(self):
@@ -484,14 +728,99 @@ class BacktestChartWidget(QWidget):
         pass
 
 
-class BacktestChartView(QChartView):
-    """Custom chart view with hover tooltips and interactions."""
-    
-    def __init__(self):
-        super().__init__()
-        self.setMouseTracking(True)
-    
-    def mouseMoveEvent(self, event):
-        """Handle mouse move for tooltips."""
-        # TODO: Implement hover tooltip showing bar details
-        super().mouseMoveEvent(event)
+@lru_cache(maxsize=None)
+def _backtest_chart_view_class():
+    """Define BacktestChartView on first use; None if QtCharts is not installed."""
+    charts = _lazy_import_charts()
+    if charts is None:
+        return None
+    QChartView = charts.QChartView
+
+    class BacktestChartView(QChartView):
+        """Custom chart view with hover tooltips and interactions."""
+
+        def __init__(self):
+            super().__init__()
+            self.setMouseTracking(True)
+            self._candles = None  # (time_ms, open, high, low, close) float arrays
+            self._candle_series = None  # Series whose axes the candles share
+
+        def set_candles(self, series, time_ms, opens, highs, lows, closes):
+            """Set OHLC arrays drawn as candlesticks on top of ``series``' axes."""
+            self._candle_series = series
+            self._candles = tuple(
+                np.asarray(values, dtype=np.float64) for values in (time_ms, opens, highs, lows, closes)
+            )
+            self.viewport().update()
+
+        def drawForeground(self, painter, rect):
+            """
+            Draw candlesticks in three painter calls.
+
+            Coordinates are computed with NumPy, then all wicks go into one
+            QPainterPath and bodies into one drawRects() call per color,
+            instead of several painter calls per bar.
+            """
+            super().drawForeground(painter, rect)
+            chart = self.chart()
+            if self._candles is None or chart is None or len(self._candles[0]) < 2:
+                return
+            times, opens, highs, lows, closes = self._candles
+            t0, t1 = times[0], times[-1]
+            p_lo, p_hi = np.nanmin(lows), np.nanmax(highs)
+            if t1 <= t0 or p_hi <= p_lo:
+                return
+
+            # Value -> scene mapping is linear; derive it from two reference points
+            a = chart.mapToScene(chart.mapToPosition(QPointF(t0, p_lo), self._candle_series))
+            b = chart.mapToScene(chart.mapToPosition(QPointF(t1, p_hi), self._candle_series))
+            x_scale = (b.x() - a.x()) / (t1 - t0)
+            y_scale = (b.y() - a.y()) / (p_hi - p_lo)
+            xs = a.x() + (times - t0) * x_scale
+
+            plot = chart.mapRectToScene(chart.plotArea())
+            visible = np.flatnonzero((xs >= plot.left()) & (xs <= plot.right()))
+            if len(visible) == 0:
+                return
+            half_width = max(0.5, 0.3 * abs(float(np.median(np.diff(xs)))))
+
+            xs = xs[visible]
+            y_high = a.y() + (highs[visible] - p_lo) * y_scale
+            y_low = a.y() + (lows[visible] - p_lo) * y_scale
+            y_open = a.y() + (opens[visible] - p_lo) * y_scale
+            y_close = a.y() + (closes[visible] - p_lo) * y_scale
+            body_top = np.minimum(y_open, y_close)
+            body_height = np.maximum(np.abs(y_open - y_close), 1.0)
+            bullish = closes[visible] >= opens[visible]
+
+            painter.save()
+            painter.setClipRect(plot)
+
+            wicks = QPainterPath()
+            for x, top, bottom in zip(xs.tolist(), y_high.tolist(), y_low.tolist()):
+                wicks.moveTo(x, top)
+                wicks.lineTo(x, bottom)
+            painter.setPen(QPen(QColor(CANDLE_WICK_COLOR), 1))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPath(wicks)
+
+            painter.setPen(Qt.NoPen)
+            for mask, color in ((bullish, CANDLE_BULL_COLOR), (~bullish, CANDLE_BEAR_COLOR)):
+                bodies = [
+                    QRectF(x - half_width, top, 2 * half_width, height)
+                    for x, top, height in zip(
+                        xs[mask].tolist(), body_top[mask].tolist(), body_height[mask].tolist()
+                    )
+                ]
+                if bodies:
+                    painter.setBrush(QBrush(QColor(color)))
+                    painter.drawRects(bodies)
+
+            painter.restore()
+
+        def mouseMoveEvent(self, event):
+            """Handle mouse move for tooltips."""
+            # TODO: Implement hover tooltip showing bar details
+            super().mouseMoveEvent(event)
+
+    return BacktestChartView
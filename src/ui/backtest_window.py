@@ -6,15 +6,16 @@ export functionality for JSON/CSV/HTML reports.
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem,
-    QLabel, QPushButton, QHeaderView, QScrollArea, QGroupBox, QGridLayout, QProgressBar
+    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTableView,
+    QLabel, QPushButton, QHeaderView, QScrollArea, QGroupBox, QGridLayout, QProgressBar,
+    QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, QThread, Signal, QPointF, QDateTime
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, QPointF, QDateTime, QAbstractTableModel, QModelIndex, QEvent
+from PySide6.QtGui import QColor, QFont, QPalette
 
 # Try to import chart components, optional for visualization
 try:
-    from PySide6.QtChart import QChart, QChartView, QLineSeries  # type: ignore
+    from PySide6.QtCharts import QChart, QChartView, QLineSeries  # type: ignore
     HAS_CHART = True
 except (ImportError, ModuleNotFoundError):  # type: ignore
     HAS_CHART = False
@@ -22,9 +23,18 @@ except (ImportError, ModuleNotFoundError):  # type: ignore
     QChartView = None  # type: ignore
     QLineSeries = None  # type: ignore
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional, List, Tuple
+import hashlib
+import json
 import logging
+import os
+import pickle
+import stat
+import threading
+import time
+from pathlib import Path
 
 # Import custom backtest chart widget
 try:
@@ -43,12 +53,167 @@ except ImportError:
     HAS_DECISION_ANALYZER = False
 
 
+# Summary card value text colors by color name (applied via QPalette, no stylesheet parsing)
+CARD_VALUE_COLORS = {
+    'green': QColor("#0f7938"),
+    'red': QColor("#d32f2f"),
+}
+
+PROGRESS_BAR_STYLE = """
+    QProgressBar {
+        border: 2px solid #2196F3;
+        border-radius: 5px;
+        text-align: center;
+        background-color: #E3F2FD;
+        height: 25px;
+    }
+    QProgressBar::chunk {
+        background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #2196F3, stop:1 #1976D2);
+        border-radius: 3px;
+    }
+"""
+
+
+class PandasTradesModel(QAbstractTableModel):
+    """
+    Read-only table model over a trades DataFrame.
+
+    Cells are stringified on demand, so only rows the view paints are
+    ever converted. PnL tinting is left to PnLDelegate, via pnl_sign().
+    """
+    
+    def __init__(self, df: pd.DataFrame, parent=None):
+        super().__init__(parent)
+        self._columns = [str(c) for c in df.columns]
+        self._values = df.to_numpy(dtype=object)
+        # Sign of each cell in numeric PnL columns (0 elsewhere), decided per
+        # column up front so data() needs no name or type checks
+        self._pnl_sign = np.zeros(df.shape, dtype=np.int8)
+        pnl_cols = [
+            col_idx for col_idx, name in enumerate(self._columns)
+            if 'pnl' in name.lower() and pd.api.types.is_numeric_dtype(df.dtypes.iloc[col_idx])
+        ]
+        for col_idx in pnl_cols:
+            values = df.iloc[:, col_idx].to_numpy(dtype=np.float64, na_value=np.nan)
+            self._pnl_sign[:, col_idx] = np.nan_to_num(np.sign(values))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._values)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return str(self._values[row, col])
+        return None
+    
+    def pnl_sign(self, row: int, col: int) -> int:
+        """Sign of a PnL cell: 1, -1, or 0 (not PnL, zero or missing)."""
+        return int(self._pnl_sign[row, col])
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section]
+        return str(section + 1)
+
+
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory: %LOCALAPPDATA% on Windows, else $XDG_CACHE_HOME or ~/.cache."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'TRADING' / 'backtests'
+
+
+def _is_private_cache_file(path: Path) -> bool:
+    """
+    True if ``path`` is a regular file that only the current user could have written.
+
+    Cache files are unpickled, so a file or directory owned by another
+    account, or writable by group/others, is refused. On Windows the
+    per-user %LOCALAPPDATA% ACLs provide the same guarantee.
+    """
+    if not hasattr(os, 'getuid'):
+        return path.is_file()
+    uid = os.getuid()
+    file_stat = os.lstat(path)
+    if not stat.S_ISREG(file_stat.st_mode):
+        return False
+    return all(
+        st.st_uid == uid and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        for st in (file_stat, os.stat(path.parent))
+    )
+
+
+# Results of finished runs, keyed by BacktestEngine.result_cache_key(); kept
+# in a private per-user directory because the files are unpickled
+BACKTEST_CACHE_DIR = _user_cache_dir()
+# Most recently used cache files kept; older ones are deleted after each save
+BACKTEST_CACHE_MAX_FILES = 20
+
+# Minimum spacing between BacktestWorker progress signals
+PROGRESS_MIN_INTERVAL_S = 0.05
+# Minimum spacing between progress bar repaints in BacktestWindow
+PROGRESS_BAR_MIN_INTERVAL_S = 0.1
+
+
+# Equity curves are thinned only when longer than
+# EQUITY_SAMPLE_THRESHOLD x max(view width, EQUITY_SAMPLE_MIN_POINTS)
+EQUITY_SAMPLE_MIN_POINTS = 500
+EQUITY_SAMPLE_THRESHOLD = 4
+
+
+def _equity_sample_step(length: int, width: int) -> int:
+    """
+    Stride for drawing ``length`` equity points in a view ``width`` pixels wide.
+
+    Curves longer than 4x the width (min 500) are thinned to about one
+    point per pixel; shorter ones are drawn in full (stride 1).
+    """
+    target = max(width, EQUITY_SAMPLE_MIN_POINTS)
+    return length // target if length > EQUITY_SAMPLE_THRESHOLD * target else 1
+
+
+def _equity_sample_indices(length: int, step: int) -> np.ndarray:
+    """Every ``step``-th index of ``length`` points, always ending on the last one."""
+    idx = np.arange(0, length, step)
+    if length and idx[-1] != length - 1:
+        idx = np.append(idx, length - 1)
+    return idx
+
+
+class PnLDelegate(QStyledItemDelegate):
+    """Paints PnL cells on a green/red background, with no per-cell model data."""
+    
+    POSITIVE_COLOR = QColor(200, 255, 200)
+    NEGATIVE_COLOR = QColor(255, 200, 200)
+    
+    def paint(self, painter, option, index):
+        pnl_sign = getattr(index.model(), 'pnl_sign', None)
+        if pnl_sign is not None:
+            sign = pnl_sign(index.row(), index.column())
+            if sign:
+                painter.fillRect(option.rect, self.POSITIVE_COLOR if sign > 0 else self.NEGATIVE_COLOR)
+        super().paint(painter, option, index)
+
+
 class BacktestWorker(QThread):
     """Worker thread to run backtest without blocking UI."""
     
     progress = Signal(str)  # Status message
     completed = Signal(dict)  # Result summary
     error = Signal(str)  # Error message
+    _progress_deferred = Signal()  # A throttled message is waiting to be flushed
     
     def __init__(self, backtest_engine, strategy_engine, indicator_engine, 
                  risk_engine, pattern_engine):
@@ -59,11 +224,24 @@ class BacktestWorker(QThread):
         self.risk_engine = risk_engine
         self.pattern_engine = pattern_engine
         self.logger = logging.getLogger(__name__)
+        self._last_emit = 0.0  # monotonic time of the last progress signal
+        self._pending_progress: Optional[str] = None  # Latest throttled message
+        self._progress_lock = threading.Lock()
+        # Lives in the UI thread (like this QThread object), which has the event
+        # loop the worker thread lacks; started through a queued signal
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(int(PROGRESS_MIN_INTERVAL_S * 1000))
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._progress_deferred.connect(self._progress_timer.start)
     
     def run(self):
         """Run backtest in background thread."""
+        # The simulation is pure Python and shares the GIL with the UI thread;
+        # a lower OS priority lets paint/input events win when both are runnable
+        self.setPriority(QThread.LowPriority)
         try:
-            self.progress.emit("Loading historical data...")
+            self._emit_progress("Loading historical data...")
             
             # Load data
             success = self.backtest_engine.load_historical_data(
@@ -73,33 +251,127 @@ class BacktestWorker(QThread):
                 self.error.emit("Failed to load historical data")
                 return
             
-            self.progress.emit("Running backtest simulation...")
-            
-            # Run backtest
-            success = self.backtest_engine.run_backtest(
-                strategy_engine=self.strategy_engine,
-                indicator_engine=self.indicator_engine,
-                risk_engine=self.risk_engine,
-                pattern_engine=self.pattern_engine
-            )
-            
-            if not success:
-                self.error.emit("Backtest simulation failed")
-                return
-            
-            self.progress.emit("Backtest completed successfully")
+            # Same settings and bars as an earlier run: reuse its results
+            cache_path = self._cache_path()
+            if cache_path is not None and self._load_cached_result(cache_path):
+                self._emit_progress("Backtest loaded from cache", force=True)
+            else:
+                self._emit_progress("Running backtest simulation...")
+                
+                # Run backtest
+                success = self.backtest_engine.run_backtest(
+                    strategy_engine=self.strategy_engine,
+                    indicator_engine=self.indicator_engine,
+                    risk_engine=self.risk_engine,
+                    pattern_engine=self.pattern_engine
+                )
+                
+                if not success:
+                    self.error.emit("Backtest simulation failed")
+                    return
+                
+                if cache_path is not None:
+                    self._save_cached_result(cache_path)
+                self._emit_progress("Backtest completed successfully", force=True)
             
-            # Emit results
+            # Emit results (each getter called once; the trades frame is cached by the engine)
+            engine = self.backtest_engine
+            summary = engine.get_summary()
+            trades_df = engine.get_trades_dataframe()
             self.completed.emit({
-                'summary': self.backtest_engine.get_summary(),
-                'metrics': self.backtest_engine.metrics,
-                'trades_df': self.backtest_engine.get_trades_dataframe(),
-                'equity_curve': self.backtest_engine.equity_curve,
+                'summary': summary,
+                'metrics': engine.metrics,
+                'trades_df': trades_df,
+                'equity_curve': engine.equity_curve,
             })
             
         except Exception as e:
             self.error.emit(f"Backtest error: {str(e)}")
             self.logger.error(f"Backtest worker error: {e}", exc_info=True)
+    
+    def _emit_progress(self, message: str, force: bool = False):
+        """
+        Emit ``progress`` at most every PROGRESS_MIN_INTERVAL_S seconds.
+
+        Each emit posts a queued event to the UI thread, so frequent callers
+        are throttled; ``force`` always emits (used for final messages). A
+        throttled message is kept and emitted once the interval has passed,
+        unless a newer message replaces it first.
+        """
+        now = time.monotonic()
+        with self._progress_lock:
+            emit_now = force or now - self._last_emit >= PROGRESS_MIN_INTERVAL_S
+            if emit_now:
+                self._last_emit = now
+                self._pending_progress = None
+            else:
+                schedule = self._pending_progress is None
+                self._pending_progress = message
+        if emit_now:
+            self.progress.emit(message)
+        elif schedule:
+            self._progress_deferred.emit()
+    
+    def _flush_progress(self):
+        """Emit the latest throttled progress message, if still pending (UI thread)."""
+        with self._progress_lock:
+            message, self._pending_progress = self._pending_progress, None
+            if message is None:
+                return
+            self._last_emit = time.monotonic()
+        self.progress.emit(message)
+    
+    def _cache_path(self) -> Optional[Path]:
+        """Cache file for the loaded data and engine settings, if a key can be computed."""
+        try:
+            key = self.backtest_engine.result_cache_key((
+                self.strategy_engine, self.risk_engine,
+                self.indicator_engine, self.pattern_engine,
+            ))
+        except Exception as e:
+            self.logger.warning(f"Could not compute backtest cache key: {e}")
+            return None
+        return BACKTEST_CACHE_DIR / f"{key}.pkl" if key else None
+    
+    def _load_cached_result(self, path: Path) -> bool:
+        """Restore engine results from ``path``; False if missing or unreadable."""
+        if not path.exists():
+            return False
+        try:
+            if not _is_private_cache_file(path):
+                self.logger.warning(f"Ignoring backtest cache not private to this user: {path}")
+                return False
+            with open(path, 'rb') as f:
+                self.backtest_engine.restore_result_state(pickle.load(f))
+            path.touch()  # Mark as recently used for pruning
+            self.logger.info(f"Backtest results loaded from cache: {path.name}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable backtest cache {path.name}: {e}")
+            return False
+    
+    def _save_cached_result(self, path: Path):
+        """Persist engine results to ``path``; failures are logged and ignored."""
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self.backtest_engine.get_result_state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except Exception as e:
+            self.logger.warning(f"Could not write backtest cache: {e}")
+            return
+        self._prune_cache(path.parent)
+    
+    def _prune_cache(self, cache_dir: Path):
+        """Delete all but the BACKTEST_CACHE_MAX_FILES most recently used cache files."""
+        try:
+            files = sorted(cache_dir.glob('*.pkl'), key=lambda p: p.stat().st_mtime, reverse=True)
+            for stale in files[BACKTEST_CACHE_MAX_FILES:]:
+                stale.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Could not prune backtest cache: {e}")
 
 
 class BacktestWindow(QWidget):
@@ -129,8 +401,25 @@ class BacktestWindow(QWidget):
         self.export_html_clicked = None  # Will be connected by main.py
         self.progress_bar = None  # Progress bar for visual feedback
         self.chart_widget = None  # Bar-by-bar chart widget
-        self.decision_analyzer = None  # Decision analyzer widget
+        self.decision_analyzer = None  # Decision analyzer widget, built when its tab is first shown
+        self._analyzer_tab_index = None
+        self._analyzer_container = None  # Placeholder page the analyzer is built into
+        self._pending_decisions = None  # (bar_decisions, price_bars) awaiting the analyzer
         self.ui_config = {}  # UI configuration from config.yaml
+        self._equity_ys = np.empty(0, dtype=np.float64)  # Full equity curve values
+        self._equity_series = None  # Series showing a sample of _equity_ys
+        self._equity_sample_step = 1  # Stride of the current sample
+        self._last_fingerprint = None  # Fingerprint of the inputs last displayed
+        # Statistics/Settings text is built when its tab is shown
+        self._pending_metrics = None
+        self._pending_settings = None
+        self._card_labels: Dict[str, QLabel] = {}  # Summary card title -> value label
+        self._card_text_color = None  # Default card value color, for uncolored cards
+        self._last_progress_ts = 0.0  # monotonic time of the last progress bar update
+        self._pending_progress: Optional[Tuple[int, str]] = None  # Latest skipped update
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)
         
         self.init_ui()
     
@@ -157,25 +446,13 @@ class BacktestWindow(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setFormat("Ready")
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2196F3;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #E3F2FD;
-                height: 25px;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2196F3, stop:1 #1976D2);
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(PROGRESS_BAR_STYLE)
         self.progress_bar.setVisible(False)  # Hidden by default
         layout.addWidget(self.progress_bar)
         
         # Tabs
         tabs = QTabWidget()
+        self.tabs = tabs
         
         # Tab 1: Summary
         summary_widget = QWidget()
@@ -198,13 +475,15 @@ class BacktestWindow(QWidget):
         self.summary_cards.setLayout(self.summary_cards_layout)
         summary_layout.addWidget(self.summary_cards, stretch=2)  # 40% height
         
-        # Equity curve (optional - only if QtChart available)
+        # Equity curve (optional - only if QtCharts available)
         if HAS_CHART:
             self.chart_view = QChartView()
+            # Re-sample the equity curve when the view width changes
+            self.chart_view.installEventFilter(self)
             summary_layout.addWidget(self.chart_view)
         else:
             self.chart_view = None
-            summary_layout.addWidget(QLabel("QtChart not available for equity curve visualization"))
+            summary_layout.addWidget(QLabel("QtCharts not available for equity curve visualization"))
         
         summary_widget.setLayout(summary_layout)
         tabs.addTab(summary_widget, "Summary")
@@ -213,8 +492,13 @@ class BacktestWindow(QWidget):
         trades_widget = QWidget()
         trades_layout = QVBoxLayout()
         
-        self.trades_table = QTableWidget()
-        self.trades_table.setColumnCount(0)
+        self.trades_table = QTableView()
+        self.trades_table.setItemDelegate(PnLDelegate(self.trades_table))
+        # Fixed row heights and interactive columns: nothing is re-measured per cell on resize
+        row_header = self.trades_table.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.Fixed)
+        row_header.setDefaultSectionSize(self.trades_table.fontMetrics().height() + 4)
+        self.trades_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         trades_layout.addWidget(self.trades_table)
         
         trades_widget.setLayout(trades_layout)
@@ -229,7 +513,7 @@ class BacktestWindow(QWidget):
         stats_layout.addWidget(self.stats_text)
         
         stats_widget.setLayout(stats_layout)
-        tabs.addTab(stats_widget, "Statistics")
+        self._stats_tab_index = tabs.addTab(stats_widget, "Statistics")
         
         # Tab 4: Settings
         settings_widget = QWidget()
@@ -240,18 +524,17 @@ class BacktestWindow(QWidget):
         settings_layout.addWidget(self.settings_text)
         
         settings_widget.setLayout(settings_layout)
-        tabs.addTab(settings_widget, "Settings")
+        self._settings_tab_index = tabs.addTab(settings_widget, "Settings")
         
-        # Tab 5: Decision Analyzer (Why No Trade?)
+        # Tab 5: Decision Analyzer (Why No Trade?), built on first view
         if HAS_DECISION_ANALYZER:
-            self.decision_analyzer = DecisionAnalyzerWidget(self.ui_config)
-            # Connect analyzer bar selection to chart
-            if self.chart_widget:
-                self.decision_analyzer.bar_selected.connect(self._on_analyzer_bar_selected)
-            tabs.addTab(self.decision_analyzer, "Why No Trade?")
-        else:
-            self.decision_analyzer = None
+            self._analyzer_container = QWidget()
+            container_layout = QVBoxLayout()
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            self._analyzer_container.setLayout(container_layout)
+            self._analyzer_tab_index = tabs.addTab(self._analyzer_container, "Why No Trade?")
         
+        tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(tabs)
         
         # Export buttons
@@ -312,15 +595,43 @@ class BacktestWindow(QWidget):
             self.status_label.setText(f"Error: Export {format_type} not available")
     
     def update_progress(self, percent: int, message: str):
-        """Update progress bar value and text."""
-        if self.progress_bar:
-            self.progress_bar.setValue(percent)
-            self.progress_bar.setFormat(f"{message} ({percent}%)")
-            # Force UI update
-            self.progress_bar.repaint()
+        """
+        Update progress bar value and text (at most 10 times a second, except at 100%).
+
+        An update arriving too soon is kept, and the latest one is applied
+        when the interval has passed.
+        """
+        if not self.progress_bar:
+            return
+        elapsed = time.monotonic() - self._last_progress_ts
+        if percent < 100 and elapsed < PROGRESS_BAR_MIN_INTERVAL_S:
+            self._pending_progress = (percent, message)
+            if not self._progress_timer.isActive():
+                remaining_ms = (PROGRESS_BAR_MIN_INTERVAL_S - elapsed) * 1000
+                self._progress_timer.start(max(1, int(remaining_ms)))
+            return
+        self._pending_progress = None
+        self._progress_timer.stop()
+        self._set_progress(percent, message)
+    
+    def _flush_progress(self):
+        """Apply the latest update skipped by update_progress()."""
+        if self._pending_progress is not None and self.progress_bar:
+            percent, message = self._pending_progress
+            self._pending_progress = None
+            self._set_progress(percent, message)
+    
+    def _set_progress(self, percent: int, message: str):
+        """Write an update to the progress bar."""
+        self._last_progress_ts = time.monotonic()
+        # setValue/setFormat schedule a repaint; Qt coalesces them
+        self.progress_bar.setValue(percent)
+        self.progress_bar.setFormat(f"{message} ({percent}%)")
     
     def hide_progress(self):
         """Hide progress bar after completion."""
+        self._pending_progress = None
+        self._progress_timer.stop()
         if self.progress_bar:
             self.progress_bar.setVisible(False)
     
@@ -346,35 +657,42 @@ class BacktestWindow(QWidget):
             bar_tooltips: Optional debugging tooltips per bar index
             bar_decisions: Optional list of bar decision dicts from backtest_engine
         """
+        # Same results as last time: everything on screen is already current
+        fingerprint = self._results_fingerprint(
+            metrics, trades_df, equity_curve, settings, price_bars, bar_tooltips, bar_decisions
+        )
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            self.logger.debug("Backtest results unchanged, skipping redisplay")
+            self.hide_progress()
+            self._show_complete_status(metrics)
+            return
+        self._last_fingerprint = fingerprint
+        
         self.current_summary = summary
         self.current_metrics = metrics
         self.current_trades_df = trades_df
         self.current_equity_curve = equity_curve
+        # Equity values split out of the (time, equity) tuples once, for the chart
+        # widget and the equity curve view
+        self._equity_ys = np.fromiter(
+            (equity for _, equity in equity_curve), dtype=np.float64, count=len(equity_curve)
+        )
         self.current_bar_decisions = bar_decisions
         self.current_price_bars = price_bars
         
         # Load data into bar-by-bar chart
         if self.chart_widget and price_bars is not None:
             # Convert equity_curve to bar_idx format
-            equity_by_bar = []
-            for idx, (timestamp, equity_val) in enumerate(equity_curve):
-                equity_by_bar.append((idx, equity_val))
+            equity_by_bar = list(enumerate(self._equity_ys.tolist()))
             
-            # Convert trades DataFrame to list of dicts
-            trades_list = trades_df.to_dict('records') if not trades_df.empty else []
-            
-            # Load into chart widget
+            # Load into chart widget (it reads trades column-wise from the DataFrame)
             self.chart_widget.load_data(
                 price_bars=price_bars,
                 equity_curve=equity_by_bar,
-                trades=trades_list,
+                trades=trades_df,
                 bar_tooltips=bar_tooltips
             )
         
-        # Clear existing widgets
-        while self.summary_cards_layout.count():
-            self.summary_cards_layout.takeAt(0).widget().deleteLater()
-        
         # Display summary cards
         self._create_summary_cards(metrics)
         
@@ -384,19 +702,61 @@ class BacktestWindow(QWidget):
         # Display trades table
         self._display_trades_table(trades_df)
         
-        # Display statistics
-        self._display_statistics(metrics)
-        
-        # Display settings
-        self._display_settings(settings)
+        # Statistics and settings are built when their tab is shown
+        self._pending_metrics = metrics
+        self._pending_settings = settings
+        self._on_tab_changed(self.tabs.currentIndex())
         
-        # Load decision analyzer data
-        if self.decision_analyzer and bar_decisions and price_bars is not None:
-            self.decision_analyzer.load_data(bar_decisions, price_bars)
+        # Load decision analyzer data (now, or when its tab is first shown)
+        if HAS_DECISION_ANALYZER and bar_decisions and price_bars is not None:
+            if self.decision_analyzer:
+                self.decision_analyzer.load_data(bar_decisions, price_bars)
+            else:
+                self._pending_decisions = (bar_decisions, price_bars)
         
+        self._show_complete_status(metrics)
+    
+    def _show_complete_status(self, metrics: Dict):
+        """Show the trade count and net profit of a finished run in the status bar."""
         self.status_label.setText(f"Backtest complete: {metrics.get('total_trades', 0)} trades, "
                                  f"${metrics.get('net_profit', 0):.2f} net profit")
     
+    @staticmethod
+    def _frame_hash(df: Optional[pd.DataFrame]) -> Optional[tuple]:
+        """Shape and vectorized row hash of ``df`` (object columns hashed via str)."""
+        if df is None:
+            return None
+        object_cols = df.select_dtypes(include='object').columns
+        hashable = df.astype({c: str for c in object_cols}) if len(object_cols) else df
+        row_hashes = pd.util.hash_pandas_object(hashable, index=False).to_numpy()
+        return df.shape, hashlib.sha256(row_hashes.tobytes()).hexdigest()
+    
+    @classmethod
+    def _results_fingerprint(cls, metrics, trades_df, equity_curve, settings,
+                             price_bars, bar_tooltips, bar_decisions) -> Optional[tuple]:
+        """
+        Content fingerprint of display_results inputs, or None if it can't be computed.
+
+        Metrics, settings and tooltips are hashed from their sorted JSON;
+        trades, price bars and decisions (as a DataFrame) with a vectorized
+        row hash, and the equity values from their float64 bytes. Contents rather than object identity are used
+        because CPython reuses the ids of collected objects.
+        """
+        try:
+            return (
+                json.dumps(metrics, sort_keys=True, default=str),
+                json.dumps(settings, sort_keys=True, default=str),
+                json.dumps(bar_tooltips, sort_keys=True),
+                cls._frame_hash(trades_df),
+                cls._frame_hash(price_bars),
+                cls._frame_hash(None if bar_decisions is None else pd.DataFrame.from_records(bar_decisions)),
+                hashlib.sha256(np.fromiter(
+                    (equity for _, equity in equity_curve), dtype=np.float64, count=len(equity_curve)
+                ).tobytes()).hexdigest(),
+            )
+        except (TypeError, ValueError):
+            return None
+    
     def _create_summary_cards(self, metrics: Dict):
         """Create summary metric cards."""
         cards = [
@@ -412,34 +772,39 @@ class BacktestWindow(QWidget):
             ("Avg Bars Held", f"{metrics.get('avg_bars_held', 0):.0f}", None),
         ]
         
-        for i, (title, value, color) in enumerate(cards):
-            row = i // 4
-            col = i % 4
-            
-            card = self._create_card(title, value, color)
-            self.summary_cards_layout.addWidget(card, row, col)
+        # Cards are created on the first run and only updated afterwards
+        if not self._card_labels:
+            for i, (title, _, _) in enumerate(cards):
+                card, self._card_labels[title] = self._create_card(title)
+                self.summary_cards_layout.addWidget(card, i // 4, i % 4)
+        
+        for title, value, color in cards:
+            label = self._card_labels[title]
+            label.setText(value)
+            palette = label.palette()
+            palette.setColor(
+                QPalette.WindowText, CARD_VALUE_COLORS.get(color, self._card_text_color)
+            )
+            label.setPalette(palette)
     
-    def _create_card(self, title: str, value: str, color: Optional[str] = None) -> QGroupBox:
-        """Create a single metric card."""
+    def _create_card(self, title: str) -> Tuple[QGroupBox, QLabel]:
+        """Create a single metric card, returning it and its value label."""
         card = QGroupBox(title)
         layout = QVBoxLayout()
         
-        label = QLabel(value)
+        label = QLabel()
         font = label.font()
         font.setPointSize(14)
         font.setBold(True)
         label.setFont(font)
-        
-        if color == 'green':
-            label.setStyleSheet("color: #0f7938;")
-        elif color == 'red':
-            label.setStyleSheet("color: #d32f2f;")
+        if self._card_text_color is None:
+            self._card_text_color = label.palette().color(QPalette.WindowText)
         
         layout.addWidget(label)
         layout.setAlignment(label, Qt.AlignCenter)
         card.setLayout(layout)
         
-        return card
+        return card, label
     
     def _create_equity_curve(self, equity_curve: List[Tuple]):
         """Create equity curve chart."""
@@ -449,7 +814,8 @@ class BacktestWindow(QWidget):
                 return
             
             if not equity_curve:
-                self.chart_view.setTitle("No equity curve data")
+                self._equity_series = None
+                self.chart_view.chart().setTitle("No equity curve data")
                 return
             
             chart = QChart()
@@ -458,8 +824,11 @@ class BacktestWindow(QWidget):
             series = QLineSeries()
             series.setName("Equity")
             
-            for i, (time, equity) in enumerate(equity_curve):
-                series.append(i, equity)
+            # One replace() call instead of an append() per point, from the
+            # values display_results already extracted into _equity_ys
+            self._equity_series = series
+            self._equity_sample_step = 0
+            self._resample_equity_curve()
             
             chart.addSeries(series)
             chart.createDefaultAxes()
@@ -469,42 +838,71 @@ class BacktestWindow(QWidget):
         except Exception as e:
             self.logger.error(f"Error creating equity curve: {e}")
     
+    def _resample_equity_curve(self):
+        """Push a stride sample of the equity curve sized to the view width."""
+        ys = self._equity_ys
+        step = _equity_sample_step(len(ys), self.chart_view.width())
+        if step == self._equity_sample_step:
+            return
+        self._equity_sample_step = step
+        
+        idx = _equity_sample_indices(len(ys), step)
+        self._equity_series.replace([QPointF(x, y) for x, y in zip(idx.tolist(), ys[idx].tolist())])
+    
+    def eventFilter(self, watched, event):
+        """Re-sample the equity curve when the chart view is resized."""
+        if (
+            watched is self.chart_view
+            and event.type() == QEvent.Resize
+            and self._equity_series is not None
+        ):
+            self._resample_equity_curve()
+        return super().eventFilter(watched, event)
+    
     def _display_trades_table(self, trades_df: pd.DataFrame):
         """Display trades in table."""
-        self.trades_table.setRowCount(0)
-        self.trades_table.setColumnCount(0)
-        
         if trades_df.empty:
-            self.trades_table.setColumnCount(1)
-            self.trades_table.setHorizontalHeaderLabels(["No trades"])
-            return
-        
-        # Set columns
-        columns = list(trades_df.columns)
-        self.trades_table.setColumnCount(len(columns))
-        self.trades_table.setHorizontalHeaderLabels(columns)
-        
-        # Populate rows
-        self.trades_table.setRowCount(len(trades_df))
-        for row_idx, (_, row) in enumerate(trades_df.iterrows()):
-            for col_idx, val in enumerate(row):
-                item = QTableWidgetItem(str(val))
-                
-                # Color code PnL
-                if 'pnl' in columns[col_idx].lower() and isinstance(val, (int, float)):
-                    if val > 0:
-                        item.setBackground(QColor(200, 255, 200))
-                    elif val < 0:
-                        item.setBackground(QColor(255, 200, 200))
-                
-                self.trades_table.setItem(row_idx, col_idx, item)
-        
-        # Auto-resize columns
-        self.trades_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            trades_df = pd.DataFrame(columns=["No trades"])
+        
+        # The model wraps the DataFrame; cells are formatted only when painted
+        previous = self.trades_table.model()
+        self.trades_table.setModel(PandasTradesModel(trades_df, self.trades_table))
+        if previous is not None:
+            previous.deleteLater()
+        
+        # One-shot column widths from the header text
+        font_metrics = self.trades_table.fontMetrics()
+        for col_idx, name in enumerate(trades_df.columns):
+            self.trades_table.setColumnWidth(
+                col_idx, max(font_metrics.horizontalAdvance(str(name)) + 16, 80)
+            )
+    
+    def _on_tab_changed(self, index: int):
+        """Build pending Statistics/Settings text when its tab becomes visible."""
+        if index == self._stats_tab_index and self._pending_metrics is not None:
+            self._display_statistics(self._pending_metrics)
+            self._pending_metrics = None
+        elif index == self._settings_tab_index and self._pending_settings is not None:
+            self._display_settings(self._pending_settings)
+            self._pending_settings = None
+        elif index == self._analyzer_tab_index and self.decision_analyzer is None:
+            self._build_decision_analyzer()
+    
+    def _build_decision_analyzer(self):
+        """Create the decision analyzer in its tab and load any pending data."""
+        self.decision_analyzer = DecisionAnalyzerWidget(self.ui_config)
+        # Connect analyzer bar selection to chart
+        if self.chart_widget:
+            self.decision_analyzer.bar_selected.connect(self._on_analyzer_bar_selected)
+        self._analyzer_container.layout().addWidget(self.decision_analyzer)
+        
+        if self._pending_decisions is not None:
+            self.decision_analyzer.load_data(*self._pending_decisions)
+            self._pending_decisions = None
     
     def _display_statistics(self, metrics: Dict):
         """Display detailed statistics."""
-        stats_text = "Backtest Statistics\n\n"
+        parts = ["Backtest Statistics\n\n"]
         
         sections = {
             "Performance": [
@@ -523,26 +921,25 @@ class BacktestWindow(QWidget):
             ],
         }
         
+        separator = "-" * 40
         for section, keys in sections.items():
-            stats_text += f"{section}\n" + "-" * 40 + "\n"
+            parts.append(f"{section}\n{separator}\n")
             for key in keys:
                 if key in metrics:
                     value = metrics[key]
                     if isinstance(value, float):
-                        stats_text += f"  {key}: {value:.2f}\n"
+                        parts.append(f"  {key}: {value:.2f}\n")
                     else:
-                        stats_text += f"  {key}: {value}\n"
-            stats_text += "\n"
+                        parts.append(f"  {key}: {value}\n")
+            parts.append("\n")
         
-        self.stats_text.setText(stats_text)
+        self.stats_text.setText("".join(parts))
     
     def _display_settings(self, settings: Dict):
         """Display strategy settings snapshot."""
-        settings_text = "Strategy Settings\n\n"
-        
-        for key, value in settings.items():
-            settings_text += f"{key}: {value}\n"
-        
+        settings_text = "Strategy Settings\n\n" + "".join(
+            f"{key}: {value}\n" for key, value in settings.items()
+        )
         self.settings_text.setText(settings_text)
     
     def _on_analyzer_bar_selected(self, bar_index: int):
@@ -6,17 +6,207 @@ showing the decision pipeline breakdown, blocking reasons, and bar context.
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QPushButton, QComboBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView,
+    QHeaderView, QPushButton, QComboBox, QAbstractItemView,
     QGroupBox, QScrollArea, QFrame
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, List
 import logging
 
 
+# Fixed row height for the decisions table; uniform rows let the view skip
+# per-row size hints
+DECISION_ROW_HEIGHT = 28
+
+# Summary and table colors per fail code
+FAIL_CODE_COLORS = {
+    'PATTERN_NOT_PRESENT': '#888888',
+    'NO_BREAKOUT_CONFIRMATION': '#FF9800',
+    'TREND_FILTER_BLOCK': '#F44336',
+    'MOMENTUM_TOO_WEAK': '#9C27B0',
+    'QUALITY_GATE_FAIL': '#FF5722',
+    'EXECUTION_GUARD_BLOCK': '#E91E63',
+    'RISK_MODEL_FAIL': '#FF1744',
+    'UNKNOWN_BLOCK': '#607D8B',
+}
+DEFAULT_FAIL_CODE_COLOR = '#888888'
+
+# price_data columns shown in the bar context panel
+BAR_CONTEXT_COLUMNS = ('open', 'high', 'low', 'close', 'atr14', 'ema50', 'ema200')
+
+# Section separator in the bar context panel
+CONTEXT_RULE = "<hr style='border: 1px solid #424242;'>"
+
+# Position preview lines for TRADE_ALLOWED decisions: (decision key, line template)
+POSITION_PREVIEW_LINES = (
+    ('planned_entry', "  <b>Planned Entry Price:</b> <span style='color: #2196F3;'>{:.2f}</span>"),
+    ('planned_sl', "  <b>Planned SL:</b> <span style='color: #F44336;'>{:.2f}</span>"),
+    ('planned_tp1', "  <b>Planned TP1:</b> <span style='color: #4CAF50;'>{:.2f}</span> (50%)"),
+    ('planned_tp2', "  <b>Planned TP2:</b> <span style='color: #4CAF50;'>{:.2f}</span> (75%)"),
+    ('planned_tp3', "  <b>Planned TP3:</b> <span style='color: #4CAF50;'>{:.2f}</span> (100%)"),
+    ('calculated_risk_usd', "  <b>Calculated Risk:</b> <span style='color: #FF9800;'>${:.2f}</span>"),
+    ('calculated_rr', "  <b>Risk:Reward Ratio:</b> <span style='color: #2196F3;'>1:{:.1f}</span>"),
+    ('position_size', "  <b>Position Size:</b> {:.2f} lots"),
+)
+
+# Bar-close guard flags: (label, decision key); missing flags count as passed
+GUARD_CHECKS = (
+    ("Using Closed Bar", 'using_closed_bar'),
+    ("Tick Noise Filter", 'tick_noise_filter_passed'),
+    ("Anti-FOMO", 'anti_fomo_passed'),
+)
+
+# The 8-stage decision pipeline, in evaluation order
+PIPELINE_STAGES = (
+    ("1", "PATTERN_DETECTION"),
+    ("2", "PATTERN_QUALITY"),
+    ("3", "BREAKOUT_CONFIRMATION"),
+    ("4", "TREND_FILTER"),
+    ("5", "MOMENTUM_FILTER"),
+    ("6", "QUALITY_GATE"),
+    ("7", "EXECUTION_GUARDS"),
+    ("8", "RISK_MODEL"),
+)
+
+# Stage name -> position in the pipeline (1-8); unknown stages sort last
+STAGE_ORDER = {stage_name: int(num) for num, stage_name in PIPELINE_STAGES}
+UNKNOWN_STAGE_ORDER = 999
+
+
+def _score_color(score: float) -> str:
+    """Green/orange/red for a 0-10 quality score."""
+    if score >= 7.0:
+        return "#4CAF50"
+    if score >= 5.0:
+        return "#FF9800"
+    return "#F44336"
+
+
+class BarDecisionsModel(QAbstractTableModel):
+    """
+    Read-only table model over bar decisions.
+    
+    Only the indices of decisions passing the current filter are stored;
+    cells are built on demand, so the view only touches visible rows.
+    Qt.UserRole returns the decision dict of a row.
+    """
+    
+    HEADERS = ["Bar #", "Time", "Decision", "Stage", "Fail Code", "Reason", "Context"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fail_code_qcolors = {
+            code: QColor(color) for code, color in FAIL_CODE_COLORS.items()
+        }
+        self._default_fail_qcolor = QColor(DEFAULT_FAIL_CODE_COLOR)
+        self._decisions = []
+        # Per-decision decision / fail_code values the filter compares against
+        self._decision_keys = np.empty(0, dtype=object)
+        self._fail_code_keys = np.empty(0, dtype=object)
+        self._visible_idx = np.empty(0, dtype=np.intp)
+        self.pass_color = QColor('green')
+        self.fail_color = QColor('red')
+        self._other_color = QColor('#888')
+    
+    def set_decisions(self, decisions: List[Dict]):
+        """Replace the decisions list and show all of it."""
+        self.beginResetModel()
+        self._decisions = decisions or []
+        self._decision_keys = np.array([d['decision'] for d in self._decisions], dtype=object)
+        self._fail_code_keys = np.array([d.get('fail_code') for d in self._decisions], dtype=object)
+        self._visible_idx = np.arange(len(self._decisions))
+        self.endResetModel()
+    
+    def set_colors(self, pass_color: str, fail_color: str):
+        """Set the decision column colors from the stage color scheme."""
+        self.pass_color = QColor(pass_color)
+        self.fail_color = QColor(fail_color)
+    
+    def set_filter(self, filter_code: Optional[str] = None):
+        """
+        Show only decisions matching a filter.
+        
+        Args:
+            filter_code: TRADE_ALLOWED, PATTERN_NOT_PRESENT or a fail code;
+                None or "All Decisions" shows everything
+        """
+        self.beginResetModel()
+        if filter_code and filter_code != "All Decisions":
+            # TRADE_ALLOWED / PATTERN_NOT_PRESENT match the decision itself (a
+            # NO_TRADE bar with fail_code PATTERN_NOT_PRESENT is not included);
+            # anything else matches the fail code
+            if filter_code in ("TRADE_ALLOWED", "PATTERN_NOT_PRESENT"):
+                keys = self._decision_keys
+            else:
+                keys = self._fail_code_keys
+            self._visible_idx = np.flatnonzero(keys == filter_code)
+        else:
+            self._visible_idx = np.arange(len(self._decisions))
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible_idx)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        decision = self._decisions[self._visible_idx[index.row()]]
+        col = index.column()
+        
+        if role == Qt.UserRole:
+            return decision
+        
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return str(decision.get('bar_index', '-'))
+            if col == 1:
+                return str(decision.get('time', '-'))
+            if col == 2:
+                return decision['decision']
+            if col == 3:
+                return decision.get('stage', '-')
+            if col == 4:
+                return decision.get('fail_code', '-')
+            if col == 5:
+                return decision.get('fail_message', '-')
+            return "CTX"
+        
+        if role == Qt.TextAlignmentRole:
+            if col in (0, 2, 6):
+                return int(Qt.AlignCenter)
+            return None
+        
+        if role == Qt.ForegroundRole:
+            if col == 2:
+                dec_text = decision['decision']
+                if dec_text == 'TRADE_ALLOWED':
+                    return self.pass_color
+                if dec_text == 'NO_TRADE':
+                    return self.fail_color
+                return self._other_color
+            if col == 4:
+                fail_code = decision.get('fail_code', '-')
+                if fail_code != '-':
+                    return self._fail_code_qcolors.get(fail_code, self._default_fail_qcolor)
+            return None
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+
 class DecisionAnalyzerWidget(QWidget):
     """
     Widget for analyzing bar-by-bar trading decisions.
@@ -41,12 +231,27 @@ class DecisionAnalyzerWidget(QWidget):
         """
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
-        self.config = config
+        self.config = config  # Also caches the stage color scheme
         self.bar_decisions = None
         self.price_data = None
+        self._price_cols = {}  # BAR_CONTEXT_COLUMNS present in price_data, as arrays
+        self._decisions_df = None  # Columnar copy of bar_decisions
+        # Distinct NO_TRADE fail codes (sorted, '' for missing) and their counts
+        self._fail_codes = np.empty(0, dtype=object)
+        self._fail_code_counts = np.empty(0, dtype=np.int64)
         
         self._setup_ui()
         
+    @property
+    def config(self) -> Dict:
+        """UI configuration dict."""
+        return self._config
+    
+    @config.setter
+    def config(self, config: Dict):
+        self._config = config
+        self._color_scheme = config.get('stage_breakdown_panel', {}).get('color_scheme', {})
+    
     def _setup_ui(self):
         """Set up the widget layout."""
         layout = QVBoxLayout(self)
@@ -127,25 +332,23 @@ class DecisionAnalyzerWidget(QWidget):
         group.setLayout(layout)
         return group
     
-    def _create_decisions_table(self) -> QTableWidget:
+    def _create_decisions_table(self) -> QTableView:
         """Create decisions table with stage breakdown."""
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels([
-            "Bar #", "Time", "Decision", "Stage", "Fail Code", "Reason", "Context"
-        ])
+        table = QTableView()
+        self.decisions_model = BarDecisionsModel(table)
+        table.setModel(self.decisions_model)
         
         # Style
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1E1E1E;
                 gridline-color: #424242;
                 border: 1px solid #424242;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #2196F3;
             }
             QHeaderView::section {
@@ -167,9 +370,14 @@ class DecisionAnalyzerWidget(QWidget):
         header.setSectionResizeMode(5, QHeaderView.Stretch)          # Reason
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # Context
         
-        table.setSelectionBehavior(QTableWidget.SelectRows)
-        table.setSelectionMode(QTableWidget.SingleSelection)
-        table.itemSelectionChanged.connect(self._on_row_selected)
+        # Uniform row heights
+        vertical_header = table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(DECISION_ROW_HEIGHT)
+        
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+        table.selectionModel().selectionChanged.connect(self._on_row_selected)
         
         return table
     
@@ -213,6 +421,12 @@ class DecisionAnalyzerWidget(QWidget):
         """
         self.bar_decisions = bar_decisions
         self.price_data = price_data
+        self._price_cols = {} if price_data is None else {
+            col: price_data[col].to_numpy()
+            for col in BAR_CONTEXT_COLUMNS if col in price_data.columns
+        }
+        self.decisions_model.set_decisions(bar_decisions)
+        self._index_decisions()
         
         # Update filter combo with available fail codes
         self._update_fail_code_filter()
@@ -225,26 +439,40 @@ class DecisionAnalyzerWidget(QWidget):
         
         self.logger.info(f"Loaded {len(bar_decisions)} bar decisions for analysis")
     
+    def _index_decisions(self):
+        """Build columnar arrays and fail code counts for the loaded decisions."""
+        if not self.bar_decisions:
+            self._decisions_df = None
+            self._fail_codes = np.empty(0, dtype=object)
+            self._fail_code_counts = np.empty(0, dtype=np.int64)
+            return
+        
+        self._decisions_df = pd.DataFrame(self.bar_decisions)
+        decisions = self._decisions_df['decision'].to_numpy(dtype=object)
+        if 'fail_code' in self._decisions_df.columns:
+            codes = self._decisions_df['fail_code'].fillna('').to_numpy(dtype=object)
+        else:
+            codes = np.full(len(decisions), '', dtype=object)
+        
+        self._fail_codes, self._fail_code_counts = np.unique(
+            codes[decisions == 'NO_TRADE'].astype(str), return_counts=True
+        )
+    
     def _update_fail_code_filter(self):
         """Update fail code filter combo box."""
         if not self.bar_decisions:
             return
         
-        # Get unique fail codes
-        fail_codes = set()
-        for decision in self.bar_decisions:
-            if decision['decision'] == 'NO_TRADE' and decision.get('fail_code'):
-                fail_codes.add(decision['fail_code'])
-        
         # Update combo
         self.fail_code_combo.clear()
         self.fail_code_combo.addItem("All Decisions")
         self.fail_code_combo.addItem("TRADE_ALLOWED")
         self.fail_code_combo.addItem("PATTERN_NOT_PRESENT")
         
-        for code in sorted(fail_codes):
-            if code not in ["PATTERN_NOT_PRESENT"]:
-                self.fail_code_combo.addItem(code)
+        # _fail_codes is already sorted by np.unique
+        for code in self._fail_codes:
+            if code and code != "PATTERN_NOT_PRESENT":
+                self.fail_code_combo.addItem(str(code))
     
     def _update_summary(self):
         """Update reason distribution summary."""
@@ -252,18 +480,10 @@ class DecisionAnalyzerWidget(QWidget):
             self.summary_label.setText("No data loaded")
             return
         
-        # Count by fail code
-        fail_counts = {}
-        total_no_trade = 0
-        total_allowed = 0
-        
-        for decision in self.bar_decisions:
-            if decision['decision'] == 'NO_TRADE':
-                total_no_trade += 1
-                code = decision.get('fail_code', 'UNKNOWN')
-                fail_counts[code] = fail_counts.get(code, 0) + 1
-            elif decision['decision'] == 'TRADE_ALLOWED':
-                total_allowed += 1
+        # Counts come from the arrays built in _index_decisions
+        decisions = self._decisions_df['decision'].to_numpy(dtype=object)
+        total_no_trade = int(self._fail_code_counts.sum())
+        total_allowed = int((decisions == 'TRADE_ALLOWED').sum())
         
         # Build summary text
         total_bars = len(self.bar_decisions)
@@ -276,11 +496,13 @@ class DecisionAnalyzerWidget(QWidget):
         ]
         
         # Sort by count descending
-        sorted_fails = sorted(fail_counts.items(), key=lambda x: x[1], reverse=True)
+        order = np.argsort(-self._fail_code_counts, kind='stable')
         
-        for code, count in sorted_fails:
+        fail_code_color = FAIL_CODE_COLORS.get
+        for code, count in zip(self._fail_codes[order], self._fail_code_counts[order]):
+            code = code or 'UNKNOWN'
             percent = count / total_no_trade * 100 if total_no_trade > 0 else 0
-            color = self._get_fail_code_color(code)
+            color = fail_code_color(code, DEFAULT_FAIL_CODE_COLOR)
             summary_lines.append(
                 f"<span style='color: {color};'>▪</span> <b>{code}:</b> {count} ({percent:.1f}%)"
             )
@@ -334,119 +556,50 @@ class DecisionAnalyzerWidget(QWidget):
         if not self.bar_decisions:
             return
         
-        self.decisions_table.setRowCount(0)
-        
-        color_scheme = self.config.get('stage_breakdown_panel', {}).get('color_scheme', {})
-        pass_color = color_scheme.get('pass', 'green')
-        fail_color = color_scheme.get('fail', 'red')
+        color_scheme = self._color_scheme
         
-        for decision in self.bar_decisions:
-            # Apply filter
-            if filter_code and filter_code != "All Decisions":
-                if filter_code == "TRADE_ALLOWED":
-                    if decision['decision'] != 'TRADE_ALLOWED':
-                        continue
-                elif filter_code == "PATTERN_NOT_PRESENT":
-                    if decision['decision'] != 'PATTERN_NOT_PRESENT':
-                        continue
-                else:
-                    if decision.get('fail_code') != filter_code:
-                        continue
-            
-            row = self.decisions_table.rowCount()
-            self.decisions_table.insertRow(row)
-            
-            # Bar #
-            bar_item = QTableWidgetItem(str(decision.get('bar_index', '-')))
-            bar_item.setTextAlignment(Qt.AlignCenter)
-            self.decisions_table.setItem(row, 0, bar_item)
-            
-            # Time
-            time_item = QTableWidgetItem(str(decision.get('time', '-')))
-            self.decisions_table.setItem(row, 1, time_item)
-            
-            # Decision
-            dec_text = decision['decision']
-            dec_item = QTableWidgetItem(dec_text)
-            dec_item.setTextAlignment(Qt.AlignCenter)
-            
-            if dec_text == 'TRADE_ALLOWED':
-                dec_item.setForeground(QColor(pass_color))
-            elif dec_text == 'NO_TRADE':
-                dec_item.setForeground(QColor(fail_color))
-            else:
-                dec_item.setForeground(QColor('#888'))
-            
-            self.decisions_table.setItem(row, 2, dec_item)
-            
-            # Stage
-            stage_item = QTableWidgetItem(decision.get('stage', '-'))
-            self.decisions_table.setItem(row, 3, stage_item)
-            
-            # Fail Code
-            fail_code = decision.get('fail_code', '-')
-            fail_item = QTableWidgetItem(fail_code)
-            if fail_code != '-':
-                fail_item.setForeground(QColor(self._get_fail_code_color(fail_code)))
-            self.decisions_table.setItem(row, 4, fail_item)
-            
-            # Reason
-            reason = decision.get('fail_message', '-')
-            reason_item = QTableWidgetItem(reason)
-            self.decisions_table.setItem(row, 5, reason_item)
-            
-            # Context button
-            context_btn_item = QTableWidgetItem("CTX")
-            context_btn_item.setTextAlignment(Qt.AlignCenter)
-            self.decisions_table.setItem(row, 6, context_btn_item)
+        # Color change and model reset land in a single repaint; the view
+        # only queries the rows it paints
+        table = self.decisions_table
+        table.setUpdatesEnabled(False)
+        try:
+            self.decisions_model.set_colors(
+                color_scheme.get('pass', 'green'), color_scheme.get('fail', 'red')
+            )
+            self.decisions_model.set_filter(filter_code)
+        finally:
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+        if hasattr(self, 'context_panel'):
+            self.context_panel.hide()
     
-    def _get_fail_code_color(self, fail_code: str) -> str:
+    @staticmethod
+    def _get_fail_code_color(fail_code: str) -> str:
         """Get color for fail code."""
-        color_map = {
-            'PATTERN_NOT_PRESENT': '#888888',
-            'NO_BREAKOUT_CONFIRMATION': '#FF9800',
-            'TREND_FILTER_BLOCK': '#F44336',
-            'MOMENTUM_TOO_WEAK': '#9C27B0',
-            'QUALITY_GATE_FAIL': '#FF5722',
-            'EXECUTION_GUARD_BLOCK': '#E91E63',
-            'RISK_MODEL_FAIL': '#FF1744',
-            'UNKNOWN_BLOCK': '#607D8B',
-        }
-        return color_map.get(fail_code, '#888888')
+        return FAIL_CODE_COLORS.get(fail_code, DEFAULT_FAIL_CODE_COLOR)
     
     def _on_filter_changed(self, index: int):
         """Handle filter combo change."""
         filter_text = self.fail_code_combo.currentText()
         self._populate_table(filter_text)
     
-    def _on_row_selected(self):
+    def _on_row_selected(self, selected=None, deselected=None):
         """Handle row selection in decisions table."""
-        selected = self.decisions_table.selectedItems()
-        if not selected:
+        selected_rows = self.decisions_table.selectionModel().selectedRows()
+        if not selected_rows:
             self.context_panel.hide()
             return
         
-        row = selected[0].row()
-        
-        # Get decision for this row
-        bar_index_item = self.decisions_table.item(row, 0)
-        if not bar_index_item:
+        # The model hands back the row's own decision, so repeated bar
+        # indices still show the selected one
+        decision = self.decisions_model.index(selected_rows[0].row(), 0).data(Qt.UserRole)
+        if not decision:
             return
         
         try:
-            bar_index = int(bar_index_item.text())
-        except (ValueError, AttributeError, TypeError):
-            # Invalid bar index input, silently return
-            return
-        
-        # Find decision
-        decision = None
-        for dec in self.bar_decisions:
-            if dec.get('bar_index') == bar_index:
-                decision = dec
-                break
-        
-        if not decision:
+            bar_index = int(decision.get('bar_index'))
+        except (ValueError, TypeError):
+            # Decision without a usable bar index, silently return
             return
         
         # Show context panel
@@ -463,239 +616,161 @@ class DecisionAnalyzerWidget(QWidget):
             decision: Decision dict
             bar_index: Bar index
         """
-        if not self.config.get('bar_context_panel', {}).get('enabled', True):
+        panel_config = self.config.get('bar_context_panel', {})
+        if not panel_config.get('enabled', True):
             return
         
-        fields = self.config.get('bar_context_panel', {}).get('fields', [])
+        if self.price_data is None or bar_index >= len(self.price_data):
+            self.context_panel.hide()
+            return
         
-        # Get bar data
-        if self.price_data is not None and bar_index < len(self.price_data):
-            bar = self.price_data.iloc[bar_index]
-            
-            context_lines = [f"<b style='font-size: 14px;'>Bar #{bar_index}</b>", ""]
-            
-            # ===== FINAL DECISION STATE =====
-            context_lines.append("<b style='color: #2196F3; font-size: 13px;'>🎯 FINAL DECISION STATE:</b>")
-            context_lines.append("<hr style='border: 1px solid #424242;'>")
-            
-            dec_timestamp = decision.get('decision_timestamp', decision.get('time', '-'))
-            dec_source = decision.get('decision_source', 'Backtest')
-            dec_summary = decision.get('decision_summary', decision['decision'])
-            
-            color_scheme = self.config.get('stage_breakdown_panel', {}).get('color_scheme', {})
-            pass_color = color_scheme.get('pass', 'green')
-            fail_color = color_scheme.get('fail', 'red')
-            
-            dec_color = pass_color if decision['decision'] == 'TRADE_ALLOWED' else fail_color
-            
-            context_lines.append(f"  <b>Decision:</b> <span style='color: {dec_color}; font-weight: bold; font-size: 13px;'>{dec_summary}</span>")
-            context_lines.append(f"  <b>Timestamp:</b> {dec_timestamp}")
-            context_lines.append(f"  <b>Source:</b> {dec_source}")
-            
-            if decision['decision'] == 'NO_TRADE':
-                fail_code = decision.get('fail_code', '-')
-                reason = decision.get('fail_message', '-')
-                context_lines.append(f"  <b>Reason:</b> <span style='color: {fail_color};'>{fail_code}</span>")
-                context_lines.append(f"  <b>Details:</b> {reason}")
-            
-            context_lines.append("")
-            
-            # ===== POSITION INTENT / PREVIEW =====
-            if decision['decision'] == 'TRADE_ALLOWED':
-                context_lines.append("<b style='color: #4CAF50; font-size: 13px;'>POSITION PREVIEW:</b>")
-                context_lines.append("<hr style='border: 1px solid #424242;'>")
-                
-                entry = decision.get('planned_entry', None)
-                sl = decision.get('planned_sl', None)
-                tp1 = decision.get('planned_tp1', None)
-                tp2 = decision.get('planned_tp2', None)
-                tp3 = decision.get('planned_tp3', None)
-                risk_usd = decision.get('calculated_risk_usd', None)
-                rr = decision.get('calculated_rr', None)
-                position_size = decision.get('position_size', None)
-                
-                if entry:
-                    context_lines.append(f"  <b>Planned Entry Price:</b> <span style='color: #2196F3;'>{entry:.2f}</span>")
-                if sl:
-                    context_lines.append(f"  <b>Planned SL:</b> <span style='color: #F44336;'>{sl:.2f}</span>")
-                if tp1:
-                    context_lines.append(f"  <b>Planned TP1:</b> <span style='color: #4CAF50;'>{tp1:.2f}</span> (50%)")
-                if tp2:
-                    context_lines.append(f"  <b>Planned TP2:</b> <span style='color: #4CAF50;'>{tp2:.2f}</span> (75%)")
-                if tp3:
-                    context_lines.append(f"  <b>Planned TP3:</b> <span style='color: #4CAF50;'>{tp3:.2f}</span> (100%)")
-                if risk_usd:
-                    context_lines.append(f"  <b>Calculated Risk:</b> <span style='color: #FF9800;'>${risk_usd:.2f}</span>")
-                if rr:
-                    context_lines.append(f"  <b>Risk:Reward Ratio:</b> <span style='color: #2196F3;'>1:{rr:.1f}</span>")
-                if position_size:
-                    context_lines.append(f"  <b>Position Size:</b> {position_size:.2f} lots")
-                
-                context_lines.append("")
-            
-            # ===== QUALITY GATE / SCORE BREAKDOWN =====
-            quality_score = decision.get('entry_quality_score', None)
-            quality_breakdown = decision.get('quality_breakdown', None)
-            
-            if quality_score is not None:
-                context_lines.append("<b style='color: #FF9800; font-size: 13px;'>⭐ ENTRY QUALITY SCORE:</b>")
-                context_lines.append("<hr style='border: 1px solid #424242;'>")
-                
-                # Overall score with color coding
-                if quality_score >= 7.0:
-                    score_color = "#4CAF50"  # Green
-                elif quality_score >= 5.0:
-                    score_color = "#FF9800"  # Orange
-                else:
-                    score_color = "#F44336"  # Red
-                
-                context_lines.append(f"  <b>Overall Quality:</b> <span style='color: {score_color}; font-weight: bold; font-size: 14px;'>{quality_score:.1f} / 10</span>")
-                
-                if quality_breakdown:
-                    context_lines.append(f"  <b>Breakdown:</b>")
-                    for component, score in quality_breakdown.items():
-                        # Color code each component
-                        if score >= 7.0:
-                            comp_color = "#4CAF50"
-                        elif score >= 5.0:
-                            comp_color = "#FF9800"
-                        else:
-                            comp_color = "#F44336"
-                        
-                        context_lines.append(f"    • <b>{component.capitalize()}:</b> <span style='color: {comp_color};'>{score:.1f}</span>")
-                
-                context_lines.append("")
-            
-            # ===== BAR-CLOSE / GUARD STATUS =====
-            context_lines.append("<b style='color: #9C27B0; font-size: 13px;'>BAR-CLOSE GUARD STATUS:</b>")
-            context_lines.append("<hr style='border: 1px solid #424242;'>")
-            
-            last_closed_bar = decision.get('last_closed_bar_time', dec_timestamp)
-            using_closed = decision.get('using_closed_bar', True)
-            tick_noise = decision.get('tick_noise_filter_passed', True)
-            anti_fomo = decision.get('anti_fomo_passed', True)
-            
-            context_lines.append(f"  <b>Last Closed Bar Time:</b> {last_closed_bar}")
-            
-            guard_color = "#4CAF50" if using_closed else "#F44336"
-            context_lines.append(f"  <b>Using Closed Bar:</b> <span style='color: {guard_color};'>{'PASS' if using_closed else 'FAIL'}</span>")
-            
-            tick_color = "#4CAF50" if tick_noise else "#F44336"
-            context_lines.append(f"  <b>Tick Noise Filter:</b> <span style='color: {tick_color};'>{'PASS' if tick_noise else 'FAIL'}</span>")
-            
-            fomo_color = "#4CAF50" if anti_fomo else "#F44336"
-            context_lines.append(f"  <b>Anti-FOMO:</b> <span style='color: {fomo_color};'>{'PASS' if anti_fomo else 'FAIL'}</span>")
-            
-            context_lines.append("")
-            
-            # ===== STAGE CHECKLIST PANEL =====
-            if self.config.get('stage_breakdown_panel', {}).get('enabled', True):
-                context_lines.append("<b style='color: #FF9800; font-size: 13px;'>8-STAGE DECISION PIPELINE:</b>")
-                context_lines.append("<hr style='border: 1px solid #424242;'>")
-                
-                # Define all 8 stages
-                stages = [
-                    ("1", "PATTERN_DETECTION"),
-                    ("2", "PATTERN_QUALITY"),
-                    ("3", "BREAKOUT_CONFIRMATION"),
-                    ("4", "TREND_FILTER"),
-                    ("5", "MOMENTUM_FILTER"),
-                    ("6", "QUALITY_GATE"),
-                    ("7", "EXECUTION_GUARDS"),
-                    ("8", "RISK_MODEL")
+        # Scalars of this bar only, read from the cached column arrays
+        bar = {col: values[bar_index] for col, values in self._price_cols.items()}
+        
+        # Read the decision fields once
+        g = decision.get
+        dec = decision['decision']
+        is_allowed = dec == 'TRADE_ALLOWED'
+        dec_timestamp = g('decision_timestamp', g('time', '-'))
+        
+        color_scheme = self._color_scheme
+        pass_color = color_scheme.get('pass', 'green')
+        fail_color = color_scheme.get('fail', 'red')
+        dec_color = pass_color if is_allowed else fail_color
+        
+        # ===== FINAL DECISION STATE =====
+        lines = [
+            f"<b style='font-size: 14px;'>Bar #{bar_index}</b>",
+            "",
+            "<b style='color: #2196F3; font-size: 13px;'>🎯 FINAL DECISION STATE:</b>",
+            CONTEXT_RULE,
+            f"  <b>Decision:</b> <span style='color: {dec_color}; font-weight: bold; font-size: 13px;'>{g('decision_summary', dec)}</span>",
+            f"  <b>Timestamp:</b> {dec_timestamp}",
+            f"  <b>Source:</b> {g('decision_source', 'Backtest')}",
+        ]
+        if dec == 'NO_TRADE':
+            lines += [
+                f"  <b>Reason:</b> <span style='color: {fail_color};'>{g('fail_code', '-')}</span>",
+                f"  <b>Details:</b> {g('fail_message', '-')}",
+            ]
+        lines.append("")
+        
+        # ===== POSITION INTENT / PREVIEW =====
+        if is_allowed:
+            lines += ["<b style='color: #4CAF50; font-size: 13px;'>POSITION PREVIEW:</b>", CONTEXT_RULE]
+            lines += [
+                template.format(value)
+                for key, template in POSITION_PREVIEW_LINES
+                if (value := g(key))
+            ]
+            lines.append("")
+        
+        # ===== QUALITY GATE / SCORE BREAKDOWN =====
+        quality_score = g('entry_quality_score')
+        if quality_score is not None:
+            lines += [
+                "<b style='color: #FF9800; font-size: 13px;'>⭐ ENTRY QUALITY SCORE:</b>",
+                CONTEXT_RULE,
+                f"  <b>Overall Quality:</b> <span style='color: {_score_color(quality_score)}; font-weight: bold; font-size: 14px;'>{quality_score:.1f} / 10</span>",
+            ]
+            quality_breakdown = g('quality_breakdown')
+            if quality_breakdown:
+                lines.append("  <b>Breakdown:</b>")
+                lines += [
+                    f"    • <b>{component.capitalize()}:</b> <span style='color: {_score_color(score)};'>{score:.1f}</span>"
+                    for component, score in quality_breakdown.items()
                 ]
+            lines.append("")
+        
+        # ===== BAR-CLOSE / GUARD STATUS =====
+        lines += [
+            "<b style='color: #9C27B0; font-size: 13px;'>BAR-CLOSE GUARD STATUS:</b>",
+            CONTEXT_RULE,
+            f"  <b>Last Closed Bar Time:</b> {g('last_closed_bar_time', dec_timestamp)}",
+        ]
+        for label, key in GUARD_CHECKS:
+            passed = g(key, True)
+            lines.append(
+                f"  <b>{label}:</b> <span style='color: {'#4CAF50' if passed else '#F44336'};'>{'PASS' if passed else 'FAIL'}</span>"
+            )
+        lines.append("")
+        
+        # ===== STAGE CHECKLIST PANEL =====
+        if self.config.get('stage_breakdown_panel', {}).get('enabled', True):
+            lines += ["<b style='color: #FF9800; font-size: 13px;'>8-STAGE DECISION PIPELINE:</b>", CONTEXT_RULE]
+            
+            current_stage = g('stage', '')
+            fail_code = g('fail_code', '')
+            skip_color = color_scheme.get('skipped', 'gray')
+            stage_order = STAGE_ORDER.get
+            current_order = stage_order(current_stage, UNKNOWN_STAGE_ORDER)
+            
+            for num, stage_name in PIPELINE_STAGES:
+                # Determine stage status
+                if is_allowed:
+                    # All stages passed
+                    status, color, status_text = "PASS", pass_color, "PASS"
+                elif stage_name == current_stage:
+                    # This stage failed
+                    status, color, status_text = "FAIL", fail_color, f"FAIL - {fail_code}"
+                elif stage_order(stage_name, UNKNOWN_STAGE_ORDER) < current_order:
+                    # Stage passed (before failure)
+                    status, color, status_text = "PASS", pass_color, "PASS"
+                else:
+                    # Stage not evaluated (after failure)
+                    status, color, status_text = "SKIPPED", skip_color, "SKIPPED"
                 
-                current_stage = decision.get('stage', '')
-                fail_code = decision.get('fail_code', '')
-                is_allowed = decision['decision'] == 'TRADE_ALLOWED'
-                
-                skip_color = color_scheme.get('skipped', 'gray')
-                
-                for num, stage_name in stages:
-                    # Determine stage status
-                    if is_allowed:
-                        # All stages passed
-                        status = "PASS"
-                        color = pass_color
-                        status_text = "PASS"
-                    elif stage_name == current_stage:
-                        # This stage failed
-                        status = "FAIL"
-                        color = fail_color
-                        status_text = f"FAIL - {fail_code}"
-                    elif self._stage_order(stage_name) < self._stage_order(current_stage):
-                        # Stage passed (before failure)
-                        status = "PASS"
-                        color = pass_color
-                        status_text = "PASS"
-                    else:
-                        # Stage not evaluated (after failure)
-                        status = "SKIPPED"
-                        color = skip_color
-                        status_text = "SKIPPED"
-                    
-                    context_lines.append(
-                        f"  <span style='color: {color};'>{status} <b>Stage {num}:</b> {stage_name} - {status_text}</span>"
-                    )
-                
-                context_lines.append("")
-            
-            # ===== BAR CONTEXT (OHLC, Indicators) =====
-            context_lines.append("<b style='font-size: 13px;'>BAR DATA & INDICATORS:</b>")
-            context_lines.append("<hr style='border: 1px solid #424242;'>")
-            
-            for field in fields:
-                if field == 'time':
-                    context_lines.append(f"  <b>Time:</b> {decision.get('time', '-')}")
-                elif field == 'close_price' and 'close' in bar:
-                    context_lines.append(f"  <b>Close:</b> {bar['close']:.2f}")
-                elif field == 'atr' and 'atr14' in bar:
-                    context_lines.append(f"  <b>ATR14:</b> {bar['atr14']:.2f}")
-                elif field == 'neckline_distance':
-                    context_lines.append(f"  <b>Neckline Distance:</b> N/A")
-                elif field == 'cooldown_status':
-                    context_lines.append(f"  <b>Cooldown:</b> N/A")
-                elif field == 'regime':
-                    if 'ema50' in bar and 'ema200' in bar:
-                        regime = "Bullish" if bar['ema50'] > bar['ema200'] else "Bearish"
-                        regime_color = "#4CAF50" if regime == "Bullish" else "#F44336"
-                        context_lines.append(f"  <b>Regime:</b> <span style='color: {regime_color};'>{regime}</span>")
-            
-            # Show OHLC data
-            if 'open' in bar and 'high' in bar and 'low' in bar and 'close' in bar:
-                context_lines.append(f"  <b>Open:</b> {bar['open']:.2f}")
-                context_lines.append(f"  <b>High:</b> {bar['high']:.2f}")
-                context_lines.append(f"  <b>Low:</b> {bar['low']:.2f}")
-                context_lines.append(f"  <b>Close:</b> {bar['close']:.2f}")
-            
-            # Show EMAs
-            if 'ema50' in bar and 'ema200' in bar:
-                context_lines.append(f"  <b>EMA50:</b> {bar['ema50']:.2f}")
-                context_lines.append(f"  <b>EMA200:</b> {bar['ema200']:.2f}")
+                lines.append(
+                    f"  <span style='color: {color};'>{status} <b>Stage {num}:</b> {stage_name} - {status_text}</span>"
+                )
             
-            self.context_label.setText("<br>".join(context_lines))
-            self.context_panel.show()
-        else:
-            self.context_panel.hide()
-    
-    def _stage_order(self, stage_name: str) -> int:
-        """Return the order index of a stage (1-8)."""
-        stages_order = {
-            "PATTERN_DETECTION": 1,
-            "PATTERN_QUALITY": 2,
-            "BREAKOUT_CONFIRMATION": 3,
-            "TREND_FILTER": 4,
-            "MOMENTUM_FILTER": 5,
-            "QUALITY_GATE": 6,
-            "EXECUTION_GUARDS": 7,
-            "RISK_MODEL": 8
-        }
-        return stages_order.get(stage_name, 999)
+            lines.append("")
+        
+        # ===== BAR CONTEXT (OHLC, Indicators) =====
+        lines += ["<b style='font-size: 13px;'>BAR DATA & INDICATORS:</b>", CONTEXT_RULE]
+        
+        for field in panel_config.get('fields', []):
+            if field == 'time':
+                lines.append(f"  <b>Time:</b> {g('time', '-')}")
+            elif field == 'close_price' and 'close' in bar:
+                lines.append(f"  <b>Close:</b> {bar['close']:.2f}")
+            elif field == 'atr' and 'atr14' in bar:
+                lines.append(f"  <b>ATR14:</b> {bar['atr14']:.2f}")
+            elif field == 'neckline_distance':
+                lines.append("  <b>Neckline Distance:</b> N/A")
+            elif field == 'cooldown_status':
+                lines.append("  <b>Cooldown:</b> N/A")
+            elif field == 'regime':
+                if 'ema50' in bar and 'ema200' in bar:
+                    regime = "Bullish" if bar['ema50'] > bar['ema200'] else "Bearish"
+                    regime_color = "#4CAF50" if regime == "Bullish" else "#F44336"
+                    lines.append(f"  <b>Regime:</b> <span style='color: {regime_color};'>{regime}</span>")
+        
+        # Show OHLC data
+        if 'open' in bar and 'high' in bar and 'low' in bar and 'close' in bar:
+            lines += [
+                f"  <b>Open:</b> {bar['open']:.2f}",
+                f"  <b>High:</b> {bar['high']:.2f}",
+                f"  <b>Low:</b> {bar['low']:.2f}",
+                f"  <b>Close:</b> {bar['close']:.2f}",
+            ]
+        
+        # Show EMAs
+        if 'ema50' in bar and 'ema200' in bar:
+            lines += [
+                f"  <b>EMA50:</b> {bar['ema50']:.2f}",
+                f"  <b>EMA200:</b> {bar['ema200']:.2f}",
+            ]
+        
+        self.context_label.setText("<br>".join(lines))
+        self.context_panel.show()
     
     def clear(self):
         """Clear all data."""
         self.bar_decisions = None
         self.price_data = None
-        self.decisions_table.setRowCount(0)
+        self._price_cols = {}
+        self._index_decisions()
+        self.decisions_model.set_decisions([])
         self.summary_label.setText("No data loaded")
         self.context_panel.hide()
@@ -63,6 +63,9 @@ class MainWindow(QMainWindow):
         self.is_running = False
         self.is_connected = False
         
+        # TP levels computed for display only (positions from state are read-only views)
+        self._display_tp_levels = {}
+        
         # Setup periodic position refresh (every 500ms to ensure UI always shows all positions)
         self._position_refresh_timer = QTimer()
         self._position_refresh_timer.timeout.connect(self._refresh_positions_table)
@@ -1087,6 +1090,13 @@ class MainWindow(QMainWindow):
                     tp1_price = position.get('tp1_price')
                     tp2_price = position.get('tp2_price')
                     tp3_price = position.get('tp3_price')
+                    if tp1_price is None or tp2_price is None or tp3_price is None:
+                        # Fall back to levels computed for display in update_position_display
+                        fallback = self._display_tp_levels.get(position.get('ticket'))
+                        if fallback:
+                            tp1_price = tp1_price if tp1_price is not None else fallback[0]
+                            tp2_price = tp2_price if tp2_price is not None else fallback[1]
+                            tp3_price = tp3_price if tp3_price is not None else fallback[2]
 
                     def fmt_price(val):
                         return "-" if val is None else f"{val:.2f}"
@@ -1602,13 +1612,11 @@ class MainWindow(QMainWindow):
                         if calc:
                             if tp1_price is None:
                                 tp1_price = calc.get('tp1')
-                                position['tp1_price'] = tp1_price
                             if tp2_price is None:
                                 tp2_price = calc.get('tp2')
-                                position['tp2_price'] = tp2_price
                             if tp3_price is None:
                                 tp3_price = calc.get('tp3')
-                                position['tp3_price'] = tp3_price
+                            self._display_tp_levels[ticket] = (tp1_price, tp2_price, tp3_price)
                     except Exception as ex:
                         self.logger.error(f"Error calculating TP levels for display: {ex}")
                 
@@ -1662,6 +1670,11 @@ class MainWindow(QMainWindow):
             
             self.btn_close_position.setEnabled(True)
 
+            # Keep display TP levels only for tickets still shown (closed ones are dropped)
+            shown_tickets = {position.get('ticket', '-') for position in positions}
+            for stale_ticket in self._display_tp_levels.keys() - shown_tickets:
+                del self._display_tp_levels[stale_ticket]
+
             # Auto-select first row and display TP levels so users immediately see TP1/TP2/TP3
             self.table_positions.selectRow(0)
             self._show_tp_levels_for_row(0)
@@ -1671,11 +1684,12 @@ class MainWindow(QMainWindow):
             self.lbl_position_status.setStyleSheet("color: gray;")
             self.table_positions.setRowCount(0)
             self.btn_close_position.setEnabled(False)
+            self._display_tp_levels.clear()
     
     def _refresh_positions_table(self):
         """Refresh the positions table from controller."""
         if hasattr(self, '_controller') and self._controller:
-            positions = self._controller.state_manager.get_all_positions()
+            positions = self._controller.state_manager.get_all_positions_view()
             self.update_position_display(positions)
 
     
@@ -8,12 +8,13 @@ This module handles all configuration settings:
 - UI preferences
 """
 
+import copy
 import json
 import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
@@ -546,6 +547,10 @@ class Config:
         except Exception as e:
             self.logger.error(f"Error saving config: {e}")
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a plain dict copy of the whole configuration."""
+        return copy.deepcopy(self._config)
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
@@ -554,14 +559,26 @@ class Config:
             key: Configuration key (e.g., 'mt5.symbol')
             default: Default value if key not found
             
+        Returns:
+            Configuration value
+        """
+        return self.get_tuple(tuple(key.split('.')), default)
+    
+    def get_tuple(self, path: Tuple[str, ...], default: Any = None) -> Any:
+        """
+        Get configuration value using a pre-split key path.
+        
+        Args:
+            path: Key path (e.g., ('mt5', 'symbol'))
+            default: Default value if key not found
+            
         Returns:
             Configuration value
         """
         try:
-            keys = key.split('.')
             value = self._config
             
-            for k in keys:
+            for k in path:
                 value = value[k]
             
             return value
@@ -577,16 +594,25 @@ class Config:
             key: Configuration key (e.g., 'mt5.symbol')
             value: Value to set
         """
+        self.set_tuple(tuple(key.split('.')), value)
+    
+    def set_tuple(self, path: Tuple[str, ...], value: Any):
+        """
+        Set configuration value using a pre-split key path.
+        
+        Args:
+            path: Key path (e.g., ('mt5', 'symbol'))
+            value: Value to set
+        """
         try:
-            keys = key.split('.')
             config = self._config
             
-            for k in keys[:-1]:
+            for k in path[:-1]:
                 if k not in config:
                     config[k] = {}
                 config = config[k]
             
-            config[keys[-1]] = value
+            config[path[-1]] = value
             
         except Exception as e:
             self.logger.error(f"Error setting config value: {e}")
@@ -0,0 +1,181 @@
+"""
+Unit tests for Backtest Engine trade records and result caching
+"""
+
+import pickle
+from datetime import datetime
+
+import pandas as pd
+
+from src.engines import backtest_engine
+from src.engines.backtest_engine import BacktestEngine, BacktestTrade, ExitReason, TradeDirection
+from src.engines.risk_engine import RiskEngine
+from src.engines.strategy_engine import StrategyEngine
+from src.utils.config import Config
+
+
+def test_backtest_trade_to_dict():
+    """Test to_dict exports enum values, ISO times and a copy of tp_prices."""
+    trade = BacktestTrade(
+        trade_id=1,
+        direction=TradeDirection.LONG,
+        entry_time=datetime(2024, 1, 1, 10, 0),
+        entry_price=2000.0,
+        entry_bar_index=5,
+        exit_time=datetime(2024, 1, 1, 12, 0),
+        exit_price=2010.0,
+        exit_reason=ExitReason.TAKE_PROFIT,
+        tp_prices=[2010.0, 2020.0],
+    )
+
+    data = trade.to_dict()
+    data['tp_prices'].append(2030.0)
+
+    assert data['direction'] == "LONG"
+    assert data['exit_reason'] == "TP"
+    assert data['entry_time'] == "2024-01-01T10:00:00"
+    assert data['exit_time'] == "2024-01-01T12:00:00"
+    assert data['entry_bar_index'] == 5
+    assert trade.tp_prices == [2010.0, 2020.0]
+    assert not hasattr(trade, '__dict__')
+
+
+def test_trades_dataframe_matches_to_dict():
+    """Test the trades DataFrame has the same rows as per-trade to_dict()."""
+    engine = BacktestEngine()
+    engine.trades = [
+        BacktestTrade(
+            trade_id=i,
+            direction=TradeDirection.LONG,
+            entry_time=datetime(2024, 1, 1, i),
+            entry_price=2000.0 + i,
+            entry_bar_index=i,
+            exit_time=datetime(2024, 1, 1, i + 1),
+            exit_price=2010.0,
+            exit_reason=ExitReason.STOP_LOSS if i % 2 else ExitReason.TAKE_PROFIT,
+            tp_prices=[2010.0],
+        )
+        for i in range(3)
+    ]
+
+    df = engine.get_trades_dataframe()
+
+    assert df.to_dict('records') == [t.to_dict() for t in engine.trades]
+
+
+def test_trades_dataframe_keeps_missing_exit_values_empty():
+    """Test an open trade's exit time and reason match the to_dict() frame."""
+    engine = BacktestEngine()
+    engine.trades = [
+        BacktestTrade(
+            trade_id=1,
+            direction=TradeDirection.SHORT,
+            entry_time=datetime(2024, 1, 1, 10),
+            entry_price=2000.0,
+            entry_bar_index=1,
+        )
+    ]
+
+    df = engine.get_trades_dataframe()
+    expected = pd.DataFrame([t.to_dict() for t in engine.trades])
+
+    assert df.loc[0, 'exit_time'] != 'NaT'
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_result_cache_key_tracks_data_and_settings():
+    """Test the cache key changes with the loaded bars and engine settings."""
+    engine = BacktestEngine()
+    assert engine.result_cache_key() is None
+
+    engine.df = pd.DataFrame({'time': pd.date_range('2024-01-01', periods=3, freq='h'), 'close': [1.0, 2.0, 3.0]})
+    key = engine.result_cache_key()
+    assert key == engine.result_cache_key()
+
+    engine.spread_points = 2.0
+    assert engine.result_cache_key() != key
+
+
+def test_result_cache_key_tracks_config_and_engine_parameters(tmp_path):
+    """Test the cache key follows config values and engine parameters, not object identity."""
+    def engine_with(config):
+        engine = BacktestEngine(config=config)
+        engine.df = pd.DataFrame({'close': [1.0, 2.0, 3.0]})
+        return engine
+
+    config_file = tmp_path / 'config.yaml'
+    config = Config(str(config_file))
+    risk_engine = RiskEngine(risk_percent=1.0)
+    key = engine_with(config).result_cache_key([risk_engine])
+
+    # Same settings in a fresh Config instance give the same key
+    assert engine_with(Config(str(config_file))).result_cache_key([RiskEngine(risk_percent=1.0)]) == key
+
+    original_risk = config.get('risk.risk_percent')
+    config.set('risk.risk_percent', original_risk + 1.5)
+    assert engine_with(config).result_cache_key([risk_engine]) != key
+
+    config.set('risk.risk_percent', original_risk)
+    assert engine_with(config).result_cache_key([risk_engine]) == key
+    risk_engine.risk_percent = 2.5
+    assert engine_with(config).result_cache_key([risk_engine]) != key
+
+
+def test_result_cache_key_tracks_nested_engines_and_code(monkeypatch):
+    """Test sub-engine parameters and engine source changes alter the cache key."""
+    engine = BacktestEngine()
+    engine.df = pd.DataFrame({'close': [1.0, 2.0, 3.0]})
+    strategy = StrategyEngine()
+    key = engine.result_cache_key([strategy])
+
+    strategy.multi_level_tp.default_rr_long += 0.5
+    assert engine.result_cache_key([strategy]) != key
+
+    strategy.multi_level_tp.default_rr_long -= 0.5
+    assert engine.result_cache_key([strategy]) == key
+
+    monkeypatch.setattr(backtest_engine, '_source_digest', lambda path: 'edited')
+    assert engine.result_cache_key([strategy]) != key
+
+
+def test_result_state_round_trip():
+    """Test a pickled result state restores trades, equity and metrics."""
+    engine = BacktestEngine()
+    engine.trades = [
+        BacktestTrade(
+            trade_id=1,
+            direction=TradeDirection.SHORT,
+            entry_time=datetime(2024, 1, 1, 10),
+            entry_price=2000.0,
+            entry_bar_index=1,
+            exit_reason=ExitReason.STOP_LOSS,
+        )
+    ]
+    engine.equity_curve = [(datetime(2024, 1, 1, 10), 10000.0)]
+    engine.metrics = {'total_trades': 1}
+
+    restored = BacktestEngine()
+    restored.restore_result_state(pickle.loads(pickle.dumps(engine.get_result_state())))
+
+    assert restored.get_trades_dataframe().to_dict('records') == engine.get_trades_dataframe().to_dict('records')
+    assert restored.equity_curve == engine.equity_curve
+    assert restored.metrics == {'total_trades': 1}
+
+
+def test_trades_dataframe_is_cached_until_a_trade_is_added():
+    """Test get_trades_dataframe reuses its frame until trades change."""
+    engine = BacktestEngine()
+    trade = BacktestTrade(
+        trade_id=1,
+        direction=TradeDirection.LONG,
+        entry_time=datetime(2024, 1, 1, 10),
+        entry_price=2000.0,
+        entry_bar_index=1,
+    )
+    engine.trades.append(trade)
+
+    first = engine.get_trades_dataframe()
+    assert engine.get_trades_dataframe() is first
+
+    engine.trades.append(trade)
+    assert len(engine.get_trades_dataframe()) == 2
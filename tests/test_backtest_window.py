@@ -0,0 +1,39 @@
+"""
+Unit tests for BacktestWindow equity curve sampling
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.ui.backtest_window import _equity_sample_indices, _equity_sample_step
+
+
+def test_short_equity_curve_is_drawn_in_full():
+    """Test curves up to 4x the view width are not thinned."""
+    assert _equity_sample_step(2000, 500) == 1
+    assert _equity_sample_step(1999, 100) == 1  # Width below the 500-point floor
+
+    idx = _equity_sample_indices(5, 1)
+
+    np.testing.assert_array_equal(idx, np.arange(5))
+
+
+def test_long_equity_curve_is_thinned_to_view_width():
+    """Test long curves get about one point per pixel, keeping the endpoints."""
+    step = _equity_sample_step(10000, 800)
+
+    idx = _equity_sample_indices(10000, step)
+
+    assert step == 12
+    assert idx[0] == 0
+    assert idx[-1] == 9999
+    assert np.all(np.diff(idx[:-1]) == step)
+    assert len(idx) == 835
+
+
+def test_sample_indices_handle_empty_and_exact_stride():
+    """Test no points give no indices and the last point is not duplicated."""
+    assert len(_equity_sample_indices(0, 3)) == 0
+    np.testing.assert_array_equal(_equity_sample_indices(7, 3), [0, 3, 6])
@@ -71,6 +71,16 @@ def test_calculate_all_indicators(sample_data):
     assert not df['ema50'].iloc[-1:].isna().any()
     assert not df['ema200'].iloc[-1:].isna().any()
     assert not df['atr14'].iloc[-1:].isna().any()
+    assert 'stop_default_long' not in df.columns
+
+
+def test_calculate_all_indicators_adds_default_stop(sample_data):
+    """Test the ATR stop column is added when a multiplier is configured."""
+    engine = IndicatorEngine(atr_multiplier_stop=2.0)
+    df = engine.calculate_all_indicators(sample_data)
+    
+    expected = df['close'] - df['atr14'] * 2.0
+    pd.testing.assert_series_equal(df['stop_default_long'], expected, check_names=False)
 
 
 def test_get_current_indicators(sample_data):
@@ -0,0 +1,343 @@
+"""
+Unit tests for StateDatabase persistence
+"""
+
+import asyncio
+import logging
+import sqlite3
+from datetime import datetime
+
+import pytest
+from src.storage import state_database
+from src.storage.state_database import StateDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh SQLite-backed StateDatabase in a temp directory."""
+    store = StateDatabase(f"sqlite:///{tmp_path / 'state.db'}", logging.getLogger("test_state_db"))
+    yield store
+    store.close()
+
+
+def _position(ticket, entry_price=2000.0):
+    return {
+        'ticket': ticket,
+        'entry_price': entry_price,
+        'stop_loss': entry_price - 10.0,
+        'take_profit': entry_price + 20.0,
+        'volume': 0.1,
+        'entry_time': '2024-01-01T10:00:00',
+        'direction': 1,
+        'pattern_info': {'neckline': entry_price + 5.0},
+    }
+
+
+def _trade(ticket, net_pl=10.0):
+    return {
+        'ticket': ticket,
+        'entry_time': '2024-01-01T10:00:00',
+        'exit_time': '2024-01-01T12:00:00',
+        'entry_price': 2000.0,
+        'exit_price': 2000.0 + net_pl,
+        'stop_loss': 1990.0,
+        'take_profit': 2020.0,
+        'volume': 0.1,
+        'profit': net_pl,
+        'gross_pl': net_pl,
+        'net_pl': net_pl,
+        'exit_reason': 'TP1',
+        'is_winner': net_pl > 0,
+    }
+
+
+def _state(positions, trades):
+    return {
+        'open_positions': positions,
+        'trade_history': trades,
+        'last_trade_time': None,
+        'total_trades': len(trades),
+        'winning_trades': len(trades),
+        'losing_trades': 0,
+        'total_profit': 0.0,
+        'last_regime_state': None,
+    }
+
+
+def test_save_and_load_round_trip(db):
+    """Test saved positions and trades are restored from tables."""
+    db.save_state(_state([_position(1)], [_trade(100)]))
+
+    loaded = db.load_latest_snapshot()
+
+    assert [p['ticket'] for p in loaded['open_positions']] == [1]
+    assert loaded['open_positions'][0]['pattern_info'] == {'neckline': 2005.0}
+    assert [t['ticket'] for t in loaded['trade_history']] == [100]
+
+
+def test_save_removes_closed_positions_and_updates_open_ones(db):
+    """Test closed tickets are deleted and remaining positions are upserted."""
+    db.save_state(_state([_position(1), _position(2)], []))
+    db.save_state(_state([_position(2, entry_price=2100.0)], []))
+
+    loaded = db.load_latest_snapshot()
+
+    assert [p['ticket'] for p in loaded['open_positions']] == [2]
+    assert loaded['open_positions'][0]['entry_price'] == 2100.0
+
+
+def test_save_appends_only_new_trades(db):
+    """Test repeated saves do not duplicate trade history rows."""
+    trades = [_trade(100)]
+    db.save_state(_state([], trades))
+    trades.append(_trade(101, net_pl=-5.0))
+    db.save_state(_state([], trades))
+    db.save_state(_state([], trades))
+
+    loaded = db.load_latest_snapshot()
+
+    assert [t['ticket'] for t in loaded['trade_history']] == [100, 101]
+
+
+def test_save_rewrites_trades_after_history_reset(db):
+    """Test a shorter trade history replaces the persisted rows."""
+    db.save_state(_state([], [_trade(100), _trade(101)]))
+    db.save_state(_state([], [_trade(200)]))
+
+    loaded = db.load_latest_snapshot()
+
+    assert [t['ticket'] for t in loaded['trade_history']] == [200]
+
+
+def test_has_data(db):
+    """Test has_data reflects whether anything was persisted."""
+    assert db.has_data() is False
+    db.save_state(_state([], []))
+    assert db.has_data() is True
+
+
+def test_snapshots_are_pruned_to_limit(tmp_path):
+    """Test the snapshot table is kept to max_snapshots rows."""
+    store = StateDatabase(
+        f"sqlite:///{tmp_path / 'state.db'}",
+        logging.getLogger("test_state_db"),
+        snapshot_interval_seconds=0.0,
+        max_snapshots=3,
+    )
+    try:
+        for _ in range(6):
+            store.save_state(_state([], []))
+            store.flush()
+        count = store.connection.execute("SELECT COUNT(*) FROM state_snapshots_ring").fetchone()[0]
+        assert count == 3
+    finally:
+        store.close()
+
+
+def test_shrinking_max_snapshots_keeps_newest(tmp_path):
+    """Test reopening with a smaller max_snapshots keeps the newest rows."""
+    url = f"sqlite:///{tmp_path / 'state.db'}"
+    logger = logging.getLogger("test_state_db")
+    store = StateDatabase(url, logger, snapshot_interval_seconds=0.0, max_snapshots=10)
+    for _ in range(7):
+        store.save_state(_state([], []))
+        store.flush()
+    store.close()
+
+    store = StateDatabase(url, logger, snapshot_interval_seconds=0.0, max_snapshots=3)
+    try:
+        rows = store.connection.execute(
+            "SELECT slot, seq FROM state_snapshots_ring ORDER BY seq"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [(2, 5), (0, 6), (1, 7)]
+
+        # The next snapshot overwrites the oldest survivor
+        store.save_state(_state([], []))
+        store.flush()
+        seqs = [row[0] for row in store.connection.execute(
+            "SELECT seq FROM state_snapshots_ring ORDER BY seq"
+        )]
+        assert seqs == [6, 7, 8]
+    finally:
+        store.close()
+
+
+def test_flush_waits_for_queued_saves(db):
+    """Test flush() makes queued saves visible on the connection."""
+    for ticket in range(1, 6):
+        db.save_state(_state([_position(ticket)], []))
+    db.flush()
+
+    tickets = [row[0] for row in db.connection.execute("SELECT ticket FROM positions")]
+
+    assert tickets == [5]
+
+
+def test_compact_snapshot_rebuilds_state_from_tables(db):
+    """Test a metadata-only snapshot is expanded with positions and trades."""
+    db.save_state(_state([_position(1)], [_trade(100), _trade(101)]))
+    db.flush()
+    db.connection.execute("DELETE FROM trading_state")
+
+    loaded = db.load_latest_snapshot()
+
+    assert loaded['total_trades'] == 2
+    assert [p['ticket'] for p in loaded['open_positions']] == [1]
+    assert [t['ticket'] for t in loaded['trade_history']] == [100, 101]
+
+
+def test_connection_pragmas_are_configurable(tmp_path):
+    """Test PRAGMA settings passed to the constructor are applied."""
+    store = StateDatabase(
+        f"sqlite:///{tmp_path / 'state.db'}",
+        logging.getLogger("test_state_db"),
+        cache_size_kb=2000,
+        wal_autocheckpoint=500,
+    )
+    try:
+        assert store.connection.execute("PRAGMA cache_size").fetchone()[0] == -2000
+        assert store.connection.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 500
+    finally:
+        store.close()
+
+
+def test_iter_trades_streams_history_in_order(db):
+    """Test iter_trades yields the same trades as a full load."""
+    db.save_state(_state([], [_trade(ticket) for ticket in range(100, 105)]))
+
+    assert [t['ticket'] for t in db.iter_trades()] == [100, 101, 102, 103, 104]
+
+
+def test_queued_update_is_applied_after_earlier_save(db):
+    """Test a queued position update lands on top of a preceding save."""
+    db.save_state(_state([_position(1)], []))
+    db.update_position(1, {'current_stop_loss': 1995.0, 'tp1_reached': True})
+    db.flush()
+
+    position = db.get_position_by_ticket(1)
+
+    assert position['current_stop_loss'] == 1995.0
+    assert position['tp1_reached'] is True
+
+
+def test_update_position_flush_reports_missing_ticket(db):
+    """Test a synchronous update returns False for an unknown ticket."""
+    assert db.update_position(99, {'current_stop_loss': 1.0}, flush=True) is False
+
+
+def test_pattern_neckline_is_queryable_without_decoding(db):
+    """Test the generated pattern_neckline column reads from pattern_info JSON."""
+    position = _position(1)
+    position['pattern_info'] = {'neckline': {'index': 5, 'price': 2012.5}}
+    db.save_state(_state([position], []))
+    db.flush()
+
+    row = db.connection.execute("SELECT pattern_neckline FROM positions WHERE ticket = 1").fetchone()
+
+    assert row[0] == 2012.5
+
+
+def test_nan_in_pattern_info_saves_with_json_fallback(db, monkeypatch):
+    """Test NaN in pattern_info is stored as null without orjson."""
+    monkeypatch.setattr(state_database, "HAS_ORJSON", False)
+    position = _position(1)
+    position['pattern_info'] = {'neckline': {'price': 2012.5}, 'quality': float('nan')}
+    db.save_state(_state([position], [dict(_trade(1), pattern_info=position['pattern_info'])]))
+    db.flush()
+
+    loaded = db.load_latest_snapshot()
+    row = db.connection.execute("SELECT pattern_neckline FROM positions WHERE ticket = 1").fetchone()
+
+    assert row[0] == 2012.5
+    assert loaded['open_positions'][0]['pattern_info']['quality'] is None
+    assert loaded['trade_history'][0]['pattern_info']['quality'] is None
+
+
+def test_malformed_pattern_info_does_not_break_reads(db):
+    """Test legacy NaN-token pattern_info rows yield a NULL neckline."""
+    position = _position(1)
+    position['pattern_info'] = '{"neckline": {"price": NaN}}'
+    db.save_state(_state([position], []))
+    db.flush()
+
+    row = db.connection.execute("SELECT pattern_neckline FROM positions WHERE ticket = 1").fetchone()
+
+    assert row[0] is None
+
+
+def test_snapshot_written_every_n_saves(tmp_path):
+    """Test snapshot_every_n_saves skips snapshots on intermediate saves."""
+    store = StateDatabase(
+        f"sqlite:///{tmp_path / 'state.db'}",
+        logging.getLogger("test_state_db"),
+        snapshot_interval_seconds=0.0,
+        snapshot_every_n_saves=3,
+    )
+    try:
+        for _ in range(7):
+            store.save_state(_state([], []))
+            store.flush()
+        count = store.connection.execute("SELECT COUNT(*) FROM state_snapshots_ring").fetchone()[0]
+        assert count == 2
+    finally:
+        store.close()
+
+
+def test_async_wrappers_round_trip(db):
+    """Test the asyncio wrappers save and load through worker threads."""
+    async def scenario():
+        await db.save_state_async(_state([_position(1)], []))
+        await db.flush_async()
+        return await db.load_latest_snapshot_async()
+
+    loaded = asyncio.run(scenario())
+
+    assert [p['ticket'] for p in loaded['open_positions']] == [1]
+
+
+def test_update_position_prices(db):
+    """Test the price fast path updates price_current and profit."""
+    db.save_state(_state([_position(1)], []))
+    db.update_position_prices(1, 2003.5, 35.0)
+    db.flush()
+
+    position = db.get_position_by_ticket(1)
+
+    assert position['price_current'] == 2003.5
+    assert position['profit'] == 35.0
+
+
+def test_compressed_snapshot_is_readable(db):
+    """Test snapshots are stored compressed and decoded on load."""
+    db.save_state(_state([_position(1)], [_trade(100)]))
+    db.flush()
+    db.connection.execute("DELETE FROM trading_state")
+
+    data = db.connection.execute("SELECT data FROM state_snapshots_ring").fetchone()[0]
+    loaded = db.load_latest_snapshot()
+
+    assert isinstance(data, bytes)
+    assert loaded['total_trades'] == 1
+
+
+def test_update_position_stores_datetime_as_iso_text(db):
+    """Test datetime update values are written as ISO strings."""
+    db.save_state(_state([_position(1)], []))
+    db.update_position(1, {'tp1_reached_timestamp': datetime(2024, 1, 2, 3, 4, 5)}, flush=True)
+
+    position = db.get_position_by_ticket(1)
+
+    assert position['tp1_reached_timestamp'] == '2024-01-02T03:04:05'
+
+
+def test_background_write_error_is_reported(db, monkeypatch):
+    """Test a failed background write is raised by the next flush()."""
+    def fail(*args, **kwargs):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(db, "_write_state_rows", fail)
+    db.save_state(_state([_position(1)], []))
+
+    with pytest.raises(sqlite3.OperationalError):
+        db.flush()
+    db.flush()  # Reported once